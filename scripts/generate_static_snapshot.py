@@ -2,12 +2,17 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import json
 import math
+import os
 import re
 import sys
+import time
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from html import unescape
@@ -18,128 +23,32 @@ from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 import xml.etree.ElementTree as ET
 
-NEWS_RSS_URL = "https://finance.yahoo.com/news/rssindex"
-REDDIT_RSS_URL = "https://www.reddit.com/r/wallstreetbets/.rss"
-MAX_ITEMS = 120
-
-POSITIVE_WEIGHTS = {
-    "beat": 1.4,
-    "bull": 1.2,
-    "bullish": 1.35,
-    "buy": 1.0,
-    "breakout": 1.25,
-    "gain": 1.15,
-    "growth": 1.1,
-    "green": 0.8,
-    "momentum": 0.95,
-    "optimistic": 1.2,
-    "outperform": 1.4,
-    "profit": 1.3,
-    "rally": 1.4,
-    "record": 1.0,
-    "rebound": 1.1,
-    "recover": 1.0,
-    "surge": 1.5,
-    "upgrade": 1.25,
-    "upside": 1.2,
-    "win": 1.0,
-}
-
-NEGATIVE_WEIGHTS = {
-    "bankrupt": 1.7,
-    "bear": 1.2,
-    "bearish": 1.35,
-    "crash": 1.65,
-    "cut": 0.8,
-    "decline": 1.15,
-    "downgrade": 1.35,
-    "drop": 1.1,
-    "fear": 1.0,
-    "loss": 1.25,
-    "miss": 1.2,
-    "missed": 1.2,
-    "plunge": 1.65,
-    "risk": 0.9,
-    "sell": 1.15,
-    "slump": 1.35,
-    "volatile": 0.9,
-    "warning": 0.95,
-    "weak": 0.95,
-}
-
-INTENSIFIERS = {"very", "extremely", "strong", "massive", "huge", "major", "sharp"}
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "stock-sentiment-backend"))
+from app.ids import ID_HASH, stable_hash
+from app.lexicon import LEXICON_PATH, LexiconChange, LexiconSource, diff_lexicons
 
-THEME_KEYWORDS = {
-    "AI": ["ai", "artificial intelligence", "chip", "semiconductor", "model", "gpu"],
-    "Earnings": ["earnings", "eps", "revenue", "guidance", "quarter", "forecast"],
-    "Rates": ["fed", "rates", "interest", "inflation", "cpi", "bond"],
-    "M&A": ["acquire", "acquisition", "merger", "deal", "buyout"],
-    "Crypto": ["bitcoin", "ethereum", "crypto", "token", "blockchain"],
-    "EV": ["electric vehicle", "ev", "battery", "charging", "tesla"],
-    "Labor": ["strike", "layoff", "hiring", "workforce", "union"],
-}
+try:
+    import brotli
+except ImportError:  # Optional: without it only the .gz sibling is written.
+    brotli = None
 
-COMPANY_TO_TICKER = {
-    "apple": "AAPL",
-    "amazon": "AMZN",
-    "alphabet": "GOOGL",
-    "google": "GOOGL",
-    "microsoft": "MSFT",
-    "meta": "META",
-    "nvidia": "NVDA",
-    "tesla": "TSLA",
-    "netflix": "NFLX",
-    "palantir": "PLTR",
-    "coinbase": "COIN",
-    "amd": "AMD",
-    "intel": "INTC",
-}
-
-TICKER_NOISE = {
-    "A",
-    "AI",
-    "AM",
-    "AN",
-    "ARE",
-    "AS",
-    "AT",
-    "CEO",
-    "CFO",
-    "CPI",
-    "DO",
-    "EV",
-    "FED",
-    "FOR",
-    "GDP",
-    "HAS",
-    "HOW",
-    "IPO",
-    "IS",
-    "IT",
-    "LOW",
-    "NEW",
-    "NO",
-    "NOW",
-    "ON",
-    "OR",
-    "OUT",
-    "PM",
-    "RSI",
-    "SO",
-    "THE",
-    "TO",
-    "TOP",
-    "USA",
-    "USD",
-    "WSB",
-    "YOLO",
-}
+NEWS_RSS_URL = os.environ.get("SSD_NEWS_RSS_URL", "https://finance.yahoo.com/news/rssindex")
+REDDIT_RSS_URL = os.environ.get("SSD_REDDIT_RSS_URL", "https://www.reddit.com/r/wallstreetbets/.rss")
+MAX_ITEMS = 120
+MAX_ITEM_AGE_HOURS = 24
+MAX_FETCH_WORKERS = 8
+FEED_SHARD_SIZE = 40
+TICKER_SHARD_ITEMS = 40
+MANIFEST_NAME = "manifest.json"
+SHARD_DIRECTORY = "shards"
 
 RSS_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 }
 
+lexicon_source = LexiconSource(Path(os.environ.get("SSD_LEXICON_PATH") or LEXICON_PATH))
+
 
 @dataclass(slots=True)
 class RawFeedItem:
@@ -167,13 +76,82 @@ class EnrichedFeedItem:
     themes: list[str]
 
 
-def fetch_url(url: str) -> str:
-    request = Request(url, headers=RSS_HEADERS)
+@dataclass(slots=True)
+class FeedSource:
+    kind: str
+    url: str
+
+
+@dataclass(slots=True)
+class FeedResult:
+    feed: FeedSource
+    body: str
+    not_modified: bool = False
+    validators: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class SnapshotState:
+    """Enriched items by id plus per-URL ETag/Last-Modified, carried between runs (or held by --watch)."""
+
+    items: dict[str, EnrichedFeedItem] = field(default_factory=dict)
+    validators: dict[str, dict[str, str]] = field(default_factory=dict)
+    lexicon_version: str = ""
+    lexicon_digest: str = ""
+
+
+def fetch_url(url: str, validators: dict[str, str] | None = None) -> FeedResult:
+    headers = dict(RSS_HEADERS)
+    if validators and validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators and validators.get("lastModified"):
+        headers["If-Modified-Since"] = validators["lastModified"]
+
+    feed = FeedSource(kind="", url=url)
+    request = Request(url, headers=headers)
     try:
         with urlopen(request, timeout=15) as response:
-            return response.read().decode("utf-8", errors="replace")
-    except (HTTPError, URLError, TimeoutError):
-        return ""
+            body = response.read().decode("utf-8", errors="replace")
+            fresh = {
+                key: value
+                for key, value in (
+                    ("etag", response.headers.get("ETag")),
+                    ("lastModified", response.headers.get("Last-Modified")),
+                )
+                if value
+            }
+            return FeedResult(feed=feed, body=body, validators=fresh)
+    except HTTPError as error:
+        if error.code == 304:
+            return FeedResult(feed=feed, body="", not_modified=True, validators=dict(validators or {}))
+        return FeedResult(feed=feed, body="")
+    except (URLError, TimeoutError):
+        return FeedResult(feed=feed, body="")
+
+
+def fetch_feeds(
+    feeds: list[FeedSource],
+    validators: dict[str, dict[str, str]] | None = None,
+    workers: int = MAX_FETCH_WORKERS,
+) -> list[FeedResult]:
+    """Fetch every feed concurrently; results keep the order of `feeds`."""
+    validators = validators or {}
+    if not feeds:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(feeds)))) as pool:
+        results = list(pool.map(lambda feed: fetch_url(feed.url, validators.get(feed.url)), feeds))
+    for feed, result in zip(feeds, results):
+        result.feed = feed
+    return results
+
+
+def parse_feed_spec(value: str) -> FeedSource:
+    """`news=https://...` or `reddit=https://...`; the kind selects the parser and the item source."""
+    kind, _, url = value.partition("=")
+    kind = kind.strip().lower()
+    if kind not in FEED_PARSERS or not url.strip():
+        raise argparse.ArgumentTypeError(f"Expected KIND=URL with KIND one of {', '.join(FEED_PARSERS)}.")
+    return FeedSource(kind=kind, url=url.strip())
 
 
 def parse_news_feed(xml: str) -> list[RawFeedItem]:
@@ -252,6 +230,10 @@ def parse_reddit_feed(xml: str) -> list[RawFeedItem]:
     return rows
 
 
+FEED_PARSERS = {"news": parse_news_feed, "reddit": parse_reddit_feed}
+DEFAULT_FEEDS = [FeedSource(kind="news", url=NEWS_RSS_URL), FeedSource(kind="reddit", url=REDDIT_RSS_URL)]
+
+
 def fallback_items() -> list[RawFeedItem]:
     now = utc_now()
     seed = [
@@ -336,66 +318,38 @@ def enrich_item(item: RawFeedItem) -> EnrichedFeedItem:
 
 
 def analyze_sentiment(text: str) -> tuple[str, float, float]:
-    tokens = re.findall(r"[a-z][a-z\-']*", text.lower())
-    if not tokens:
-        return "neutral", 0.0, 0.2
-
-    score = 0.0
-    intensity = 1.0
-    for token in tokens:
-        if token in INTENSIFIERS:
-            intensity = 1.35
-            continue
-
-        delta = 0.0
-        if token in POSITIVE_WEIGHTS:
-            delta = POSITIVE_WEIGHTS[token]
-        elif token in NEGATIVE_WEIGHTS:
-            delta = -NEGATIVE_WEIGHTS[token]
-
-        if delta:
-            score += delta * intensity
-        intensity = 1.0
-
-    base = max(2.4, math.sqrt(len(tokens) + 1.0))
-    normalized = max(-1.0, min(1.0, score / base))
-
-    if normalized >= 0.18:
-        label = "positive"
-    elif normalized <= -0.18:
-        label = "negative"
-    else:
-        label = "neutral"
-
-    confidence = min(0.99, abs(normalized) * 1.45 + min(0.3, len(tokens) / 110.0))
-    return label, round(normalized, 4), round(confidence, 4)
+    return lexicon_source.current.analyze(text)
 
 
 def extract_tickers(text: str) -> list[str]:
-    found: set[str] = set()
-    for match in re.findall(r"\$?[A-Z]{1,5}\b", text):
-        token = match.lstrip("$").strip().upper()
-        if token in TICKER_NOISE:
-            continue
-        if len(token) == 1 and token not in {"C", "F", "T"}:
-            continue
-        found.add(token)
+    return lexicon_source.current.tickers(text)
 
-    lowered = text.lower()
-    for company_name, ticker in COMPANY_TO_TICKER.items():
-        if company_name in lowered:
-            found.add(ticker)
 
-    return sorted(found)[:10]
+def extract_themes(text: str) -> list[str]:
+    return lexicon_source.current.match_themes(text)
 
 
-def extract_themes(text: str) -> list[str]:
-    lowered = text.lower()
-    themes = []
-    for theme, keywords in THEME_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
-            themes.append(theme)
-    return themes
+def rescore_state(state: SnapshotState, change: LexiconChange | None = None) -> int:
+    """Re-enrich retained items after a lexicon swap: only those `change` affects, or all when it is unknown."""
+    rescored = 0
+    for item_id, item in state.items.items():
+        if change is not None and not change.affects(item.title, item.text):
+            continue
+        label, score, confidence = analyze_sentiment(item.text)
+        updated = replace(
+            item,
+            sentiment_label=label,
+            sentiment_score=score,
+            sentiment_confidence=confidence,
+            tickers=extract_tickers(f"{item.title} {item.text}"),
+            themes=extract_themes(item.text),
+        )
+        if updated != item:
+            state.items[item_id] = updated
+            rescored += 1
+    state.lexicon_version = lexicon_source.current.version
+    state.lexicon_digest = lexicon_source.current.digest
+    return rescored
 
 
 def summarize_text(text: str, max_length: int = 180) -> str:
@@ -703,29 +657,187 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def stable_hash(value: str) -> str:
-    cleaned = value.encode("utf-8", errors="ignore")
-    acc = 2166136261
-    for byte in cleaned:
-        acc ^= byte
-        acc *= 16777619
-        acc &= 0xFFFFFFFF
-    return f"{acc:08x}"
+def encode_feed(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Columnar form of serialized feed rows: one array per field, with sources, labels, tickers and themes
+    dictionary-encoded, timestamps as epoch seconds and `summary` omitted (null) when it equals `text`."""
+    dictionaries: dict[str, dict[str, int]] = {"source": {}, "label": {}, "tickers": {}, "themes": {}}
 
+    def code(kind: str, value: str) -> int:
+        table = dictionaries[kind]
+        return table.setdefault(value, len(table))
 
-def build_snapshot() -> dict[str, Any]:
-    news_xml = fetch_url(NEWS_RSS_URL)
-    reddit_xml = fetch_url(REDDIT_RSS_URL)
+    columns: dict[str, list[Any]] = {
+        name: []
+        for name in (
+            "id", "source", "title", "url", "publishedAt", "text", "summary", "label", "score", "confidence",
+            "tickers", "themes",
+        )
+    }
+    for row in rows:
+        sentiment = row.get("sentiment") or {}
+        columns["id"].append(row["id"])
+        columns["source"].append(code("source", row["source"]))
+        columns["title"].append(row["title"])
+        columns["url"].append(row["url"])
+        columns["publishedAt"].append(int(parse_datetime(row["publishedAt"]).timestamp()))
+        columns["text"].append(row["text"])
+        columns["summary"].append(None if row["summary"] == row["text"] else row["summary"])
+        columns["label"].append(code("label", sentiment.get("label", "neutral")))
+        columns["score"].append(sentiment.get("score", 0.0))
+        columns["confidence"].append(sentiment.get("confidence", 0.0))
+        columns["tickers"].append([code("tickers", ticker) for ticker in row["tickers"]])
+        columns["themes"].append([code("themes", theme) for theme in row["themes"]])
+
+    return {
+        "encoding": "columnar",
+        "count": len(rows),
+        "dictionaries": {kind: list(table) for kind, table in dictionaries.items()},
+        "columns": columns,
+    }
+
+
+def decode_feed(feed: list[dict[str, Any]] | dict[str, Any]) -> list[dict[str, Any]]:
+    """Serialized feed rows from either the plain row list or the `encode_feed` columnar form."""
+    if isinstance(feed, list):
+        return feed
+    columns = feed["columns"]
+    dictionaries = feed["dictionaries"]
+    rows = []
+    for index in range(feed["count"]):
+        text = columns["text"][index]
+        summary = columns["summary"][index]
+        rows.append(
+            {
+                "id": columns["id"][index],
+                "source": dictionaries["source"][columns["source"][index]],
+                "title": columns["title"][index],
+                "url": columns["url"][index],
+                "publishedAt": datetime.fromtimestamp(columns["publishedAt"][index], tz=timezone.utc).isoformat(),
+                "text": text,
+                "summary": text if summary is None else summary,
+                "sentiment": {
+                    "label": dictionaries["label"][columns["label"][index]],
+                    "score": columns["score"][index],
+                    "confidence": columns["confidence"][index],
+                },
+                "tickers": [dictionaries["tickers"][code] for code in columns["tickers"][index]],
+                "themes": [dictionaries["themes"][code] for code in columns["themes"][index]],
+            }
+        )
+    return rows
 
-    raw_items = parse_news_feed(news_xml) + parse_reddit_feed(reddit_xml)
-    if not raw_items:
-        raw_items = fallback_items()
 
-    enriched_items = [enrich_item(item) for item in raw_items]
-    enriched_items.sort(key=lambda row: row.published_at, reverse=True)
-    enriched_items = enriched_items[:MAX_ITEMS]
+def deserialize_item(row: dict[str, Any]) -> EnrichedFeedItem:
+    sentiment = row.get("sentiment") or {}
+    return EnrichedFeedItem(
+        id=str(row["id"]),
+        source=str(row.get("source", "news")),
+        title=str(row.get("title", "")),
+        url=str(row.get("url", "")),
+        published_at=parse_datetime(str(row.get("publishedAt", ""))),
+        text=str(row.get("text", "")),
+        summary=str(row.get("summary", "")),
+        sentiment_label=str(sentiment.get("label", "neutral")),
+        sentiment_score=round(float(sentiment.get("score", 0.0)) / 100, 4),
+        sentiment_confidence=round(float(sentiment.get("confidence", 0.0)) / 100, 4),
+        tickers=list(row.get("tickers") or []),
+        themes=list(row.get("themes") or []),
+    )
 
+
+def load_state(path: Path) -> SnapshotState:
+    """Read a state file (`items` + `validators`) or a previous snapshot (`feed`); fallback items are dropped.
+
+    State written with another id scheme is discarded whole: its ids would never match a fresh fetch, and its
+    validators would turn the refetch into a 304 with nothing to rebuild from.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return SnapshotState()
+    if (payload.get("idHash") or (payload.get("meta") or {}).get("idHash")) != ID_HASH:
+        return SnapshotState()
+
+    rows = decode_feed(payload.get("items", payload.get("feed", [])))
+    state = SnapshotState(
+        validators=dict(payload.get("validators") or {}),
+        lexicon_version=str(payload.get("lexiconVersion") or (payload.get("meta") or {}).get("lexiconVersion") or ""),
+        lexicon_digest=str(payload.get("lexiconDigest") or (payload.get("meta") or {}).get("lexiconDigest") or ""),
+    )
+    for row in rows:
+        try:
+            item = deserialize_item(row)
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not item.id.startswith("fallback-"):
+            state.items[item.id] = item
+    return state
+
+
+def save_state(state: SnapshotState, path: Path) -> None:
+    payload = {
+        "items": [serialize_item(item) for item in state.items.values()],
+        "validators": state.validators,
+        "lexiconVersion": state.lexicon_version,
+        "lexiconDigest": state.lexicon_digest,
+        "idHash": ID_HASH,
+    }
+    write_json(path, payload, indent=None)
+
+
+def update_state(
+    state: SnapshotState,
+    results: list[FeedResult],
+    now: datetime,
+    max_age: timedelta | None = None,
+) -> int:
+    """Enrich only items whose id (title/link hash) is new, then drop stale items and cap to MAX_ITEMS.
+
+    Items older than `max_age` are dropped when it is given; otherwise only the cap applies.
+    Returns how many newly enriched items made it into the capped set.
+    """
+    previous = set(state.items)
+    cutoff = now - max_age if max_age is not None else None
+    for result in results:
+        if result.validators:
+            state.validators[result.feed.url] = result.validators
+        if not result.body:
+            continue
+        for raw in FEED_PARSERS[result.feed.kind](result.body):
+            if raw.id not in state.items and (cutoff is None or raw.published_at >= cutoff):
+                state.items[raw.id] = enrich_item(raw)
+
+    retained = sorted(
+        (item for item in state.items.values() if cutoff is None or item.published_at >= cutoff),
+        key=lambda row: row.published_at,
+        reverse=True,
+    )[:MAX_ITEMS]
+    state.items = {item.id: item for item in retained}
+    return sum(1 for item_id in state.items if item_id not in previous)
+
+
+def build_snapshot(
+    feeds: list[FeedSource] | None = None,
+    state: SnapshotState | None = None,
+    workers: int = MAX_FETCH_WORKERS,
+    max_age: timedelta | None = None,
+) -> dict[str, Any]:
+    feeds = DEFAULT_FEEDS if feeds is None else feeds
+    state = SnapshotState() if state is None else state
+    previous = set(state.items)
+
+    results = fetch_feeds(feeds, state.validators, workers)
     generated_at = utc_now()
+    # Items carried over from a run scored with other lexicon content are re-scored before reuse; the digest
+    # catches edits that kept the version string.
+    rescored = rescore_state(state) if state.lexicon_digest != lexicon_source.current.digest else 0
+    added = update_state(state, results, generated_at, max_age)
+
+    enriched_items = list(state.items.values())
+    live = bool(enriched_items)
+    if not live:
+        enriched_items = [enrich_item(item) for item in fallback_items()]
+
     dashboard = build_dashboard_payload(enriched_items, generated_at)
 
     return {
@@ -734,27 +846,292 @@ def build_snapshot() -> dict[str, Any]:
         "feed": [serialize_item(item) for item in enriched_items],
         "tickerIndex": build_ticker_insights(enriched_items, top_n=250),
         "meta": {
-            "source": "rss" if news_xml or reddit_xml else "fallback",
+            "source": "rss" if live else "fallback",
             "itemCount": len(enriched_items),
+            "newItems": added,
+            "reusedItems": len(previous & set(state.items)),
+            "rescoredItems": rescored,
+            "lexiconVersion": lexicon_source.current.version,
+            "lexiconDigest": lexicon_source.current.digest,
+            "idHash": ID_HASH,
+            "feeds": [
+                {
+                    "kind": result.feed.kind,
+                    "url": result.feed.url,
+                    "status": "not_modified" if result.not_modified else "ok" if result.body else "error",
+                }
+                for result in results
+            ],
+        },
+    }
+
+
+def encode_json(payload: Any, minify: bool = False, indent: int | None = 2) -> bytes:
+    if minify:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return (json.dumps(payload, indent=indent, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    # Written beside the target and renamed, so a reader (or --watch overwriting it) never sees a partial file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def write_json(path: Path, payload: dict[str, Any], indent: int | None = 2, minify: bool = False) -> bytes:
+    data = encode_json(payload, minify=minify, indent=indent)
+    write_bytes(path, data)
+    return data
+
+
+def write_precompressed(path: Path, data: bytes) -> dict[str, int]:
+    """Write `.gz` (and `.br` when brotli is installed) siblings for servers that serve precompressed files."""
+    gzip_data = gzip.compress(data, compresslevel=9, mtime=0)
+    write_bytes(path.with_name(path.name + ".gz"), gzip_data)
+    sizes = {"gzip": len(gzip_data)}
+    if brotli is not None:
+        brotli_data = brotli.compress(data, quality=11)
+        write_bytes(path.with_name(path.name + ".br"), brotli_data)
+        sizes["brotli"] = len(brotli_data)
+    return sizes
+
+
+def format_size_report(path: Path, sizes: dict[str, int]) -> str:
+    parts = ", ".join(f"{name} {size / 1024:.1f} KB" for name, size in sizes.items())
+    return f"{path.name}: {parts}"
+
+
+def build_shards(payload: dict[str, Any], compact: bool = False) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """Split a snapshot into a small manifest plus content-hashed shards ({relative path: body}).
+
+    Shard names change whenever their content does, so they can be cached as immutable; only the manifest
+    has to be fetched fresh. The filter index maps source/sentiment/ticker to positions in the feed order,
+    so a filtered page only needs the feed shards that hold those positions. With `compact`, feed pages and
+    ticker items use the `encode_feed` columnar form.
+    """
+    feed = payload["feed"]
+    encode_rows = encode_feed if compact else list
+    items = [deserialize_item(row) for row in feed]
+    shards: dict[str, bytes] = {}
+
+    def add_shard(name: str, body: Any) -> str:
+        data = json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        path = f"{SHARD_DIRECTORY}/{name}.{hashlib.sha256(data).hexdigest()[:12]}.json"
+        shards[path] = data
+        return path
+
+    filter_index: dict[str, defaultdict[str, list[int]]] = {
+        "source": defaultdict(list),
+        "sentiment": defaultdict(list),
+        "ticker": defaultdict(list),
+    }
+    related: defaultdict[str, list[EnrichedFeedItem]] = defaultdict(list)
+    for position, item in enumerate(items):
+        filter_index["source"][item.source].append(position)
+        filter_index["sentiment"][item.sentiment_label].append(position)
+        for ticker in dict.fromkeys(item.tickers):
+            filter_index["ticker"][ticker].append(position)
+            related[ticker].append(item)
+
+    ticker_rows = {row["ticker"]: row for row in payload["tickerIndex"]}
+    ticker_shards = {}
+    for ticker, ticker_items in sorted(related.items()):
+        ticker_shards[ticker] = add_shard(
+            f"ticker-{ticker}",
+            {
+                "ticker": ticker,
+                "mentions": len(ticker_items),
+                "snapshot": ticker_rows.get(ticker),
+                "items": encode_rows([serialize_item(item) for item in ticker_items[:TICKER_SHARD_ITEMS]]),
+                "themes": build_theme_insights(ticker_items, top_n=6),
+            },
+        )
+
+    manifest = {
+        "version": 1,
+        "generatedAt": payload["generatedAt"],
+        "meta": payload["meta"],
+        "itemCount": len(feed),
+        "feedPageSize": FEED_SHARD_SIZE,
+        "shards": {
+            "dashboard": add_shard("dashboard", payload["dashboard"]),
+            "tickerIndex": add_shard("ticker-index", payload["tickerIndex"]),
+            "filterIndex": add_shard("filter-index", {key: dict(values) for key, values in filter_index.items()}),
+            "feed": [
+                add_shard(f"feed-{page}", encode_rows(feed[start : start + FEED_SHARD_SIZE]))
+                for page, start in enumerate(range(0, len(feed), FEED_SHARD_SIZE))
+            ],
+            "tickers": ticker_shards,
         },
     }
+    return manifest, shards
+
+
+def manifest_paths(manifest: dict[str, Any]) -> set[str]:
+    shards = manifest.get("shards") or {}
+    paths = {shards.get("dashboard"), shards.get("tickerIndex"), shards.get("filterIndex")}
+    paths.update(shards.get("feed") or [])
+    paths.update((shards.get("tickers") or {}).values())
+    return {path for path in paths if path}
+
+
+def shard_is_current(path: Path, data: bytes) -> bool:
+    """Whether `path` already holds exactly `data`; a truncated or foreign file at a shard path is rewritten."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except OSError:
+        return False
+
+
+def write_shards(directory: Path, payload: dict[str, Any], compact: bool = False) -> dict[str, Any]:
+    """Write new shards, then the manifest, then prune shards neither it nor the previous manifest uses."""
+    manifest, shards = build_shards(payload, compact=compact)
+    manifest_path = directory / MANIFEST_NAME
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        previous = {}
+
+    for relative, data in shards.items():
+        target = directory / relative
+        if not shard_is_current(target, data):
+            write_bytes(target, data)
+    write_json(manifest_path, manifest, indent=None)
+
+    # Clients holding the previous manifest may still be fetching its shards, so those survive one more run.
+    keep = manifest_paths(manifest) | manifest_paths(previous)
+    for stale in (directory / SHARD_DIRECTORY).glob("*.json"):
+        if f"{SHARD_DIRECTORY}/{stale.name}" not in keep:
+            stale.unlink()
+    return manifest
+
+
+def reload_lexicon(state: SnapshotState) -> None:
+    """Pick up edits to the lexicon file between --watch runs, re-scoring only the items they affect."""
+    try:
+        swapped = lexicon_source.poll()
+    except (OSError, ValueError, TypeError, AttributeError) as error:
+        print(f"Keeping lexicon {lexicon_source.current.version}: {error!r}", file=sys.stderr)
+        return
+    if swapped is None or state.lexicon_digest != swapped[0].digest:
+        return
+    rescored = rescore_state(state, diff_lexicons(*swapped))
+    print(f"Lexicon {swapped[0].version} -> {swapped[1].version}: re-scored {rescored} items", file=sys.stderr)
+
+
+def run_once(args: argparse.Namespace, state: SnapshotState) -> None:
+    started = time.perf_counter()
+    reload_lexicon(state)
+    payload = build_snapshot(
+        feeds=args.feed or DEFAULT_FEEDS,
+        state=state,
+        workers=args.workers,
+        max_age=timedelta(hours=args.max_age_hours) if args.max_age_hours is not None else None,
+    )
+    manifest = write_shards(args.shards_dir or args.output.parent, payload, compact=args.compact)
+    if args.compact:
+        sizes = {"pretty": len(encode_json(payload))}
+        data = write_json(args.output, {**payload, "feed": encode_feed(payload["feed"])}, minify=True)
+        sizes["compact"] = len(data)
+    else:
+        data = write_json(args.output, payload)
+        sizes = {"pretty": len(data)}
+    if args.precompress:
+        sizes.update(write_precompressed(args.output, data))
+    if args.state:
+        save_state(state, args.state)
+    meta = payload["meta"]
+    print(
+        f"Wrote snapshot to {args.output} with {meta['itemCount']} items "
+        f"({meta['newItems']} new, {meta['reusedItems']} reused) and {len(manifest_paths(manifest))} shards "
+        f"in {time.perf_counter() - started:.2f}s",
+        file=sys.stderr,
+    )
+    print(format_size_report(args.output, sizes), file=sys.stderr)
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate static dashboard snapshot for GitHub Pages")
     parser.add_argument(
         "--output",
-        default="stock-sentiment-frontend/data/snapshot.json",
+        type=Path,
+        default=Path("stock-sentiment-frontend/data/snapshot.json"),
         help="Output JSON path",
     )
+    parser.add_argument(
+        "--feed",
+        action="append",
+        type=parse_feed_spec,
+        help="KIND=URL, repeatable (KIND is news or reddit). Defaults to the Yahoo Finance and r/wallstreetbets feeds.",
+    )
+    parser.add_argument(
+        "--shards-dir",
+        type=Path,
+        help="Where manifest.json and shards/ are written (defaults to the --output directory)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Minify JSON and store feed rows column-wise with dictionary-encoded sources, labels, tickers and themes",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Also write .gz (and .br with the brotli package) next to the snapshot",
+    )
+    parser.add_argument(
+        "--lexicon",
+        type=Path,
+        default=Path(os.environ.get("SSD_LEXICON_PATH") or LEXICON_PATH),
+        help="Lexicon JSON shared with the API; re-read between --watch runs when it changes",
+    )
+    parser.add_argument("--workers", type=int, default=MAX_FETCH_WORKERS, help="Concurrent feed fetches")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Start from --state (or the previous --output) and enrich only items not seen before",
+    )
+    parser.add_argument("--state", type=Path, help="Sidecar state file with enriched items and feed validators")
+    parser.add_argument(
+        "--max-age-hours",
+        type=float,
+        help=f"Drop items older than this (default: {MAX_ITEM_AGE_HOURS} with --incremental/--watch, else never)",
+    )
+    parser.add_argument("--watch", action="store_true", help="Keep running and write a snapshot every --interval")
+    parser.add_argument("--interval", type=float, default=300.0, help="Seconds between snapshots in --watch mode")
     args = parser.parse_args()
-
-    payload = build_snapshot()
-    output_path = Path(args.output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    print(f"Wrote snapshot to {output_path} with {payload['meta']['itemCount']} items", file=sys.stderr)
-    return 0
+    if args.max_age_hours is None and (args.incremental or args.watch):
+        # Carried-over state would otherwise keep stale items until MAX_ITEMS pushes them out.
+        args.max_age_hours = MAX_ITEM_AGE_HOURS
+
+    global lexicon_source
+    lexicon_source = LexiconSource(args.lexicon)
+    state = SnapshotState()
+    if args.incremental or args.watch:
+        source = args.state if args.state and args.state.exists() else args.output
+        if source.exists():
+            state = load_state(source)
+
+    if not args.watch:
+        run_once(args, state)
+        return 0
+
+    next_run = time.monotonic()
+    try:
+        while True:
+            try:
+                run_once(args, state)
+            except Exception as error:
+                # One failed run must not stop the watcher; the next interval retries with the same state.
+                print(f"Snapshot run failed: {error!r}", file=sys.stderr)
+            next_run += max(1.0, args.interval)
+            time.sleep(max(0.0, next_run - time.monotonic()))
+    except KeyboardInterrupt:
+        return 0
 
 
 if __name__ == "__main__":
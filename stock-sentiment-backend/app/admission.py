@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    __slots__ = ("capacity", "refill_per_second", "tokens", "updated_at")
+
+    def __init__(self, capacity: float, refill_per_second: float, now: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated_at = now
+
+    def take(self, now: float, cost: float = 1.0) -> bool:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+        if self.tokens < cost:
+            return False
+        self.tokens -= cost
+        return True
+
+
+class ClientRateLimiter:
+    """Per-client token buckets, bounded by evicting the least recently seen client."""
+
+    def __init__(self, capacity: float, refill_per_second: float, max_clients: int = 10_000):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_clients = max_clients
+        self.buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+
+    def allow(self, client: str, cost: float = 1.0) -> bool:
+        now = time.monotonic()
+        bucket = self.buckets.get(client)
+        if bucket is None:
+            bucket = TokenBucket(self.capacity, self.refill_per_second, now)
+            self.buckets[client] = bucket
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(client)
+        return bucket.take(now, cost)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sys
+import zlib
+from collections.abc import Iterable
+
+try:
+    import zstandard
+except ImportError:  # Optional: bodies fall back to zlib when zstandard is not installed.
+    zstandard = None
+
+COMPRESS_MIN_BYTES = 256
+
+
+def intern_all(values: Iterable[str]) -> tuple[str, ...]:
+    """Share one string object per distinct ticker/theme/label across every item that mentions it."""
+    return tuple(sys.intern(value) for value in values)
+
+
+class TextCodec:
+    """Optionally stores item bodies compressed; short or incompressible bodies always stay plain `str`."""
+
+    def __init__(self, enabled: bool = False, min_bytes: int = COMPRESS_MIN_BYTES, level: int = 3):
+        self.enabled = enabled
+        self.min_bytes = min_bytes
+        self.level = level
+        if zstandard is not None:
+            self.name = "zstd"
+            self.compressor = zstandard.ZstdCompressor(level=level)
+            self.decompressor = zstandard.ZstdDecompressor()
+        else:
+            self.name = "zlib"
+
+    def encode(self, text: str) -> str | bytes:
+        if not self.enabled:
+            return text
+        raw = text.encode("utf-8")
+        if len(raw) < self.min_bytes:
+            return text
+        packed = self.compressor.compress(raw) if zstandard is not None else zlib.compress(raw, self.level)
+        return packed if len(packed) < len(raw) else text
+
+    def decode(self, body: str | bytes) -> str:
+        if isinstance(body, str):
+            return body
+        raw = self.decompressor.decompress(body) if zstandard is not None else zlib.decompress(body)
+        return raw.decode("utf-8")
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+# Largest exponent a running sum may carry before the landmark moves; 2**256 keeps far clear of float overflow.
+RESCALE_EXPONENT = 256.0
+MARKET_KEY = ""
+
+
+@dataclass(slots=True)
+class DecayedScore:
+    mentions: float
+    sentiment: float
+    momentum: float
+    bullish: float
+    bearish: float
+
+
+class DecayedScores:
+    """Exponentially time-decayed mentions, sentiment and label counts per key, updated and read in O(1).
+
+    Forward decay: an item at time `t` is added with weight `2 ** ((t - landmark) / half_life)` and a read at
+    `now` scales by `2 ** ((landmark - now) / half_life)`, so nothing is touched between updates. The landmark
+    only moves, rescaling every key once and dropping keys that have decayed away, when weights grow large.
+    The same sums kept at a quarter of the half-life give a fast average; momentum is fast minus slow.
+    """
+
+    def __init__(self, half_life_seconds: float, fast_ratio: float = 0.25, prune_below: float = 1e-3):
+        self.half_life = half_life_seconds
+        self.fast_half_life = half_life_seconds * fast_ratio
+        self.prune_below = prune_below
+        self.landmark: float | None = None
+        # key -> [weight, weighted score, fast weight, fast weighted score, bullish weight, bearish weight]
+        self.sums: dict[str, list[float]] = {}
+        self.rescales = 0
+
+    def __len__(self) -> int:
+        return len(self.sums)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.sums
+
+    def weights(self, timestamp: float) -> tuple[float, float]:
+        if self.landmark is None:
+            self.landmark = timestamp
+        elif (timestamp - self.landmark) / self.fast_half_life > RESCALE_EXPONENT:
+            self.rescale(timestamp)
+        offset = timestamp - self.landmark
+        return 2.0 ** (offset / self.half_life), 2.0 ** (offset / self.fast_half_life)
+
+    def add(self, key: str, timestamp: float, score: float, label: str, weight: int = 1) -> None:
+        """Count one item; `weight=-1` takes back an earlier add with the same values exactly."""
+        slow, fast = self.weights(timestamp)
+        slow *= weight
+        fast *= weight
+        sums = self.sums.get(key)
+        if sums is None:
+            if weight < 0:
+                return
+            sums = self.sums[key] = [0.0] * 6
+        sums[0] += slow
+        sums[1] += slow * score
+        sums[2] += fast
+        sums[3] += fast * score
+        if label == "positive":
+            sums[4] += slow
+        elif label == "negative":
+            sums[5] += slow
+
+    def read(self, key: str, now: float) -> DecayedScore | None:
+        sums = self.sums.get(key)
+        if sums is None or self.landmark is None or sums[0] <= 0.0:
+            return None
+        scale = 2.0 ** ((self.landmark - now) / self.half_life)
+        sentiment = sums[1] / sums[0]
+        fast = sums[3] / sums[2] if sums[2] > 0.0 else sentiment
+        return DecayedScore(
+            mentions=sums[0] * scale,
+            sentiment=sentiment,
+            momentum=fast - sentiment,
+            bullish=sums[4] * scale,
+            bearish=sums[5] * scale,
+        )
+
+    def read_all(self, now: float) -> Iterable[tuple[str, DecayedScore]]:
+        for key in self.sums:
+            score = self.read(key, now)
+            if score is not None and score.mentions >= self.prune_below:
+                yield key, score
+
+    def rescale(self, landmark: float) -> None:
+        assert self.landmark is not None
+        slow = 2.0 ** ((self.landmark - landmark) / self.half_life)
+        fast = 2.0 ** ((self.landmark - landmark) / self.fast_half_life)
+        kept = {}
+        for key, sums in self.sums.items():
+            if sums[0] * slow < self.prune_below:
+                continue
+            kept[key] = [
+                sums[0] * slow,
+                sums[1] * slow,
+                sums[2] * fast,
+                sums[3] * fast,
+                sums[4] * slow,
+                sums[5] * slow,
+            ]
+        self.sums = kept
+        self.landmark = landmark
+        self.rescales += 1
+
+
+class DecayedSignals:
+    """Decayed scores per ticker, per theme and for the whole market, fed once per item."""
+
+    def __init__(self, half_life_seconds: float):
+        self.half_life = half_life_seconds
+        self.tickers = DecayedScores(half_life_seconds)
+        self.themes = DecayedScores(half_life_seconds)
+        self.market = DecayedScores(half_life_seconds)
+
+    def add(
+        self,
+        timestamp: float,
+        tickers: Iterable[str],
+        themes: Iterable[str],
+        score: float,
+        label: str,
+        weight: int = 1,
+    ) -> None:
+        self.market.add(MARKET_KEY, timestamp, score, label, weight)
+        for ticker in tickers:
+            self.tickers.add(ticker, timestamp, score, label, weight)
+        for theme in themes:
+            self.themes.add(theme, timestamp, score, label, weight)
+
+    def market_score(self, now: float) -> DecayedScore | None:
+        return self.market.read(MARKET_KEY, now)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "halfLifeSeconds": self.half_life,
+            "tickers": len(self.tickers),
+            "themes": len(self.themes),
+            "rescales": self.tickers.rescales + self.themes.rescales + self.market.rescales,
+        }
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import Any
+
+SIGNATURE_BITS = 64
+BANDS = 8
+SIGNATURE_MASK = (1 << SIGNATURE_BITS) - 1
+BAND_BITS = SIGNATURE_BITS // BANDS
+BAND_MASK = (1 << BAND_BITS) - 1
+# Hamming distance up to BANDS - 1 leaves at least one band identical, so banding finds every such match.
+MAX_DISTANCE = BANDS - 1
+# Fewer tokens than this give too few features for SimHash to separate stories; they must match exactly.
+MIN_TOKENS = 8
+WORD_PATTERN = re.compile(r"[a-z0-9$']+")
+# Fixed key, so signatures and fingerprints are the same in every process and can be stored or shared.
+HASH_KEY = b"ssd-dedupe-v1"
+
+
+def stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8, key=HASH_KEY).digest(), "little")
+
+
+# Headlines reuse a small vocabulary, so most word hashes come from this cache.
+token_hash = lru_cache(maxsize=1 << 16)(stable_hash)
+
+
+def pair_hash(first: int, second: int) -> int:
+    """Order-sensitive 64-bit mix of two word hashes (a multiply plus the splitmix64 finalizer)."""
+    value = (first * 0x9E3779B97F4A7C15 + second) & SIGNATURE_MASK
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & SIGNATURE_MASK
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & SIGNATURE_MASK
+    return value ^ (value >> 31)
+
+
+def simhash(text: str) -> tuple[int, int]:
+    """64-bit SimHash over the distinct word unigrams and bigrams of `text`; returns (signature, token count).
+
+    Set bits are tallied bit-sliced: `planes[k]` holds bit `k` of all 64 per-position counts, so adding a
+    feature and comparing every count with the majority threshold are a few whole-integer operations each.
+    Words are hashed with keyed BLAKE2b and bigrams by mixing their two word hashes.
+    """
+    tokens = WORD_PATTERN.findall(text.lower())
+    hashes = [token_hash(token) for token in tokens]
+    features = set(hashes)
+    features.update(pair_hash(first, second) for first, second in zip(hashes, hashes[1:]))
+    planes: list[int] = []
+    for feature in features:
+        carry = feature
+        for plane, bits in enumerate(planes):
+            planes[plane] = bits ^ carry
+            carry &= bits
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    # A position's bit is set when its count exceeds half the features, compared most significant plane first.
+    half = len(features) // 2
+    above = 0
+    equal = SIGNATURE_MASK
+    for plane in range(max(len(planes), half.bit_length()) - 1, -1, -1):
+        bits = planes[plane] if plane < len(planes) else 0
+        if half >> plane & 1:
+            equal &= bits
+        else:
+            above |= equal & bits
+            equal &= ~bits
+    return above, len(tokens)
+
+
+def hamming(first: int, second: int) -> int:
+    return (first ^ second).bit_count()
+
+
+class NearDuplicateIndex:
+    """SimHash signatures split into bands, so a lookup only compares against ids sharing a band value."""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        if not 0 <= max_distance <= MAX_DISTANCE:
+            raise ValueError(f"max_distance must be between 0 and {MAX_DISTANCE}.")
+        self.max_distance = max_distance
+        self.signatures: dict[str, int] = {}
+        self.bands: list[dict[int, set[str]]] = [{} for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def add(self, item_id: str, signature: int) -> None:
+        self.signatures[item_id] = signature
+        for band, table in enumerate(self.bands):
+            table.setdefault(signature >> (band * BAND_BITS) & BAND_MASK, set()).add(item_id)
+
+    def discard(self, item_id: str) -> None:
+        signature = self.signatures.pop(item_id, None)
+        if signature is None:
+            return
+        for band, table in enumerate(self.bands):
+            key = signature >> (band * BAND_BITS) & BAND_MASK
+            ids = table.get(key)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del table[key]
+
+    def nearest(
+        self,
+        signature: int,
+        max_distance: int | None = None,
+        accept: Callable[[str], bool] | None = None,
+    ) -> str | None:
+        """Closest indexed id within `max_distance` bits (ties by id) that `accept`, if given, allows."""
+        limit = self.max_distance if max_distance is None else max_distance
+        best: tuple[int, str] | None = None
+        seen: set[str] = set()
+        for band, table in enumerate(self.bands):
+            for item_id in table.get(signature >> (band * BAND_BITS) & BAND_MASK, ()):
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                distance = hamming(signature, self.signatures[item_id])
+                if distance > limit or (best is not None and (distance, item_id) > best):
+                    continue
+                if accept is None or accept(item_id):
+                    best = (distance, item_id)
+        return best[1] if best is not None else None
+
+
+class DuplicateClusters:
+    """Near-duplicate clusters over the retained window: one canonical id per cluster plus its member ids.
+
+    Canonical ids are indexed by signature, and by a keyed hash of their normalized text so exact repeats
+    (syndicated copies, reposted titles) skip SimHash altogether. A later near-duplicate becomes a member of
+    the closest canonical. An optional `key` (e.g. the symbols an item names) must also be equal, since
+    templated posts that differ only in a ticker are close in SimHash but are different stories. Discarding a
+    canonical (when it leaves the window) also forgets its members.
+    """
+
+    def __init__(self, max_distance: int = MAX_DISTANCE, min_tokens: int = MIN_TOKENS):
+        self.index = NearDuplicateIndex(max_distance)
+        self.min_tokens = min_tokens
+        self.exact: dict[int, str] = {}
+        self.fingerprints: dict[str, int] = {}
+        self.keys: dict[str, Hashable] = {}
+        self.members: dict[str, str] = {}
+        self.clusters: dict[str, list[str]] = {}
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.members or item_id in self.fingerprints
+
+    def assign(self, item_id: str, text: str, key: Hashable = None) -> str | None:
+        """Canonical id when `item_id` is a new near-duplicate; otherwise index it as a canonical and return None."""
+        if item_id in self.fingerprints:
+            return None
+        fingerprint = stable_hash(" ".join(text.lower().split()))
+        canonical = self.exact.get(fingerprint)
+        if canonical is None:
+            signature, tokens = simhash(text)
+            canonical = self.index.nearest(
+                signature,
+                None if tokens >= self.min_tokens else 0,
+                accept=lambda candidate: self.keys.get(candidate) == key,
+            )
+            if canonical is None:
+                self.index.add(item_id, signature)
+                self.exact[fingerprint] = item_id
+                self.fingerprints[item_id] = fingerprint
+                self.keys[item_id] = key
+                return None
+        self.members[item_id] = canonical
+        self.clusters.setdefault(canonical, []).append(item_id)
+        return canonical
+
+    def duplicates(self, canonical_id: str) -> int:
+        return len(self.clusters.get(canonical_id, ()))
+
+    def discard(self, canonical_id: str) -> None:
+        fingerprint = self.fingerprints.pop(canonical_id, None)
+        if fingerprint is not None and self.exact.get(fingerprint) == canonical_id:
+            del self.exact[fingerprint]
+        self.keys.pop(canonical_id, None)
+        self.index.discard(canonical_id)
+        for member in self.clusters.pop(canonical_id, ()):
+            self.members.pop(member, None)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "maxDistance": self.index.max_distance,
+            "indexed": len(self.index),
+            "clusters": len(self.clusters),
+            "duplicates": len(self.members),
+        }
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import hashlib
+
+# Recorded next to persisted ids (the static snapshot's state file) so ids from another scheme are discarded.
+ID_HASH = "blake2b-64"
+
+
+def stable_hash(value: str) -> str:
+    """Item id suffix shared by the API and the static snapshot, so both give a story the same id.
+
+    64 bits: ids key retention, cursors and the change log, so a collision would silently drop a story.
+    """
+    return hashlib.blake2b(value.encode("utf-8", errors="ignore"), digest_size=8).hexdigest()
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+LEXICON_PATH = Path(__file__).with_name("lexicon.json")
+TOKEN_PATTERN = re.compile(r"[a-z][a-z\-']*")
+TICKER_PATTERN = re.compile(r"\$?[A-Z]{1,5}\b")
+SINGLE_LETTER_TICKERS = frozenset({"C", "F", "T"})
+INTENSITY = 1.35
+
+
+def keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """One alternation per group: `search` succeeds exactly when any keyword occurs as a substring."""
+    return re.compile("|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)))
+
+
+@dataclass(slots=True)
+class Lexicon:
+    """Sentiment weights, theme keywords and ticker aliases, plus the lookup tables compiled from them.
+
+    Positive weights win over negative ones for a term listed in both, and intensifiers are checked first,
+    matching the original hard-coded scorer.
+    """
+
+    version: str
+    positive: dict[str, float]
+    negative: dict[str, float]
+    intensifiers: frozenset[str]
+    themes: dict[str, tuple[str, ...]]
+    companies: dict[str, str]
+    ticker_noise: frozenset[str]
+    digest: str = field(init=False)
+    weights: dict[str, float] = field(init=False)
+    theme_patterns: tuple[tuple[str, re.Pattern[str]], ...] = field(init=False)
+    company_patterns: tuple[tuple[str, re.Pattern[str]], ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Hash of what scoring reads, not of `version`: an edit that forgets to bump the version still changes it.
+        content = {
+            "positive": self.positive,
+            "negative": self.negative,
+            "intensifiers": sorted(self.intensifiers),
+            "themes": self.themes,
+            "companies": self.companies,
+            "tickerNoise": sorted(self.ticker_noise),
+        }
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        self.digest = hashlib.sha256(canonical).hexdigest()[:16]
+        self.weights = {**{term: -weight for term, weight in self.negative.items()}, **self.positive}
+        self.theme_patterns = tuple(
+            (theme, keyword_pattern(keywords)) for theme, keywords in self.themes.items() if keywords
+        )
+        by_ticker: dict[str, list[str]] = {}
+        for name, ticker in self.companies.items():
+            by_ticker.setdefault(ticker, []).append(name)
+        self.company_patterns = tuple((ticker, keyword_pattern(names)) for ticker, names in by_ticker.items())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Lexicon:
+        version = str(data.get("version") or "")
+        if not version:
+            canonical = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            version = hashlib.sha256(canonical).hexdigest()[:12]
+        return cls(
+            version=version,
+            positive={str(term).lower(): float(weight) for term, weight in (data.get("positive") or {}).items()},
+            negative={str(term).lower(): float(weight) for term, weight in (data.get("negative") or {}).items()},
+            intensifiers=frozenset(str(term).lower() for term in data.get("intensifiers") or ()),
+            themes={
+                str(theme): tuple(str(keyword).lower() for keyword in keywords)
+                for theme, keywords in (data.get("themes") or {}).items()
+            },
+            companies={
+                str(name).lower(): str(ticker).upper() for name, ticker in (data.get("companies") or {}).items()
+            },
+            ticker_noise=frozenset(str(token).upper() for token in data.get("tickerNoise") or ()),
+        )
+
+    def analyze(self, text: str) -> tuple[str, float, float]:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        if not tokens:
+            return "neutral", 0.0, 0.2
+
+        weights = self.weights
+        intensifiers = self.intensifiers
+        score = 0.0
+        intensity = 1.0
+        for token in tokens:
+            if token in intensifiers:
+                intensity = INTENSITY
+                continue
+            delta = weights.get(token)
+            if delta:
+                score += delta * intensity
+            intensity = 1.0
+
+        base = max(2.4, math.sqrt(len(tokens) + 1.0))
+        normalized = max(-1.0, min(1.0, score / base))
+
+        if normalized >= 0.18:
+            label = "positive"
+        elif normalized <= -0.18:
+            label = "negative"
+        else:
+            label = "neutral"
+
+        confidence = min(0.99, abs(normalized) * 1.45 + min(0.3, len(tokens) / 110.0))
+        return label, round(normalized, 4), round(confidence, 4)
+
+    def tickers(self, text: str) -> list[str]:
+        found: set[str] = set()
+        for match in TICKER_PATTERN.findall(text):
+            token = match.lstrip("$")
+            if token in self.ticker_noise:
+                continue
+            if len(token) == 1 and token not in SINGLE_LETTER_TICKERS:
+                continue
+            found.add(token)
+
+        lowered = text.lower()
+        for ticker, pattern in self.company_patterns:
+            if pattern.search(lowered):
+                found.add(ticker)
+
+        return sorted(found)[:10]
+
+    def match_themes(self, text: str) -> list[str]:
+        lowered = text.lower()
+        return [theme for theme, pattern in self.theme_patterns if pattern.search(lowered)]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "digest": self.digest,
+            "positive": len(self.positive),
+            "negative": len(self.negative),
+            "intensifiers": len(self.intensifiers),
+            "themes": len(self.themes),
+            "companies": len(self.companies),
+            "tickerNoise": len(self.ticker_noise),
+        }
+
+
+def load_lexicon(path: Path = LEXICON_PATH) -> Lexicon:
+    return Lexicon.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def index_terms(title: str, text: str) -> set[str]:
+    """Terms a lexicon change can act on: lowercase sentiment tokens and uppercase ticker candidates."""
+    terms = set(TOKEN_PATTERN.findall(text.lower()))
+    terms.update(match.lstrip("$") for match in TICKER_PATTERN.findall(f"{title} {text}"))
+    return terms
+
+
+@dataclass(slots=True)
+class LexiconChange:
+    """What differs between two lexicon versions.
+
+    `terms` are exact tokens (sentiment terms, intensifiers, ticker-noise symbols) and can be looked up in a
+    `TermIndex`. `keywords` are theme and company substrings, which can match inside other words and so have
+    to be checked against the text itself.
+    """
+
+    terms: frozenset[str]
+    keywords: frozenset[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.terms or self.keywords)
+
+    def mentions_keyword(self, title: str, text: str) -> bool:
+        if not self.keywords:
+            return False
+        lowered = f"{title} {text}".lower()
+        return any(keyword in lowered for keyword in self.keywords)
+
+    def affects(self, title: str, text: str) -> bool:
+        """Check one item directly; for many items, look `terms` up in a `TermIndex` instead."""
+        if self.terms and not self.terms.isdisjoint(index_terms(title, text)):
+            return True
+        return self.mentions_keyword(title, text)
+
+
+def diff_lexicons(previous: Lexicon, current: Lexicon) -> LexiconChange:
+    terms = {
+        term
+        for term in previous.weights.keys() | current.weights.keys()
+        if previous.weights.get(term) != current.weights.get(term)
+    }
+    terms.update(previous.intensifiers ^ current.intensifiers)
+    terms.update(previous.ticker_noise ^ current.ticker_noise)
+
+    keywords: set[str] = set()
+    for theme in previous.themes.keys() | current.themes.keys():
+        keywords.update(set(previous.themes.get(theme, ())) ^ set(current.themes.get(theme, ())))
+    for name in previous.companies.keys() | current.companies.keys():
+        if previous.companies.get(name) != current.companies.get(name):
+            keywords.add(name)
+    return LexiconChange(terms=frozenset(terms), keywords=frozenset(keywords))
+
+
+class TermIndex:
+    """term -> ids of the items containing it, so a lexicon change only revisits the items it can affect."""
+
+    def __init__(self) -> None:
+        self.postings: dict[str, set[str]] = {}
+
+    def add(self, item_id: str, terms: Iterable[str]) -> None:
+        for term in terms:
+            self.postings.setdefault(term, set()).add(item_id)
+
+    def discard(self, item_id: str, terms: Iterable[str]) -> None:
+        for term in terms:
+            ids = self.postings.get(term)
+            if ids is None:
+                continue
+            ids.discard(item_id)
+            if not ids:
+                del self.postings[term]
+
+    def lookup(self, terms: Iterable[str]) -> set[str]:
+        found: set[str] = set()
+        for term in terms:
+            found.update(self.postings.get(term, ()))
+        return found
+
+
+class LexiconSource:
+    """The active lexicon plus the file it came from; `poll` swaps in a new version when the file changes."""
+
+    def __init__(self, path: Path = LEXICON_PATH):
+        self.path = path
+        self.current = load_lexicon(path)
+        self.mtime = self.stat()
+        self.error: str | None = None
+
+    def stat(self) -> float:
+        try:
+            return self.path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def poll(self) -> tuple[Lexicon, Lexicon] | None:
+        """Reload if the file changed; returns (previous, current) when a different version was loaded."""
+        mtime = self.stat()
+        if mtime == self.mtime:
+            return None
+        self.mtime = mtime
+        current = load_lexicon(self.path)
+        if current == self.current:
+            return None
+        previous, self.current = self.current, current
+        return previous, current
@@ -1,142 +1,122 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import binascii
+import hmac
+import json
 import math
+import os
 import re
-import uuid
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+import sys
+import threading
+from collections import Counter, defaultdict, deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from statistics import pstdev
+from time import perf_counter
 from typing import Any
 
 import aiohttp
 from bs4 import BeautifulSoup
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import PlainTextResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+
+from app.admission import ClientRateLimiter
+from app.compact import TextCodec, intern_all
+from app.decay import DecayedScore, DecayedSignals
+from app.ids import stable_hash
+from app.dedupe import MAX_DISTANCE, DuplicateClusters
+from app.lexicon import LEXICON_PATH, Lexicon, LexiconSource, TermIndex, diff_lexicons, index_terms
+from app.metrics import STAGE_BUCKETS, MetricsRegistry, process_rss_bytes, timed
+from app.models import WATCHLIST_MAX_TICKERS, BatchRequest, WatchlistRequest
+from app.moments import Moments, StreamStats
+from app.narratives import NarrativeIndex
+from app.profiling import Profiler
+from app.result_cache import ResultCache
+from app.retention import RetentionPolicy, RetentionStore, parse_age_windows
+from app.sketches import HeavyHitters, TickerEstimate
+from app.timebuckets import Bucket, TimeBuckets
+from app.watchlists import SavedWatchlists, lookup_rows
 
 APP_NAME = "Stock Sentiment Intelligence API"
 APP_VERSION = "2.0.0"
-NEWS_RSS_URL = "https://finance.yahoo.com/news/rssindex"
-REDDIT_RSS_URL = "https://www.reddit.com/r/wallstreetbets/.rss"
-CACHE_TTL_SECONDS = 180
-MAX_ITEMS = 120
-
-POSITIVE_WEIGHTS = {
-    "beat": 1.4,
-    "bull": 1.2,
-    "bullish": 1.35,
-    "buy": 1.0,
-    "breakout": 1.25,
-    "gain": 1.15,
-    "growth": 1.1,
-    "green": 0.8,
-    "momentum": 0.95,
-    "optimistic": 1.2,
-    "outperform": 1.4,
-    "profit": 1.3,
-    "rally": 1.4,
-    "record": 1.0,
-    "rebound": 1.1,
-    "recover": 1.0,
-    "surge": 1.5,
-    "upgrade": 1.25,
-    "upside": 1.2,
-    "win": 1.0,
+# Overridable so load tests can point ingestion at the local fixture server in loadtest/.
+NEWS_RSS_URL = os.environ.get("SSD_NEWS_RSS_URL", "https://finance.yahoo.com/news/rssindex")
+REDDIT_RSS_URL = os.environ.get("SSD_REDDIT_RSS_URL", "https://www.reddit.com/r/wallstreetbets/.rss")
+CACHE_TTL_SECONDS = int(os.environ.get("SSD_CACHE_TTL_SECONDS", "180"))
+RETENTION_MAX_BYTES = int(os.environ.get("SSD_RETENTION_MAX_MB", "256")) * 1024 * 1024
+RETENTION_MAX_AGE = {
+    "news": timedelta(hours=24),
+    "reddit": timedelta(hours=24),
+    **parse_age_windows(os.environ.get("SSD_RETENTION_HOURS", "")),
 }
-
-NEGATIVE_WEIGHTS = {
-    "bankrupt": 1.7,
-    "bear": 1.2,
-    "bearish": 1.35,
-    "crash": 1.65,
-    "cut": 0.8,
-    "decline": 1.15,
-    "downgrade": 1.35,
-    "drop": 1.1,
-    "fear": 1.0,
-    "loss": 1.25,
-    "miss": 1.2,
-    "missed": 1.2,
-    "plunge": 1.65,
-    "risk": 0.9,
-    "sell": 1.15,
-    "slump": 1.35,
-    "volatile": 0.9,
-    "warning": 0.95,
-    "weak": 0.95,
-}
-
-INTENSIFIERS = {"very", "extremely", "strong", "massive", "huge", "major", "sharp"}
-
-THEME_KEYWORDS = {
-    "AI": ["ai", "artificial intelligence", "chip", "semiconductor", "model", "gpu"],
-    "Earnings": ["earnings", "eps", "revenue", "guidance", "quarter", "forecast"],
-    "Rates": ["fed", "rates", "interest", "inflation", "cpi", "bond"],
-    "M&A": ["acquire", "acquisition", "merger", "deal", "buyout"],
-    "Crypto": ["bitcoin", "ethereum", "crypto", "token", "blockchain"],
-    "EV": ["electric vehicle", "ev", "battery", "charging", "tesla"],
-    "Labor": ["strike", "layoff", "hiring", "workforce", "union"],
-}
-
-COMPANY_TO_TICKER = {
-    "apple": "AAPL",
-    "amazon": "AMZN",
-    "alphabet": "GOOGL",
-    "google": "GOOGL",
-    "microsoft": "MSFT",
-    "meta": "META",
-    "nvidia": "NVDA",
-    "tesla": "TSLA",
-    "netflix": "NFLX",
-    "palantir": "PLTR",
-    "coinbase": "COIN",
-    "amd": "AMD",
-    "intel": "INTC",
-}
-
-TICKER_NOISE = {
-    "A",
-    "AI",
-    "AM",
-    "AN",
-    "ARE",
-    "AS",
-    "AT",
-    "CEO",
-    "CFO",
-    "CPI",
-    "DO",
-    "EV",
-    "FED",
-    "FOR",
-    "GDP",
-    "HAS",
-    "HOW",
-    "IPO",
-    "IS",
-    "IT",
-    "LOW",
-    "NEW",
-    "NO",
-    "NOW",
-    "ON",
-    "OR",
-    "OUT",
-    "PM",
-    "RSI",
-    "SO",
-    "THE",
-    "TO",
-    "TOP",
-    "USA",
-    "USD",
-    "WSB",
-    "YOLO",
+RETENTION_ENTRY_OVERHEAD_BYTES = 160
+# window -> (span, step) in seconds; each window is served from per-minute or hourly buckets.
+TIMELINE_WINDOWS = {"1h": (3600, 300), "6h": (21600, 1800), "24h": (86400, 3600), "7d": (604800, 21600)}
+TIMELINE_DEFAULT_WINDOW = "24h"
+# The dashboard chart shows the non-empty points of this window, so its cost does not grow with retention.
+DASHBOARD_TIMELINE_WINDOW = "24h"
+CHANGE_HISTORY_SIZE = 64
+STREAM_QUEUE_SIZE = 16
+STREAM_HEARTBEAT_SECONDS = 15
+STREAM_REFRESH_POLL_SECONDS = 15
+FEED_PAGE_SIZE = 40
+FEED_PAGE_MAX = 500
+NDJSON_BATCH_SIZE = 64
+FORCE_REFRESH_MIN_INTERVAL_SECONDS = 20
+FORCE_REFRESH_BURST = 3
+FORCE_REFRESH_RATE_PER_MINUTE = 2
+# Reverse proxies in front of the API that append to X-Forwarded-For; 0 ignores the header, since clients can set it.
+TRUSTED_PROXY_HOPS = int(os.environ.get("SSD_TRUSTED_PROXY_HOPS", "0"))
+BATCH_MAX_VIEWS = 16
+RESULT_CACHE_ENTRIES = 512
+EVENT_LOOP_LAG_INTERVAL_SECONDS = 1.0
+WATCHLIST_QUERY_MAX = 100
+WATCHLIST_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+SAVED_WATCHLISTS_FILE = os.environ.get("SSD_WATCHLISTS_FILE")
+# Saved watchlists are read-only unless this is set; PUT and DELETE then need it in X-Admin-Token.
+WATCHLIST_WRITE_TOKEN = os.environ.get("SSD_WATCHLIST_TOKEN")
+COMPRESS_ITEM_TEXT = os.environ.get("SSD_COMPRESS_TEXT", "").lower() in {"1", "true", "yes"}
+SUMMARY_MAX_LENGTH = 180
+# Sentiment weights, theme keywords and ticker aliases; edits are picked up without a restart.
+LEXICON_FILE = Path(os.environ.get("SSD_LEXICON_PATH") or LEXICON_PATH)
+LEXICON_POLL_SECONDS = float(os.environ.get("SSD_LEXICON_POLL_SECONDS", "10"))
+# "approximate" ranks trending tickers from constant-memory sketches; exact rows are kept for watchlisted symbols.
+TRENDING_MODE = os.environ.get("SSD_TRENDING_MODE", "exact").strip().lower()
+SKETCH_CAPACITY = int(os.environ.get("SSD_SKETCH_CAPACITY", "256"))
+SKETCH_EPSILON = float(os.environ.get("SSD_SKETCH_EPSILON", "0.001"))
+SKETCH_DELTA = float(os.environ.get("SSD_SKETCH_DELTA", "0.01"))
+SKETCH_WINDOW_SECONDS = int(os.environ.get("SSD_SKETCH_WINDOW_SECONDS", "3600"))
+SKETCH_DECAY = float(os.environ.get("SSD_SKETCH_DECAY", "0.5"))
+# "decayed" weights items by age (running exponentially weighted sums) instead of counting the window equally.
+SCORE_MODE = os.environ.get("SSD_SCORE_MODE", "window").strip().lower()
+SCORE_HALF_LIFE_SECONDS = float(os.environ.get("SSD_SCORE_HALF_LIFE_MINUTES", "60")) * 60
+# Near-duplicates of a retained item (SimHash within this many bits) are folded into it instead of enriched.
+DEDUPE_ENABLED = os.environ.get("SSD_DEDUPE", "1").lower() not in {"0", "false", "no"}
+DEDUPE_MAX_DISTANCE = int(os.environ.get("SSD_DEDUPE_MAX_DISTANCE", str(MAX_DISTANCE)))
+ITEM_FIELDS = (
+    "id",
+    "source",
+    "title",
+    "url",
+    "publishedAt",
+    "text",
+    "summary",
+    "sentiment",
+    "tickers",
+    "themes",
+    "duplicates",
+)
+FIELD_PROFILES = {
+    "full": ITEM_FIELDS,
+    "list": ("id", "source", "title", "url", "publishedAt", "summary", "sentiment", "tickers", "themes", "duplicates"),
 }
 
 RSS_HEADERS = {
@@ -144,6 +124,47 @@ RSS_HEADERS = {
     "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 }
 
+metrics = MetricsRegistry()
+STAGE_SECONDS = metrics.histogram(
+    "ssd_stage_duration_seconds",
+    "Wall time of one call of a pipeline stage.",
+    ("stage",),
+    buckets=STAGE_BUCKETS,
+)
+FETCH_SECONDS = metrics.histogram("ssd_fetch_duration_seconds", "Upstream feed fetch time.", ("feed", "outcome"))
+FETCH_BYTES = metrics.counter("ssd_fetch_bytes_total", "Bytes of feed bodies received.", ("feed",))
+CACHE_LOOKUPS = metrics.counter("ssd_cache_lookups_total", "Feed cache reads by outcome.", ("result",))
+FORCE_REFRESH_THROTTLED = metrics.counter("ssd_force_refresh_throttled_total", "Forced refreshes served from cache.")
+REFRESHES = metrics.counter("ssd_cache_refreshes_total", "Feed refreshes by outcome.", ("outcome",))
+REFRESH_SECONDS = metrics.histogram("ssd_refresh_duration_seconds", "End-to-end feed refresh time.")
+RESULT_CACHE_LOOKUPS = metrics.counter("ssd_result_cache_lookups_total", "View result cache reads.", ("result",))
+RESULT_CACHE_SIZE = metrics.gauge("ssd_result_cache_entries", "View results held for the current generation.")
+CACHE_ITEMS = metrics.gauge("ssd_cache_items", "Items in the current cache generation.")
+CACHE_GENERATION = metrics.gauge("ssd_cache_generation", "Current cache generation number.")
+CACHE_AGE = metrics.gauge("ssd_cache_age_seconds", "Seconds since the current generation was published.")
+STREAM_SUBSCRIBERS = metrics.gauge("ssd_stream_subscribers", "Connected SSE and WebSocket clients.")
+EVENT_LOOP_LAG = metrics.histogram(
+    "ssd_event_loop_lag_seconds",
+    "How late the event loop woke a sleeping probe task.",
+    buckets=STAGE_BUCKETS,
+)
+RETENTION_BYTES = metrics.gauge("ssd_retention_bytes", "Estimated bytes of retained items.", ("source",))
+RETENTION_ITEMS = metrics.gauge("ssd_retention_items", "Retained items.", ("source",))
+RETENTION_EVICTIONS = metrics.counter("ssd_retention_evictions_total", "Items evicted by retention.", ("reason",))
+PROCESS_RSS = metrics.gauge("process_resident_memory_bytes", "Resident memory size in bytes.")
+LEXICON_RELOADS = metrics.counter("ssd_lexicon_reloads_total", "Lexicon file reloads by outcome.", ("outcome",))
+DUPLICATES_FOLDED = metrics.counter(
+    "ssd_duplicate_items_total", "Fetched items folded into a near-duplicate cluster instead of enriched."
+)
+LEXICON_RESCORED = metrics.counter("ssd_lexicon_rescored_items_total", "Cached items re-scored after a lexicon change.")
+
+
+@dataclass(slots=True)
+class FeedValidators:
+    etag: str | None
+    last_modified: str | None
+    body: str
+
 
 @dataclass(slots=True)
 class RawFeedItem:
@@ -157,49 +178,457 @@ class RawFeedItem:
 
 @dataclass(slots=True)
 class EnrichedFeedItem:
+    """Enriched item in compact form.
+
+    Source, label, tickers and themes are interned and held in tuples, the summary is a prefix length of
+    the body rather than a second string, and the body may be compressed (`SSD_COMPRESS_TEXT`).
+    """
+
     id: str
     source: str
     title: str
     url: str
     published_at: datetime
-    text: str
-    summary: str
+    body: str | bytes
+    summary_length: int
     sentiment_label: str
     sentiment_score: float
     sentiment_confidence: float
-    tickers: list[str]
-    themes: list[str]
+    tickers: tuple[str, ...]
+    themes: tuple[str, ...]
+    duplicates: int = 0
+
+    @property
+    def text(self) -> str:
+        return text_codec.decode(self.body)
+
+    @property
+    def summary(self) -> str:
+        text = self.text
+        if self.summary_length >= len(text):
+            return text
+        return text[: self.summary_length] + "…"
+
+
+@dataclass(slots=True)
+class GenerationDelta:
+    generation: int
+    previous_generation: int
+    generated_at: datetime
+    added: list[str]
+    removed: list[str]
+    overview: dict[str, Any]
+    tickers: list[dict[str, Any]]
+    removed_tickers: list[str]
+    trending: list[str] | None
+    updated: list[str] = field(default_factory=list)
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "previousGeneration": self.previous_generation,
+            "generatedAt": self.generated_at.isoformat(),
+            "added": self.added,
+            "removed": self.removed,
+            "updated": self.updated,
+            "overview": self.overview,
+            "tickers": self.tickers,
+            "removedTickers": self.removed_tickers,
+            "trending": self.trending,
+        }
+
+
+@dataclass(slots=True)
+class FeedSnapshot:
+    items: list[EnrichedFeedItem]
+    generated_at: datetime
+    generation: int
+    cached: bool
+    ticker_index: dict[str, dict[str, Any]]
+    coalesced: bool = False
+    throttled: bool = False
+    overview: dict[str, Any] | None = None
+    theme_rows: list[dict[str, Any]] | None = None
+    timeline: list[dict[str, Any]] | None = None
+    narratives: list[dict[str, Any]] | None = None
+    sentiment_counts: dict[str, int] | None = None
+    source_counts: dict[str, int] | None = None
+
+    def meta(self) -> dict[str, Any]:
+        return {
+            "generatedAt": self.generated_at.isoformat(),
+            "generation": self.generation,
+            "cached": self.cached,
+            "coalesced": self.coalesced,
+            "throttled": self.throttled,
+        }
 
 
 class FeedCache:
-    def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS):
+    def __init__(
+        self,
+        ttl_seconds: int = CACHE_TTL_SECONDS,
+        history_size: int = CHANGE_HISTORY_SIZE,
+        min_force_interval_seconds: int = FORCE_REFRESH_MIN_INTERVAL_SECONDS,
+    ):
         self.ttl = timedelta(seconds=ttl_seconds)
+        self.min_force_interval = timedelta(seconds=min_force_interval_seconds)
+        self.inflight: asyncio.Task[None] | None = None
         self.generated_at = datetime.min.replace(tzinfo=timezone.utc)
         self.items: list[EnrichedFeedItem] = []
         self.lock = asyncio.Lock()
+        self.generation = 0
+        self.overview: dict[str, Any] = {}
+        self.ticker_rows: dict[str, dict[str, Any]] = {}
+        self.theme_rows: list[dict[str, Any]] | None = None
+        self.timeline: list[dict[str, Any]] | None = None
+        self.narrative_rows: list[dict[str, Any]] | None = None
+        self.sentiment_counts: dict[str, int] | None = None
+        self.source_counts: dict[str, int] | None = None
+        self.trending: list[str] = []
+        self.history: deque[GenerationDelta] = deque(maxlen=history_size)
+        self.listeners: list[Callable[[GenerationDelta], None]] = []
+        self.retention: RetentionStore[EnrichedFeedItem] = RetentionStore(
+            RetentionPolicy(
+                max_bytes=RETENTION_MAX_BYTES,
+                max_age=RETENTION_MAX_AGE,
+                default_max_age=timedelta(hours=24),
+            ),
+            key=lambda item: feed_order_key(item),
+            source=lambda item: item.source,
+            size=lambda item: estimate_item_bytes(item),
+        )
+        # Approximate trending ranks tickers from the sketches, so no other structure keeps exact per-ticker state.
+        exact_tickers = TRENDING_MODE != "approximate"
+        self.timebuckets = TimeBuckets(track_tickers=exact_tickers)
+        self.stats = StreamStats(track_tickers=exact_tickers)
+        self.narratives = NarrativeIndex()
+        self.terms = TermIndex()
+        self.heavy_hitters = (
+            HeavyHitters(
+                capacity=SKETCH_CAPACITY,
+                epsilon=SKETCH_EPSILON,
+                delta=SKETCH_DELTA,
+                window_seconds=SKETCH_WINDOW_SECONDS,
+                decay=SKETCH_DECAY,
+            )
+            if TRENDING_MODE == "approximate"
+            else None
+        )
+        self.decayed = DecayedSignals(SCORE_HALF_LIFE_SECONDS) if SCORE_MODE == "decayed" else None
+        self.clusters = DuplicateClusters(DEDUPE_MAX_DISTANCE) if DEDUPE_ENABLED else None
+        # Ids of the canned items published while no source has returned anything yet.
+        self.fallback_ids: set[str] = set()
 
-    async def get(self, *, force_refresh: bool = False) -> tuple[list[EnrichedFeedItem], datetime, bool]:
+    async def get(self, *, force_refresh: bool = False) -> FeedSnapshot:
         now = utc_now()
-        if not force_refresh and self.items and now - self.generated_at < self.ttl:
-            return self.items, self.generated_at, True
+        throttled = False
+        if force_refresh and self.items and now - self.generated_at < self.min_force_interval:
+            force_refresh, throttled = False, True
 
+        if throttled:
+            FORCE_REFRESH_THROTTLED.inc()
+
+        if not force_refresh and self.items and now - self.generated_at < self.ttl:
+            CACHE_LOOKUPS.labels("hit").inc()
+            return self.snapshot(cached=True, throttled=throttled)
+
+        coalesced = self.inflight is not None
+        CACHE_LOOKUPS.labels("coalesced" if coalesced else "miss").inc()
+        if self.inflight is None:
+            self.inflight = asyncio.create_task(self.refresh())
+            self.inflight.add_done_callback(self._clear_inflight)
+        # Shielded so one disconnecting client cannot cancel a refresh other requests are waiting on.
+        await asyncio.shield(self.inflight)
+        return self.snapshot(cached=False, coalesced=coalesced, throttled=throttled)
+
+    async def refresh(self) -> None:
         async with self.lock:
             now = utc_now()
-            if not force_refresh and self.items and now - self.generated_at < self.ttl:
-                return self.items, self.generated_at, True
+            started = perf_counter()
+            session = profiler.take_refresh_session() if profiler is not None else None
+            try:
+                raw_items = await fetch_all_sources()
+                if raw_items and self.fallback_ids:
+                    # Canned stories are a placeholder: the first live fetch replaces them instead of joining them.
+                    self.forget(self.retention.remove(self.fallback_ids))
+                    self.fallback_ids.clear()
+                elif not raw_items and not self.retention:
+                    raw_items = fallback_items()
+                    self.fallback_ids = {item.id for item in raw_items}
+                # Item ids are stable, so retained or already-expired items are skipped before enrichment.
+                fresh = [
+                    item
+                    for item in raw_items
+                    if self.retention.admits(item.id, item.source, item.published_at, now)
+                    and (self.clusters is None or item.id not in self.clusters.members)
+                ]
+                grown: set[str] = set()
+                tickers: dict[str, list[str]] = {}
+                if self.clusters is not None:
+                    fresh, grown, tickers = partition_duplicates(self.clusters, fresh)
+                enriched = enrich_all(fresh, tickers)
+                added = set(self.retention.merge(enriched))
+                updated = self.fold_duplicates(grown, added) if grown else []
+                merged = [item for item in enriched if item.id in added]
+                record_time_buckets(self.timebuckets, merged)
+                record_stream_stats(self.stats, merged)
+                record_narratives(self.narratives, merged)
+                if self.heavy_hitters is not None:
+                    record_heavy_hitters(self.heavy_hitters, merged)
+                if self.decayed is not None:
+                    record_decayed_scores(self.decayed, merged)
+                for item in merged:
+                    self.terms.add(item.id, index_terms(item.title, item.text))
+                evicted = self.retention.evict(now)
+                record_stream_stats(self.stats, evicted, remove=True)
+                record_narratives(self.narratives, evicted, remove=True)
+                for item in evicted:
+                    self.terms.discard(item.id, index_terms(item.title, item.text))
+                    if self.clusters is not None:
+                        self.clusters.discard(item.id)
+                self.publish(self.retention.newest_first(), now, updated=updated)
+            except Exception:
+                REFRESHES.labels("error").inc()
+                raise
+            finally:
+                if session is not None:
+                    profiler.finish(session)
+            REFRESHES.labels("ok").inc()
+            REFRESH_SECONDS.observe(perf_counter() - started)
+
+    def forget(self, items: list[EnrichedFeedItem]) -> None:
+        """Undo every incremental record of items that should never have counted, unlike evicted history."""
+        record_time_buckets(self.timebuckets, items, remove=True)
+        record_stream_stats(self.stats, items, remove=True)
+        record_narratives(self.narratives, items, remove=True)
+        if self.heavy_hitters is not None:
+            record_heavy_hitters(self.heavy_hitters, items, remove=True)
+        if self.decayed is not None:
+            record_decayed_scores(self.decayed, items, remove=True)
+        for item in items:
+            self.terms.discard(item.id, index_terms(item.title, item.text))
+            if self.clusters is not None:
+                self.clusters.discard(item.id)
+
+    def fold_duplicates(self, canonical_ids: set[str], added: set[str]) -> list[str]:
+        """Copy cluster sizes onto their canonical items; returns the already-published ones that changed."""
+        assert self.clusters is not None
+        updated = []
+        for item_id in canonical_ids:
+            item = self.retention.items.get(item_id)
+            count = self.clusters.duplicates(item_id)
+            if item is None or item.duplicates == count:
+                continue
+            self.retention.replace(replace(item, duplicates=count))
+            if item_id not in added:
+                updated.append(item_id)
+        return updated
+
+    async def apply_lexicon(self, previous: Lexicon, current: Lexicon) -> list[str]:
+        """Re-score only retained items a lexicon change can affect and publish them as one generation."""
+        change = diff_lexicons(previous, current)
+        async with self.lock:
+            if not change or not self.retention:
+                return []
+            candidates = self.terms.lookup(change.terms)
+            if change.keywords:
+                candidates.update(
+                    item.id for item in self.retention.items.values() if change.mentions_keyword(item.title, item.text)
+                )
+
+            updated = []
+            for item_id in candidates:
+                item = self.retention.items.get(item_id)
+                if item is None:
+                    continue
+                rescored = rescore_item(item)
+                if rescored == item:
+                    continue
+                self.retention.replace(rescored)
+                record_time_buckets(self.timebuckets, [item], remove=True)
+                record_time_buckets(self.timebuckets, [rescored])
+                record_stream_stats(self.stats, [item], remove=True)
+                record_stream_stats(self.stats, [rescored])
+                record_narratives(self.narratives, [item], remove=True)
+                record_narratives(self.narratives, [rescored])
+                if self.heavy_hitters is not None:
+                    record_heavy_hitters(self.heavy_hitters, [item], remove=True)
+                    record_heavy_hitters(self.heavy_hitters, [rescored])
+                if self.decayed is not None:
+                    record_decayed_scores(self.decayed, [item], remove=True)
+                    record_decayed_scores(self.decayed, [rescored])
+                updated.append(item_id)
+
+            LEXICON_RESCORED.inc(len(updated))
+            if updated:
+                # Same generated_at: a lexicon swap re-scores cached items but does not reset the refresh TTL.
+                self.publish(self.retention.newest_first(), self.generated_at, updated=updated)
+            return updated
+
+    def snapshot(self, *, cached: bool, coalesced: bool = False, throttled: bool = False) -> FeedSnapshot:
+        return FeedSnapshot(
+            items=self.items,
+            generated_at=self.generated_at,
+            generation=self.generation,
+            cached=cached,
+            ticker_index=self.ticker_rows,
+            coalesced=coalesced,
+            throttled=throttled,
+            overview=self.overview,
+            theme_rows=self.theme_rows,
+            timeline=self.timeline,
+            narratives=self.narrative_rows,
+            sentiment_counts=self.sentiment_counts,
+            source_counts=self.source_counts,
+        )
+
+    def _clear_inflight(self, task: asyncio.Task[None]) -> None:
+        if self.inflight is task:
+            self.inflight = None
+
+    def publish(
+        self,
+        items: list[EnrichedFeedItem],
+        generated_at: datetime,
+        updated: list[str] | None = None,
+    ) -> GenerationDelta:
+        # `items` is always the retained set, which `self.stats` tracks incrementally.
+        overview = build_stats_overview(self.stats)
+        theme_rows = build_stats_theme_rows(self.stats)
+        if self.decayed is not None:
+            now = generated_at.timestamp()
+            overview.update(build_decayed_overview(self.decayed, now))
+            theme_rows = build_decayed_theme_rows(self.decayed, now)
+        if self.heavy_hitters is not None:
+            overview["activeTickers"] = len(self.heavy_hitters.top.counts)
+            ticker_rows = build_sketch_ticker_rows(items, self.heavy_hitters, saved_watchlists.symbols())
+        elif self.decayed is not None:
+            ticker_rows = build_decayed_ticker_rows(self.decayed, generated_at.timestamp())
+        else:
+            ticker_rows = build_ticker_insights(items, top_n=None)
+        delta = diff_generations(
+            self.items,
+            items,
+            previous_overview=self.overview,
+            overview=overview,
+            previous_tickers=self.ticker_rows,
+            ticker_rows=ticker_rows,
+            previous_trending=self.trending,
+        )
+        delta.previous_generation = self.generation
+        delta.generation = self.generation + 1
+        delta.generated_at = generated_at
+        delta.updated = list(updated or [])
+
+        self.items = items
+        self.generated_at = generated_at
+        self.generation = delta.generation
+        self.overview = overview
+        self.ticker_rows = {row["ticker"]: row for row in ticker_rows}
+        self.theme_rows = theme_rows
+        self.timeline = build_dashboard_timeline(self.timebuckets, generated_at)
+        self.narrative_rows = build_index_narratives(self.narratives, self.retention.items, limit=8)
+        self.sentiment_counts = build_stats_sentiment_breakdown(self.stats)
+        self.source_counts = build_stats_source_breakdown(self.stats)
+        self.trending = [row["ticker"] for row in ticker_rows[:12]]
+        self.history.append(delta)
+        for listener in list(self.listeners):
+            listener(delta)
+        return delta
+
+    def deltas_since(self, generation: int) -> list[GenerationDelta] | None:
+        """Return the retained deltas after `generation`, or None when the history no longer reaches back that far."""
+        if generation == self.generation:
+            return []
+        if generation > self.generation or not self.history or self.history[0].previous_generation > generation:
+            return None
+        return [delta for delta in self.history if delta.generation > generation]
+
+    def changes_since(self, generation: int) -> GenerationDelta | None:
+        """Fold every retained delta after `generation` into one net change set against the current generation."""
+        deltas = self.deltas_since(generation)
+        if deltas is None:
+            return None
+
+        first_op: dict[str, bool] = {}
+        updated: dict[str, None] = {}
+        changed_overview: set[str] = set()
+        changed_tickers: dict[str, None] = {}
+        removed_tickers: dict[str, None] = {}
+        trending_changed = False
+        for delta in deltas:
+            for item_id in delta.added:
+                first_op.setdefault(item_id, True)
+            for item_id in delta.removed:
+                first_op.setdefault(item_id, False)
+            updated.update((item_id, None) for item_id in delta.updated)
+            changed_overview.update(delta.overview)
+            changed_tickers.update((row["ticker"], None) for row in delta.tickers)
+            removed_tickers.update((ticker, None) for ticker in delta.removed_tickers)
+            trending_changed = trending_changed or delta.trending is not None
+
+        current_ids = {item.id for item in self.items} if first_op or updated else set()
+        return GenerationDelta(
+            generation=self.generation,
+            previous_generation=generation,
+            generated_at=self.generated_at,
+            added=[item_id for item_id, was_added in first_op.items() if was_added and item_id in current_ids],
+            removed=[item_id for item_id, was_added in first_op.items() if not was_added and item_id not in current_ids],
+            # Items added within the folded range are sent whole anyway, so only pre-existing ones count as updated.
+            updated=[item_id for item_id in updated if item_id in current_ids and not first_op.get(item_id, False)],
+            overview={key: self.overview[key] for key in changed_overview if key in self.overview},
+            tickers=[self.ticker_rows[ticker] for ticker in changed_tickers if ticker in self.ticker_rows],
+            removed_tickers=[ticker for ticker in removed_tickers if ticker not in self.ticker_rows],
+            trending=list(self.trending) if trending_changed else None,
+        )
+
 
-            raw_items = await fetch_all_sources()
-            enriched = [enrich_item(item) for item in raw_items]
-            if not enriched:
-                enriched = [enrich_item(item) for item in fallback_items()]
+class DeltaBroadcaster:
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers: set[asyncio.Queue[GenerationDelta | None]] = set()
 
-            self.items = sorted(enriched, key=lambda item: item.published_at, reverse=True)[:MAX_ITEMS]
-            self.generated_at = now
-            return self.items, self.generated_at, False
+    def subscribe(self) -> asyncio.Queue[GenerationDelta | None]:
+        queue: asyncio.Queue[GenerationDelta | None] = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[GenerationDelta | None]) -> None:
+        self.subscribers.discard(queue)
+
+    def publish(self, delta: GenerationDelta) -> None:
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(delta)
+            except asyncio.QueueFull:
+                # Slow consumer: drop its backlog and ask it to resync from a full payload.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
 
 
 app = FastAPI(title=APP_NAME, version=APP_VERSION)
 cache = FeedCache()
+broadcaster = DeltaBroadcaster()
+force_refresh_limiter = ClientRateLimiter(
+    capacity=FORCE_REFRESH_BURST,
+    refill_per_second=FORCE_REFRESH_RATE_PER_MINUTE / 60.0,
+)
+result_cache = ResultCache(max_entries=RESULT_CACHE_ENTRIES)
+feed_validators: dict[str, FeedValidators] = {}
+text_codec = TextCodec(enabled=COMPRESS_ITEM_TEXT)
+lexicon_source = LexiconSource(LEXICON_FILE)
+# None unless SSD_PROFILING_TOKEN is set; every profiling hook is skipped entirely in that case.
+profiler = Profiler.from_env()
+cache.listeners.append(broadcaster.publish)
+cache.listeners.append(lambda delta: result_cache.invalidate(delta.generation))
+saved_watchlists = SavedWatchlists(
+    missing=lambda ticker: empty_ticker_row(ticker),
+    path=Path(SAVED_WATCHLISTS_FILE) if SAVED_WATCHLISTS_FILE else None,
+)
+cache.listeners.append(lambda delta: saved_watchlists.precompute(cache.ticker_rows, delta.generation))
+metrics.collectors.append(lambda: collect_runtime_metrics())
 
 app.add_middleware(
     CORSMiddleware,
@@ -220,6 +649,25 @@ if FRONTEND_DIR.exists():
     app.mount("/app", StaticFiles(directory=str(FRONTEND_DIR), html=True), name="frontend")
 
 
+@app.on_event("startup")
+async def start_background_tasks() -> None:
+    app.state.stream_refresher = asyncio.create_task(refresh_while_streaming())
+    app.state.loop_lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    app.state.lexicon_watcher = asyncio.create_task(watch_lexicon())
+    if profiler is not None:
+        profiler.start_sampler(threading.get_ident())
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks() -> None:
+    for name in ("stream_refresher", "loop_lag_monitor", "lexicon_watcher"):
+        task = getattr(app.state, name, None)
+        if task:
+            task.cancel()
+    if profiler is not None:
+        profiler.stop_sampler()
+
+
 @app.get("/", include_in_schema=False)
 async def root() -> Any:
     if FRONTEND_DIR.exists() and (FRONTEND_DIR / "index.html").exists():
@@ -229,63 +677,126 @@ async def root() -> Any:
 
 @app.get("/api/health")
 async def health() -> dict[str, Any]:
-    items, generated_at, cached = await cache.get()
+    # Reads cache state only: a probe must never be the request that triggers upstream fetches.
+    warm = bool(cache.items)
     return {
         "status": "ok",
         "version": APP_VERSION,
-        "cached": cached,
-        "cacheAgeSeconds": max(0, int((utc_now() - generated_at).total_seconds())),
-        "items": len(items),
-        "generatedAt": generated_at.isoformat(),
+        "warm": warm,
+        "refreshing": cache.inflight is not None,
+        "generation": cache.generation,
+        "cacheAgeSeconds": max(0, int((utc_now() - cache.generated_at).total_seconds())) if warm else None,
+        "items": len(cache.items),
+        "generatedAt": cache.generated_at.isoformat() if warm else None,
+        "resultCache": result_cache.stats(),
+        "retention": cache.retention.usage(),
+        "timeBuckets": cache.timebuckets.summary(),
+        "streamStats": cache.stats.summary(),
+        "duplicates": cache.clusters.summary() if cache.clusters is not None else None,
+        "trendingMode": "approximate" if cache.heavy_hitters is not None else "exact",
+        "heavyHitters": cache.heavy_hitters.summary() if cache.heavy_hitters is not None else None,
+        "decayedScores": cache.decayed.summary() if cache.decayed is not None else None,
+        "lexiconVersion": lexicon_source.current.version,
+    }
+
+
+@app.get("/api/lexicon")
+async def lexicon_status() -> dict[str, Any]:
+    return {
+        **lexicon_source.current.summary(),
+        "path": str(lexicon_source.path),
+        "pollSeconds": LEXICON_POLL_SECONDS,
+        "error": lexicon_source.error,
+        "indexedTerms": len(cache.terms.postings),
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/dashboard")
-async def dashboard(force_refresh: bool = Query(default=False)) -> dict[str, Any]:
-    items, generated_at, cached = await cache.get(force_refresh=force_refresh)
-    return build_dashboard_payload(items, generated_at, cached)
+async def dashboard(
+    request: Request,
+    fields: str | None = Query(default=None, description="feedPreview projection: full, list or comma-separated fields"),
+    force_refresh: bool = Query(default=False),
+) -> dict[str, Any]:
+    projection = read_projection(fields)
+    snapshot = await read_feed(request, force_refresh)
+    return build_dashboard_view(ViewContext(snapshot), fields=projection)
 
 
 @app.get("/api/feed")
 async def feed(
+    request: Request,
     source: str | None = Query(default=None, description="news or reddit"),
     sentiment: str | None = Query(default=None, description="positive, neutral, negative"),
     ticker: str | None = Query(default=None),
     q: str | None = Query(default=None, description="text search"),
-    limit: int = Query(default=40, ge=1, le=200),
+    limit: int | None = Query(default=None, ge=1, le=FEED_PAGE_MAX),
+    cursor: str | None = Query(default=None, description="nextCursor from a previous page"),
+    output: str = Query(default="json", alias="format", description="json or ndjson"),
+    fields: str | None = Query(default=None, description="full, list or comma-separated item fields"),
     force_refresh: bool = Query(default=False),
-) -> dict[str, Any]:
-    items, generated_at, cached = await cache.get(force_refresh=force_refresh)
-    filtered = filter_items(items, source=source, sentiment=sentiment, ticker=ticker, q=q)
-    return {
-        "generatedAt": generated_at.isoformat(),
-        "cached": cached,
-        "count": len(filtered),
-        "items": [serialize_item(item) for item in filtered[:limit]],
-    }
+) -> Any:
+    projection = read_projection(fields)
+    snapshot = await read_feed(request, force_refresh)
+
+    if output.strip().lower() == "ndjson":
+        start = 0
+        if cursor:
+            position = decode_cursor(cursor)
+            if position is None:
+                raise HTTPException(status_code=400, detail="Cursor is invalid.")
+            start = seek_feed_position(snapshot.items, position)
+        matches = iter_filtered_items(snapshot.items, source=source, sentiment=sentiment, ticker=ticker, q=q, start=start)
+        return StreamingResponse(
+            stream_ndjson(matches, limit, compile_serializer(projection)),
+            media_type="application/x-ndjson",
+            headers={"X-Generation": str(snapshot.generation), "X-Generated-At": snapshot.generated_at.isoformat()},
+        )
+
+    try:
+        return build_feed_view(
+            ViewContext(snapshot),
+            source=source,
+            sentiment=sentiment,
+            ticker=ticker,
+            q=q,
+            limit=limit,
+            cursor=cursor,
+            fields=projection,
+        )
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
 
 
 @app.get("/api/news")
-async def news(force_refresh: bool = Query(default=False), limit: int = Query(default=20, ge=1, le=100)) -> list[dict[str, Any]]:
-    items, _, _ = await cache.get(force_refresh=force_refresh)
-    only_news = [item for item in items if item.source == "news"][:limit]
-    return [legacy_item_payload(item) for item in only_news]
+async def news(
+    request: Request,
+    force_refresh: bool = Query(default=False),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> list[dict[str, Any]]:
+    await read_feed(request, force_refresh)
+    # Retention only changes right before a publish, so its per-source order matches the snapshot just read.
+    return [legacy_item_payload(item) for item in cache.retention.newest("news", limit)]
 
 
 @app.get("/api/reddit")
 async def reddit(
+    request: Request,
     force_refresh: bool = Query(default=False),
     limit: int = Query(default=20, ge=1, le=100),
 ) -> list[dict[str, Any]]:
-    items, _, _ = await cache.get(force_refresh=force_refresh)
-    only_reddit = [item for item in items if item.source == "reddit"][:limit]
-    return [legacy_item_payload(item) for item in only_reddit]
+    await read_feed(request, force_refresh)
+    return [legacy_item_payload(item) for item in cache.retention.newest("reddit", limit)]
 
 
 @app.get("/api/sentiment")
-async def sentiment(force_refresh: bool = Query(default=False)) -> list[dict[str, Any]]:
-    items, _, _ = await cache.get(force_refresh=force_refresh)
-    breakdown = build_sentiment_breakdown(items)
+async def sentiment(request: Request, force_refresh: bool = Query(default=False)) -> list[dict[str, Any]]:
+    snapshot = await read_feed(request, force_refresh)
+    breakdown = snapshot.sentiment_counts or build_sentiment_breakdown(snapshot.items)
     return [
         {"sentiment": "POSITIVE", "count": breakdown["positive"]},
         {"sentiment": "NEGATIVE", "count": breakdown["negative"]},
@@ -294,116 +805,738 @@ async def sentiment(force_refresh: bool = Query(default=False)) -> list[dict[str
 
 
 @app.get("/api/trending-stocks")
-async def trending_stocks(force_refresh: bool = Query(default=False), limit: int = Query(default=15, ge=1, le=50)) -> list[dict[str, Any]]:
-    items, _, _ = await cache.get(force_refresh=force_refresh)
-    return build_ticker_insights(items, top_n=limit)
+async def trending_stocks(
+    request: Request,
+    force_refresh: bool = Query(default=False),
+    limit: int = Query(default=15, ge=1, le=50),
+) -> list[dict[str, Any]]:
+    snapshot = await read_feed(request, force_refresh)
+    return ViewContext(snapshot).ticker_rows()[:limit]
 
 
 @app.get("/api/ticker/{ticker_symbol}")
-async def ticker_detail(ticker_symbol: str, force_refresh: bool = Query(default=False)) -> dict[str, Any]:
-    symbol = sanitize_ticker(ticker_symbol)
-    if not symbol:
-        return {"ticker": ticker_symbol.upper(), "mentions": 0, "items": [], "message": "Ticker symbol is invalid."}
+async def ticker_detail(
+    request: Request,
+    ticker_symbol: str,
+    fields: str | None = Query(default=None, description="full, list or comma-separated item fields"),
+    force_refresh: bool = Query(default=False),
+) -> dict[str, Any]:
+    if not sanitize_ticker(ticker_symbol):
+        return build_ticker_view(None, ticker_symbol)
 
-    items, generated_at, cached = await cache.get(force_refresh=force_refresh)
-    related = [item for item in items if symbol in item.tickers]
-    ticker_insight = next((row for row in build_ticker_insights(items, top_n=200) if row["ticker"] == symbol), None)
-    return {
-        "generatedAt": generated_at.isoformat(),
-        "cached": cached,
-        "ticker": symbol,
-        "mentions": len(related),
-        "snapshot": ticker_insight,
-        "items": [serialize_item(item) for item in related[:40]],
-        "themes": build_theme_insights(related, top_n=6),
-    }
+    projection = read_projection(fields)
+    snapshot = await read_feed(request, force_refresh)
+    return build_ticker_view(ViewContext(snapshot), ticker_symbol, fields=projection)
 
 
 @app.get("/api/watchlist")
 async def watchlist(
+    request: Request,
     tickers: str = Query(default="AAPL,MSFT,NVDA"),
     force_refresh: bool = Query(default=False),
 ) -> dict[str, Any]:
-    requested = [sanitize_ticker(token) for token in tickers.split(",")]
-    requested = [ticker for ticker in requested if ticker]
-    unique_tickers = list(dict.fromkeys(requested))[:25]
-
-    items, generated_at, cached = await cache.get(force_refresh=force_refresh)
-    ticker_index = {row["ticker"]: row for row in build_ticker_insights(items, top_n=300)}
-    payload = []
-    for ticker_symbol in unique_tickers:
-        row = ticker_index.get(ticker_symbol)
-        if row:
-            payload.append(row)
-        else:
-            payload.append(
-                {
-                    "ticker": ticker_symbol,
-                    "mentions": 0,
-                    "averageSentiment": 0,
-                    "bullish": 0,
-                    "bearish": 0,
-                    "neutral": 0,
-                    "momentum": 0,
-                    "hypeScore": 0,
-                    "sourceMix": {},
-                }
-            )
+    snapshot = await read_feed(request, force_refresh)
+    return build_watchlist_view(ViewContext(snapshot), tickers)
 
-    return {
-        "generatedAt": generated_at.isoformat(),
-        "cached": cached,
-        "count": len(payload),
-        "items": payload,
-    }
+
+@app.get("/api/timeline")
+async def timeline(
+    request: Request,
+    window: str = Query(default=TIMELINE_DEFAULT_WINDOW, description="1h, 6h, 24h or 7d"),
+    ticker: str | None = Query(default=None),
+    force_refresh: bool = Query(default=False),
+) -> dict[str, Any]:
+    snapshot = await read_feed(request, force_refresh)
+    try:
+        return build_timeline_view(ViewContext(snapshot), window=window, ticker=ticker)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
 
 
 @app.get("/api/insights")
 async def insights(
+    request: Request,
     ticker: str | None = Query(default=None),
     source: str | None = Query(default=None),
     force_refresh: bool = Query(default=False),
 ) -> dict[str, Any]:
-    items, generated_at, cached = await cache.get(force_refresh=force_refresh)
-    filtered = filter_items(items, source=source, sentiment=None, ticker=ticker, q=None)
+    snapshot = await read_feed(request, force_refresh)
+    return build_insights_view(ViewContext(snapshot), ticker=ticker, source=source)
+
+
+@app.post("/api/watchlist")
+async def watchlist_bulk(
+    request: Request,
+    body: WatchlistRequest,
+    output: str = Query(default="json", alias="format", description="json or ndjson"),
+) -> Any:
+    symbols = normalize_watchlist(body.tickers, WATCHLIST_MAX_TICKERS)
+    snapshot = await read_feed(request, body.force_refresh)
+    rows = lookup_rows(snapshot.ticker_index, symbols, missing_ticker_row)
+    if output.strip().lower() == "ndjson":
+        return StreamingResponse(
+            stream_ndjson(rows, None, lambda row: row),
+            media_type="application/x-ndjson",
+            headers={"X-Generation": str(snapshot.generation), "X-Generated-At": snapshot.generated_at.isoformat()},
+        )
+
+    payload = list(rows)
+    return {**snapshot.meta(), "count": len(payload), "items": payload}
+
+
+@app.get("/api/watchlists")
+async def saved_watchlist_index() -> dict[str, Any]:
+    return {"generation": saved_watchlists.generation, "items": saved_watchlists.summary()}
+
+
+@app.get("/api/watchlists/{name}")
+async def saved_watchlist(request: Request, name: str, force_refresh: bool = Query(default=False)) -> dict[str, Any]:
+    if name not in saved_watchlists.tickers:
+        raise HTTPException(status_code=404, detail="Saved watchlist not found.")
+    snapshot = await read_feed(request, force_refresh)
+    rows = saved_watchlists.rows.get(name, [])
+    return {**snapshot.meta(), "name": name, "count": len(rows), "items": rows}
+
+
+@app.put("/api/watchlists/{name}")
+async def save_watchlist(
+    request: Request,
+    name: str,
+    body: WatchlistRequest,
+    x_admin_token: str | None = Header(default=None),
+) -> dict[str, Any]:
+    require_watchlist_writer(x_admin_token)
+    if not WATCHLIST_NAME_PATTERN.match(name):
+        raise HTTPException(status_code=400, detail="Watchlist names use letters, digits, '-' and '_' (max 64).")
+    symbols = normalize_watchlist(body.tickers, WATCHLIST_MAX_TICKERS)
+    snapshot = await read_feed(request, body.force_refresh)
+    try:
+        saved_watchlists.save(name, symbols, snapshot.ticker_index, snapshot.generation)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+    return {**snapshot.meta(), "name": name, "count": len(symbols), "items": saved_watchlists.rows[name]}
+
+
+@app.delete("/api/watchlists/{name}")
+async def delete_watchlist(name: str, x_admin_token: str | None = Header(default=None)) -> dict[str, Any]:
+    require_watchlist_writer(x_admin_token)
+    if not saved_watchlists.delete(name):
+        raise HTTPException(status_code=404, detail="Saved watchlist not found.")
+    return {"name": name, "deleted": True}
+
+
+@app.post("/api/batch")
+async def batch(request: Request, body: BatchRequest) -> dict[str, Any]:
+    if len(body.views) > BATCH_MAX_VIEWS:
+        raise HTTPException(status_code=400, detail=f"A batch accepts at most {BATCH_MAX_VIEWS} views.")
+
+    snapshot = await read_feed(request, body.force_refresh)
+    # No awaits below: every view sees the same generation and shares one memo of intermediate results.
+    context = ViewContext(snapshot)
+    results = []
+    for view_request in body.views:
+        builder = BATCH_VIEWS.get(view_request.view)
+        if builder is None:
+            results.append({"id": view_request.id, "view": view_request.view, "error": "Unknown view."})
+            continue
+        try:
+            data = builder(context, view_request.params)
+        except (TypeError, ValueError) as error:
+            results.append({"id": view_request.id, "view": view_request.view, "error": str(error)})
+            continue
+        results.append({"id": view_request.id, "view": view_request.view, "data": data})
+
+    return {**snapshot.meta(), "results": results}
+
+
+@app.get("/api/changes")
+async def changes(
+    request: Request,
+    since: int = Query(ge=0, description="last generation the client has applied"),
+    fields: str | None = Query(default=None, description="full, list or comma-separated item fields"),
+    force_refresh: bool = Query(default=False),
+) -> dict[str, Any]:
+    projection = read_projection(fields)
+    snapshot = await read_feed(request, force_refresh)
+    delta = cache.changes_since(since)
+    if delta is None:
+        return {
+            **snapshot.meta(),
+            "since": since,
+            "resync": True,
+            "oldestGeneration": cache.history[0].previous_generation if cache.history else cache.generation,
+        }
+
+    added_ids = set(delta.added)
+    updated_ids = set(delta.updated)
+    serializer = compile_serializer(projection)
+    payload = delta.to_payload()
+    payload.update(
+        {
+            "since": since,
+            "cached": snapshot.cached,
+            "coalesced": snapshot.coalesced,
+            "throttled": snapshot.throttled,
+            "resync": False,
+            "added": [serializer(item) for item in snapshot.items if item.id in added_ids] if added_ids else [],
+            "updated": [serializer(item) for item in snapshot.items if item.id in updated_ids] if updated_ids else [],
+        }
+    )
+    return payload
+
+
+@app.get("/api/stream")
+async def stream(
+    request: Request,
+    since: int | None = Query(default=None, ge=0, description="resume after this generation"),
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    resume_from = since if since is not None else parse_generation(last_event_id)
+
+    async def event_source() -> AsyncIterator[str]:
+        yield f"retry: {STREAM_HEARTBEAT_SECONDS * 1000}\n\n"
+        async for event, generation, payload in iter_generation_events(resume_from):
+            if await request.is_disconnected():
+                break
+            if event == "heartbeat":
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(event, generation, payload)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/api/ws")
+async def stream_websocket(websocket: WebSocket, since: int | None = Query(default=None, ge=0)) -> None:
+    await websocket.accept()
+    try:
+        async for event, generation, payload in iter_generation_events(since):
+            await websocket.send_json({"event": event, "generation": generation, "data": payload})
+    except WebSocketDisconnect:
+        pass
+
+
+@app.get("/api/admin/profiles")
+async def profile_index(x_admin_token: str | None = Header(default=None)) -> dict[str, Any]:
+    return require_profiler(x_admin_token).summary()
+
+
+@app.get("/api/admin/profiles/{profile_id}")
+async def profile_result(
+    profile_id: str,
+    output: str = Query(default="raw", pattern="^(raw|text)$"),
+    x_admin_token: str | None = Header(default=None),
+) -> Response:
+    result = require_profiler(x_admin_token).results.get(profile_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Profile not found.")
+    media_type, body = result.render(output)
+    disposition = "inline" if output == "text" else f'attachment; filename="{result.id}{result.suffix}"'
+    return Response(content=body, media_type=media_type, headers={"Content-Disposition": disposition})
+
+
+@app.post("/api/admin/profile-refresh")
+async def arm_refresh_profile(
+    mode: str = Query(default="cprofile", pattern="^(cprofile|sample)$"),
+    x_admin_token: str | None = Header(default=None),
+) -> dict[str, Any]:
+    active = require_profiler(x_admin_token)
+    active.arm_refresh(mode)
+    return active.summary()
+
+
+@app.get("/api/admin/sampler")
+async def sampled_stacks(
+    reset: bool = Query(default=False),
+    x_admin_token: str | None = Header(default=None),
+) -> PlainTextResponse:
+    active = require_profiler(x_admin_token)
+    if active.sampler is None:
+        raise HTTPException(status_code=404, detail="Set SSD_PROFILING_SAMPLE_HZ to enable the sampler.")
+    body = active.sampler.collapsed()
+    if reset:
+        active.sampler.reset()
+    return PlainTextResponse(body)
+
+
+def require_watchlist_writer(token: str | None) -> None:
+    if not WATCHLIST_WRITE_TOKEN:
+        raise HTTPException(status_code=403, detail="Saved watchlists are read-only; set SSD_WATCHLIST_TOKEN.")
+    if not token or not hmac.compare_digest(token.encode("utf-8"), WATCHLIST_WRITE_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Admin token is invalid.")
+
+
+def require_profiler(token: str | None) -> Profiler:
+    if profiler is None:
+        raise HTTPException(status_code=404, detail="Profiling is disabled.")
+    if not profiler.authorized(token):
+        raise HTTPException(status_code=403, detail="Admin token is invalid.")
+    return profiler
+
+
+async def profile_request(request: Request, call_next: RequestResponseEndpoint) -> Response:
+    """Profile one request when it carries `X-Profile: <admin token>`; streamed bodies are not covered."""
+    assert profiler is not None
+    if not profiler.authorized(request.headers.get("x-profile")):
+        return await call_next(request)
+    mode = request.headers.get("x-profile-mode", "cprofile")
+    session = profiler.begin(mode, f"{request.method} {request.url.path}")
+    if session is None:
+        response = await call_next(request)
+        response.headers["X-Profile-Skipped"] = "busy"
+        return response
+    try:
+        response = await call_next(request)
+    finally:
+        result = profiler.finish(session)
+    response.headers["X-Profile-Id"] = result.id
+    return response
+
+
+if profiler is not None:
+    # Registered only when enabled so requests pay no middleware cost otherwise.
+    app.add_middleware(BaseHTTPMiddleware, dispatch=profile_request)
+
+
+async def read_feed(request: Request, force_refresh: bool) -> FeedSnapshot:
+    """Route-level cache read: forced refreshes spend a token from the caller's bucket or degrade to a cached read."""
+    throttled = False
+    if force_refresh and not force_refresh_limiter.allow(client_key(request)):
+        force_refresh, throttled = False, True
+    snapshot = await cache.get(force_refresh=force_refresh)
+    snapshot.throttled = snapshot.throttled or throttled
+    return snapshot
+
+
+def client_key(request: Request) -> str:
+    forwarded = request.headers.get("x-forwarded-for", "") if TRUSTED_PROXY_HOPS else ""
+    if forwarded:
+        # Each trusted proxy appends the address it saw, so the client is that many entries from the right;
+        # anything further left came from the client and can be forged.
+        hops = [hop.strip() for hop in forwarded.split(",")]
+        return hops[max(0, len(hops) - TRUSTED_PROXY_HOPS)]
+    return request.client.host if request.client else "unknown"
+
+
+async def iter_generation_events(resume_from: int | None) -> AsyncIterator[tuple[str, int, dict[str, Any]]]:
+    queue = broadcaster.subscribe()
+    try:
+        last_sent = cache.generation
+        if resume_from is None:
+            yield "hello", cache.generation, {"generation": cache.generation, "generatedAt": cache.generated_at.isoformat()}
+        else:
+            replay = cache.deltas_since(resume_from)
+            if replay is None:
+                yield "resync", cache.generation, {"generation": cache.generation, "reason": "history-exhausted"}
+            else:
+                for delta in replay:
+                    yield "delta", delta.generation, delta.to_payload()
+
+        while True:
+            try:
+                delta = await asyncio.wait_for(queue.get(), timeout=STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield "heartbeat", last_sent, {}
+                continue
+
+            if delta is None:
+                last_sent = cache.generation
+                yield "resync", cache.generation, {"generation": cache.generation, "reason": "slow-consumer"}
+                continue
+            if delta.generation <= last_sent:
+                continue
+            last_sent = delta.generation
+            yield "delta", delta.generation, delta.to_payload()
+    finally:
+        broadcaster.unsubscribe(queue)
+
+
+async def refresh_while_streaming() -> None:
+    # Nothing else drives refreshes once clients stop polling, so keep the cache warm while anyone listens.
+    while True:
+        await asyncio.sleep(STREAM_REFRESH_POLL_SECONDS)
+        if not broadcaster.subscribers:
+            continue
+        try:
+            await cache.get()
+        except Exception:
+            continue
+
+
+async def monitor_event_loop_lag(interval: float = EVENT_LOOP_LAG_INTERVAL_SECONDS) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - started - interval))
+
+
+async def watch_lexicon(interval: float = LEXICON_POLL_SECONDS) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await reload_lexicon()
+
+
+async def reload_lexicon() -> list[str]:
+    try:
+        swapped = lexicon_source.poll()
+    except (OSError, ValueError, TypeError, AttributeError) as error:
+        # A half-written or malformed file keeps the current lexicon until the next edit.
+        LEXICON_RELOADS.labels("error").inc()
+        lexicon_source.error = str(error)
+        return []
+    if swapped is None:
+        return []
+    LEXICON_RELOADS.labels("ok").inc()
+    lexicon_source.error = None
+    return await cache.apply_lexicon(*swapped)
+
+
+def collect_runtime_metrics() -> None:
+    PROCESS_RSS.set(process_rss_bytes())
+    CACHE_ITEMS.set(len(cache.items))
+    CACHE_GENERATION.set(cache.generation)
+    CACHE_AGE.set((utc_now() - cache.generated_at).total_seconds() if cache.items else 0)
+    STREAM_SUBSCRIBERS.set(len(broadcaster.subscribers))
+    stats = result_cache.stats()
+    # ResultCache keeps its own monotonic totals; mirror them rather than counting twice.
+    RESULT_CACHE_LOOKUPS.labels("hit").value = stats["hits"]
+    RESULT_CACHE_LOOKUPS.labels("miss").value = stats["misses"]
+    RESULT_CACHE_SIZE.set(stats["entries"])
+    retention = cache.retention
+    for source in RETENTION_BYTES.children.keys() - {(source,) for source in retention.source_items}:
+        RETENTION_BYTES.labels(*source).set(0)
+        RETENTION_ITEMS.labels(*source).set(0)
+    for source, count in retention.source_items.items():
+        RETENTION_ITEMS.labels(source).set(count)
+        RETENTION_BYTES.labels(source).set(retention.source_bytes[source])
+    for reason, count in retention.evictions.items():
+        RETENTION_EVICTIONS.labels(reason).value = count
+
+
+async def stream_ndjson(
+    matches: Iterator[Any],
+    limit: int | None,
+    serializer: Callable[[Any], dict[str, Any]],
+) -> AsyncIterator[str]:
+    emitted = 0
+    last_item: Any = None
+    batch: list[str] = []
+    encode_time = STAGE_SECONDS.labels("serialize_ndjson")
+    started = perf_counter()
+    for item in matches:
+        if limit is not None and emitted >= limit:
+            # Only written when the page was cut short, so readers know where to resume.
+            if last_item is not None:
+                batch.append(json.dumps({"nextCursor": encode_cursor(last_item)}) + "\n")
+            break
+        batch.append(json.dumps(serializer(item), ensure_ascii=False) + "\n")
+        emitted += 1
+        last_item = item
+        if len(batch) >= NDJSON_BATCH_SIZE:
+            encode_time.observe(perf_counter() - started)
+            yield "".join(batch)
+            batch = []
+            await asyncio.sleep(0)
+            started = perf_counter()
+    if batch:
+        encode_time.observe(perf_counter() - started)
+        yield "".join(batch)
+
+
+def format_sse(event: str, generation: int, payload: dict[str, Any]) -> str:
+    data = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return f"id: {generation}\nevent: {event}\ndata: {data}\n\n"
+
+
+def parse_generation(value: str | None) -> int | None:
+    if not value:
+        return None
+    try:
+        return max(0, int(value.strip()))
+    except ValueError:
+        return None
+
+
+class ViewContext:
+    """One cache generation plus a memo of intermediate aggregates shared by every view built from it.
+
+    Lookups fall through to the process-wide `result_cache`, so repeated queries against the same
+    generation are served without recomputing filters, rankings or serialized pages.
+    """
+
+    __slots__ = ("snapshot", "memo")
+
+    def __init__(self, snapshot: FeedSnapshot):
+        self.snapshot = snapshot
+        self.memo: dict[tuple[Any, ...], Any] = {}
+
+    def cached(self, key: tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+        if key not in self.memo:
+            self.memo[key] = result_cache.get_or_compute(self.snapshot.generation, key, factory)
+        return self.memo[key]
+
+    def filtered(
+        self,
+        source: str | None = None,
+        sentiment: str | None = None,
+        ticker: str | None = None,
+        q: str | None = None,
+    ) -> list[EnrichedFeedItem]:
+        filters = normalize_filters(source, sentiment, ticker, q)
+        return self.cached(("filtered", *filters), lambda: filter_items(self.snapshot.items, *filters))
+
+    def ticker_rows(self, *filters: str | None) -> list[dict[str, Any]]:
+        """Full ranked ticker rows for a filtered subset; callers slice their own top-N."""
+        key = normalize_filters(*filters) if filters else ("", "", "", "")
+        if not any(key):
+            return self.cached(("tickers",), lambda: list(self.snapshot.ticker_index.values()))
+        return self.cached(("tickers", *key), lambda: build_ticker_insights(self.filtered(*key), top_n=None))
+
+    def ticker_index(self) -> dict[str, dict[str, Any]]:
+        # Built once per generation by FeedCache.publish, in ranking order.
+        return self.snapshot.ticker_index
+
+
+def normalize_filters(
+    source: str | None = None,
+    sentiment: str | None = None,
+    ticker: str | None = None,
+    q: str | None = None,
+) -> tuple[str, str, str, str]:
+    return (
+        (source or "").strip().lower(),
+        (sentiment or "").strip().lower(),
+        sanitize_ticker(ticker) if ticker else "",
+        (q or "").strip().lower(),
+    )
+
+
+def build_dashboard_view(context: ViewContext, fields: tuple[str, ...] = ITEM_FIELDS) -> dict[str, Any]:
+    snapshot = context.snapshot
+    body = context.cached(
+        ("view:dashboard", fields),
+        lambda: build_dashboard_payload(
+            snapshot.items,
+            snapshot.generated_at,
+            snapshot.cached,
+            ticker_rows=context.ticker_rows()[:12],
+            serializer=compile_serializer(fields),
+            overview=snapshot.overview or None,
+            theme_rows=snapshot.theme_rows,
+            timeline=snapshot.timeline,
+            narratives=snapshot.narratives,
+            sentiment_breakdown=snapshot.sentiment_counts,
+            source_breakdown=snapshot.source_counts,
+        ),
+    )
+    return {**body, **snapshot.meta()}
+
+
+def build_feed_view(
+    context: ViewContext,
+    source: str | None = None,
+    sentiment: str | None = None,
+    ticker: str | None = None,
+    q: str | None = None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    fields: tuple[str, ...] = ITEM_FIELDS,
+) -> dict[str, Any]:
+    filters = normalize_filters(source, sentiment, ticker, q)
+    serializer = compile_serializer(fields)
+    page_size = bounded_int(limit, FEED_PAGE_SIZE, 1, FEED_PAGE_MAX)
+
+    start = 0
+    if cursor:
+        position = decode_cursor(cursor)
+        if position is None:
+            raise ValueError("Cursor is invalid.")
+        start = seek_feed_position(context.filtered(*filters), position)
+
+    def build_page() -> dict[str, Any]:
+        filtered = context.filtered(*filters)
+        page = filtered[start : start + page_size]
+        has_more = start + page_size < len(filtered)
+        return {
+            "count": len(filtered),
+            "items": serialize_items(page, serializer),
+            "nextCursor": encode_cursor(page[-1]) if has_more and page else None,
+        }
+
+    body = context.cached(("view:feed", *filters, start, page_size, fields), build_page)
+    return {**context.snapshot.meta(), **body}
+
+
+def build_ticker_view(
+    context: ViewContext | None,
+    ticker_symbol: str,
+    fields: tuple[str, ...] = ITEM_FIELDS,
+) -> dict[str, Any]:
+    symbol = sanitize_ticker(ticker_symbol)
+    if context is None or not symbol:
+        return {"ticker": ticker_symbol.upper(), "mentions": 0, "items": [], "message": "Ticker symbol is invalid."}
+
+    serializer = compile_serializer(fields)
+
+    def build_body() -> dict[str, Any]:
+        related = context.filtered(ticker=symbol)
+        return {
+            "ticker": symbol,
+            "mentions": len(related),
+            "snapshot": context.ticker_index().get(symbol),
+            "items": serialize_items(related[:40], serializer),
+            "themes": build_theme_insights(related, top_n=6),
+        }
+
+    return {**context.snapshot.meta(), **context.cached(("view:ticker", symbol, fields), build_body)}
+
 
+def build_watchlist_view(
+    context: ViewContext,
+    tickers: str | list[str],
+    max_tickers: int = WATCHLIST_QUERY_MAX,
+) -> dict[str, Any]:
+    symbols = normalize_watchlist(tickers, max_tickers)
+    payload = list(lookup_rows(context.ticker_index(), symbols, missing_ticker_row))
     return {
-        "generatedAt": generated_at.isoformat(),
-        "cached": cached,
-        "itemCount": len(filtered),
-        "sentimentIndex": compute_sentiment_index(filtered),
-        "themes": build_theme_insights(filtered, top_n=8),
-        "trendingTickers": build_ticker_insights(filtered, top_n=10),
-        "narratives": build_narratives(filtered, limit=6),
+        **context.snapshot.meta(),
+        "count": len(payload),
+        "items": payload,
     }
 
 
+def normalize_watchlist(tickers: str | list[str], max_tickers: int) -> list[str]:
+    tokens = tickers.split(",") if isinstance(tickers, str) else tickers
+    requested = (sanitize_ticker(str(token)) for token in tokens)
+    return list(dict.fromkeys(ticker for ticker in requested if ticker))[:max_tickers]
+
+
+def build_timeline_view(
+    context: ViewContext,
+    window: str = TIMELINE_DEFAULT_WINDOW,
+    ticker: str | None = None,
+) -> dict[str, Any]:
+    window = window.strip().lower()
+    if window not in TIMELINE_WINDOWS:
+        raise ValueError(f"Unknown window; choose from {', '.join(TIMELINE_WINDOWS)}.")
+    symbol = sanitize_ticker(ticker) if ticker else ""
+    if ticker and not symbol:
+        raise ValueError("Ticker symbol is invalid.")
+
+    def build_body() -> dict[str, Any]:
+        now = utc_now()
+        buckets = cache.timebuckets
+        if symbol and not buckets.track_tickers:
+            # Approximate mode keeps no per-ticker buckets; rebuild them from the symbol's retained items.
+            buckets = TimeBuckets()
+            record_time_buckets(buckets, context.filtered(ticker=symbol))
+        return {
+            "window": window,
+            "ticker": symbol or None,
+            "points": build_window_timeline(buckets, window, now, symbol or None),
+            "momentum": build_window_momentum(buckets, window, now, symbol or None),
+        }
+
+    return {**context.snapshot.meta(), **context.cached(("view:timeline", window, symbol), build_body)}
+
+
+def build_insights_view(context: ViewContext, ticker: str | None = None, source: str | None = None) -> dict[str, Any]:
+    filters = normalize_filters(source=source, ticker=ticker)
+
+    def build_body() -> dict[str, Any]:
+        filtered = context.filtered(*filters)
+        return {
+            "itemCount": len(filtered),
+            "sentimentIndex": compute_sentiment_index(filtered),
+            "themes": build_theme_insights(filtered, top_n=8),
+            "trendingTickers": context.ticker_rows(*filters)[:10],
+            "narratives": build_narratives(filtered, limit=6),
+        }
+
+    return {**context.snapshot.meta(), **context.cached(("view:insights", *filters), build_body)}
+
+
+BATCH_VIEWS: dict[str, Callable[[ViewContext, dict[str, Any]], dict[str, Any]]] = {
+    "dashboard": lambda context, params: build_dashboard_view(context, fields=parse_fields(params.get("fields"))),
+    "feed": lambda context, params: build_feed_view(
+        context,
+        source=params.get("source"),
+        sentiment=params.get("sentiment"),
+        ticker=params.get("ticker"),
+        q=params.get("q"),
+        limit=params.get("limit"),
+        cursor=params.get("cursor"),
+        fields=parse_fields(params.get("fields")),
+    ),
+    "ticker": lambda context, params: build_ticker_view(
+        context,
+        str(params.get("symbol", "")),
+        fields=parse_fields(params.get("fields")),
+    ),
+    "watchlist": lambda context, params: build_watchlist_view(context, params.get("tickers", "AAPL,MSFT,NVDA")),
+    "insights": lambda context, params: build_insights_view(context, ticker=params.get("ticker"), source=params.get("source")),
+    "trending": lambda context, params: {"items": context.ticker_rows()[: bounded_int(params.get("limit"), 15, 1, 50)]},
+    "timeline": lambda context, params: build_timeline_view(
+        context,
+        window=str(params.get("window", TIMELINE_DEFAULT_WINDOW)),
+        ticker=params.get("ticker"),
+    ),
+}
+
+
 async def fetch_all_sources() -> list[RawFeedItem]:
     timeout = aiohttp.ClientTimeout(total=12)
     async with aiohttp.ClientSession(timeout=timeout) as session:
-        news_task = asyncio.create_task(fetch_rss(session, NEWS_RSS_URL))
-        reddit_task = asyncio.create_task(fetch_rss(session, REDDIT_RSS_URL))
+        news_task = asyncio.create_task(fetch_rss(session, NEWS_RSS_URL, feed="news"))
+        reddit_task = asyncio.create_task(fetch_rss(session, REDDIT_RSS_URL, feed="reddit"))
         news_xml, reddit_xml = await asyncio.gather(news_task, reddit_task)
 
     news_items = parse_news_feed(news_xml) if news_xml else []
     reddit_items = parse_reddit_feed(reddit_xml) if reddit_xml else []
 
-    items = sorted(news_items + reddit_items, key=lambda item: item.published_at, reverse=True)
-    if items:
-        return items[:MAX_ITEMS]
-    return fallback_items()
+    return sorted(news_items + reddit_items, key=lambda item: item.published_at, reverse=True)
 
 
-async def fetch_rss(session: aiohttp.ClientSession, url: str) -> str:
+async def fetch_rss(session: aiohttp.ClientSession, url: str, feed: str = "other") -> str:
+    started = perf_counter()
+    outcome = "error"
+    validators = feed_validators.get(url)
+    headers = dict(RSS_HEADERS)
+    if validators is not None:
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
     try:
-        async with session.get(url, headers=RSS_HEADERS) as response:
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and validators is not None:
+                outcome = "not_modified"
+                return validators.body
             if response.status >= 400:
+                outcome = "http_error"
                 return ""
-            return await response.text()
+            body = await response.read()
+            FETCH_BYTES.labels(feed).inc(len(body))
+            text = body.decode(response.get_encoding(), errors="replace")
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+            if etag or last_modified:
+                feed_validators[url] = FeedValidators(etag=etag, last_modified=last_modified, body=text)
+            else:
+                feed_validators.pop(url, None)
+            outcome = "ok"
+            return text
     except Exception:
         return ""
+    finally:
+        FETCH_SECONDS.labels(feed, outcome).observe(perf_counter() - started)
 
 
+@timed(STAGE_SECONDS, "xml_parse_news")
 def parse_news_feed(xml: str) -> list[RawFeedItem]:
     soup = BeautifulSoup(xml, "xml")
     items: list[RawFeedItem] = []
@@ -417,7 +1550,7 @@ def parse_news_feed(xml: str) -> list[RawFeedItem]:
             continue
         items.append(
             RawFeedItem(
-                id=str(uuid.uuid4()),
+                id=f"news-{stable_hash(title + url)}",
                 source="news",
                 title=title,
                 url=url,
@@ -428,6 +1561,7 @@ def parse_news_feed(xml: str) -> list[RawFeedItem]:
     return items
 
 
+@timed(STAGE_SECONDS, "xml_parse_reddit")
 def parse_reddit_feed(xml: str) -> list[RawFeedItem]:
     soup = BeautifulSoup(xml, "xml")
     entries: list[RawFeedItem] = []
@@ -442,7 +1576,7 @@ def parse_reddit_feed(xml: str) -> list[RawFeedItem]:
             continue
         entries.append(
             RawFeedItem(
-                id=str(uuid.uuid4()),
+                id=f"reddit-{stable_hash(title + url)}",
                 source="reddit",
                 title=title,
                 url=url,
@@ -502,7 +1636,7 @@ def fallback_items() -> list[RawFeedItem]:
 
     return [
         RawFeedItem(
-            id=str(uuid.uuid4()),
+            id=f"fallback-{stable_hash(row['title'])}",
             source=row["source"],
             title=row["title"],
             url=row["url"],
@@ -513,127 +1647,236 @@ def fallback_items() -> list[RawFeedItem]:
     ]
 
 
-def enrich_item(item: RawFeedItem) -> EnrichedFeedItem:
-    label, score, confidence = analyze_sentiment(item.text)
-    tickers = extract_tickers(f"{item.title} {item.text}")
-    themes = extract_themes(item.text)
-    summary = summarize_text(item.text)
+@timed(STAGE_SECONDS, "dedupe")
+def partition_duplicates(
+    clusters: DuplicateClusters,
+    items: list[RawFeedItem],
+) -> tuple[list[RawFeedItem], set[str], dict[str, list[str]]]:
+    """Split fresh items into those to enrich and near-duplicates folded into a cluster.
+
+    Also returns the ids of the clusters that grew and the tickers of each item to enrich, which clustering
+    already had to extract.
+    """
+    unique = []
+    grown = set()
+    tickers = {}
+    # Oldest first, so the earliest copy of a story becomes its cluster's canonical item.
+    for item in sorted(items, key=lambda item: (item.published_at, item.id)):
+        symbols = extract_tickers(f"{item.title} {item.text}")
+        canonical = clusters.assign(item.id, f"{item.title} {item.text}", frozenset(symbols))
+        if canonical is None:
+            unique.append(item)
+            tickers[item.id] = symbols
+        else:
+            grown.add(canonical)
+    DUPLICATES_FOLDED.inc(len(items) - len(unique))
+    return unique, grown, tickers
+
+
+def enrich_all(
+    raw_items: list[RawFeedItem],
+    tickers: dict[str, list[str]] | None = None,
+) -> list[EnrichedFeedItem]:
+    """Enrich while draining `raw_items`, so each raw copy is released as soon as its item is built.
+
+    `tickers` holds already extracted tickers by item id; those items skip ticker extraction.
+    """
+    raw_items.reverse()
+    enriched = []
+    while raw_items:
+        item = raw_items.pop()
+        enriched.append(enrich_item(item, tickers.get(item.id) if tickers else None))
+    return enriched
+
+
+@timed(STAGE_SECONDS, "enrich_item")
+def enrich_item(item: RawFeedItem, tickers: list[str] | None = None) -> EnrichedFeedItem:
+    text = item.text  # parsers and fallback items already normalize whitespace
+    label, score, confidence = analyze_sentiment(text)
+    if tickers is None:
+        tickers = extract_tickers(f"{item.title} {text}")
+    themes = extract_themes(text)
     return EnrichedFeedItem(
         id=item.id,
-        source=item.source,
+        source=sys.intern(item.source),
         title=item.title,
         url=item.url,
         published_at=item.published_at,
-        text=item.text,
-        summary=summary,
-        sentiment_label=label,
+        body=text_codec.encode(text),
+        summary_length=summary_length(text),
+        sentiment_label=sys.intern(label),
         sentiment_score=score,
         sentiment_confidence=confidence,
-        tickers=tickers,
-        themes=themes,
+        tickers=intern_all(tickers),
+        themes=intern_all(themes),
     )
 
 
-def analyze_sentiment(text: str) -> tuple[str, float, float]:
-    tokens = re.findall(r"[a-z][a-z\-']*", text.lower())
-    if not tokens:
-        return "neutral", 0.0, 0.2
-
-    score = 0.0
-    intensity = 1.0
-    for token in tokens:
-        if token in INTENSIFIERS:
-            intensity = 1.35
-            continue
-
-        delta = 0.0
-        if token in POSITIVE_WEIGHTS:
-            delta = POSITIVE_WEIGHTS[token]
-        elif token in NEGATIVE_WEIGHTS:
-            delta = -NEGATIVE_WEIGHTS[token]
-
-        if delta:
-            score += delta * intensity
-        intensity = 1.0
+def rescore_item(item: EnrichedFeedItem) -> EnrichedFeedItem:
+    """Re-run the lexicon-dependent enrichment steps on a cached item; text, summary and body are kept."""
+    text = item.text
+    label, score, confidence = analyze_sentiment(text)
+    return replace(
+        item,
+        sentiment_label=sys.intern(label),
+        sentiment_score=score,
+        sentiment_confidence=confidence,
+        tickers=intern_all(extract_tickers(f"{item.title} {text}")),
+        themes=intern_all(extract_themes(text)),
+    )
 
-    base = max(2.4, math.sqrt(len(tokens) + 1.0))
-    normalized = max(-1.0, min(1.0, score / base))
 
-    if normalized >= 0.18:
-        label = "positive"
-    elif normalized <= -0.18:
-        label = "negative"
-    else:
-        label = "neutral"
-
-    confidence = min(0.99, abs(normalized) * 1.45 + min(0.3, len(tokens) / 110.0))
-    return label, round(normalized, 4), round(confidence, 4)
+@timed(STAGE_SECONDS, "enrich_sentiment")
+def analyze_sentiment(text: str) -> tuple[str, float, float]:
+    return lexicon_source.current.analyze(text)
 
 
+@timed(STAGE_SECONDS, "enrich_tickers")
 def extract_tickers(text: str) -> list[str]:
-    found: set[str] = set()
-    for match in re.findall(r"\$?[A-Z]{1,5}\b", text):
-        token = match.lstrip("$").strip().upper()
-        if token in TICKER_NOISE:
-            continue
-        if len(token) == 1 and token not in {"C", "F", "T"}:
-            continue
-        found.add(token)
-
-    lowered = text.lower()
-    for company_name, ticker in COMPANY_TO_TICKER.items():
-        if company_name in lowered:
-            found.add(ticker)
-
-    return sorted(found)[:10]
+    return lexicon_source.current.tickers(text)
 
 
+@timed(STAGE_SECONDS, "enrich_themes")
 def extract_themes(text: str) -> list[str]:
-    lowered = text.lower()
-    themes = []
-    for theme, keywords in THEME_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
-            themes.append(theme)
-    return themes
+    return lexicon_source.current.match_themes(text)
 
 
-def summarize_text(text: str, max_length: int = 180) -> str:
-    clean = normalize_whitespace(text)
-    if len(clean) <= max_length:
-        return clean
-    return clean[: max_length - 1].rstrip() + "…"
+@timed(STAGE_SECONDS, "enrich_summary")
+def summary_length(text: str, max_length: int = SUMMARY_MAX_LENGTH) -> int:
+    """Length of the summary prefix of normalized `text`; anything shorter than the text gets an ellipsis."""
+    if len(text) <= max_length:
+        return len(text)
+    return len(text[: max_length - 1].rstrip())
 
 
-def build_dashboard_payload(items: list[EnrichedFeedItem], generated_at: datetime, cached: bool) -> dict[str, Any]:
-    sentiment_breakdown = build_sentiment_breakdown(items)
-    source_breakdown = build_source_breakdown(items)
-    ticker_insights = build_ticker_insights(items, top_n=12)
-    theme_insights = build_theme_insights(items, top_n=10)
+@timed(STAGE_SECONDS, "build_dashboard_payload")
+def build_dashboard_payload(
+    items: list[EnrichedFeedItem],
+    generated_at: datetime,
+    cached: bool,
+    ticker_rows: list[dict[str, Any]] | None = None,
+    serializer: Callable[[EnrichedFeedItem], dict[str, Any]] | None = None,
+    overview: dict[str, Any] | None = None,
+    theme_rows: list[dict[str, Any]] | None = None,
+    timeline: list[dict[str, Any]] | None = None,
+    narratives: list[dict[str, Any]] | None = None,
+    sentiment_breakdown: dict[str, int] | None = None,
+    source_breakdown: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    serializer = serializer or serialize_item
+    if sentiment_breakdown is None:
+        sentiment_breakdown = build_sentiment_breakdown(items)
+    if source_breakdown is None:
+        source_breakdown = build_source_breakdown(items)
+    ticker_insights = ticker_rows if ticker_rows is not None else build_ticker_insights(items, top_n=12)
+    theme_insights = theme_rows[:10] if theme_rows is not None else build_theme_insights(items, top_n=10)
 
     return {
         "generatedAt": generated_at.isoformat(),
         "cached": cached,
-        "overview": {
-            "totalItems": len(items),
-            "sentimentIndex": compute_sentiment_index(items),
-            "volatilityIndex": compute_volatility_index(items),
-            "activeTickers": len({ticker for item in items for ticker in item.tickers}),
-            "positiveRatio": ratio(sentiment_breakdown["positive"], len(items)),
-            "negativeRatio": ratio(sentiment_breakdown["negative"], len(items)),
-            "neutralRatio": ratio(sentiment_breakdown["neutral"], len(items)),
-            "marketPulse": describe_market_pulse(items),
-            "trendDirection": describe_trend_direction(items),
-        },
+        "overview": overview if overview is not None else build_overview(items),
         "sentiment": sentiment_breakdown,
         "sources": source_breakdown,
-        "timeline": build_timeline(items, buckets=10),
+        "timeline": timeline if timeline is not None else build_timeline(items, buckets=10),
         "trending": ticker_insights,
         "themes": theme_insights,
-        "narratives": build_narratives(items, limit=8),
-        "feedPreview": [serialize_item(item) for item in items[:15]],
+        "narratives": narratives if narratives is not None else build_narratives(items, limit=8),
+        "feedPreview": serialize_items(items[:15], serializer),
     }
 
 
+@timed(STAGE_SECONDS, "build_overview")
+def build_overview(items: list[EnrichedFeedItem]) -> dict[str, Any]:
+    return build_stats_overview(collect_stream_stats(items))
+
+
+def collect_stream_stats(items: Iterable[EnrichedFeedItem]) -> StreamStats:
+    stats = StreamStats()
+    record_stream_stats(stats, items)
+    return stats
+
+
+def record_stream_stats(stats: StreamStats, items: Iterable[EnrichedFeedItem], remove: bool = False) -> None:
+    record = stats.remove if remove else stats.add
+    for item in items:
+        record(
+            item.published_at.timestamp(),
+            item.sentiment_score,
+            tickers=item.tickers,
+            themes=item.themes,
+            source=item.source,
+            label=item.sentiment_label,
+        )
+
+
+def build_stats_overview(stats: StreamStats) -> dict[str, Any]:
+    """The dashboard overview from running moments: O(groups + chunks), however many items are retained."""
+    total = stats.total
+    index = round(total.mean * 100, 2) if total.count else 0.0
+    return {
+        "totalItems": total.count,
+        "sentimentIndex": index,
+        "volatilityIndex": round(total.stdev * 100, 2) if total.count >= 2 else 0.0,
+        "activeTickers": len(stats.tickers),
+        "positiveRatio": ratio(stats.labels.get("positive").count, total.count),
+        "negativeRatio": ratio(stats.labels.get("negative").count, total.count),
+        "neutralRatio": ratio(stats.labels.get("neutral").count, total.count),
+        "marketPulse": describe_sentiment_index(index),
+        "trendDirection": describe_trend_direction(*stats.halves()) if total.count >= 6 else "flat",
+    }
+
+
+def build_stats_sentiment_breakdown(stats: StreamStats) -> dict[str, int]:
+    counts = {"positive": 0, "negative": 0, "neutral": 0}
+    counts.update((label, moments.count) for label, moments in stats.labels)
+    return counts
+
+
+def build_stats_source_breakdown(stats: StreamStats) -> dict[str, int]:
+    return {"news": stats.sources.get("news").count, "reddit": stats.sources.get("reddit").count}
+
+
+def build_stats_theme_rows(stats: StreamStats, top_n: int = 10) -> list[dict[str, Any]]:
+    ranked = sorted(stats.themes, key=lambda pair: pair[1].count, reverse=True)[:top_n]
+    return [
+        {"theme": theme, "mentions": moments.count, "averageSentiment": round(moments.mean * 100, 2)}
+        for theme, moments in ranked
+    ]
+
+
+@timed(STAGE_SECONDS, "diff_generations")
+def diff_generations(
+    previous_items: list[EnrichedFeedItem],
+    items: list[EnrichedFeedItem],
+    *,
+    previous_overview: dict[str, Any],
+    overview: dict[str, Any],
+    previous_tickers: dict[str, dict[str, Any]],
+    ticker_rows: list[dict[str, Any]],
+    previous_trending: list[str],
+) -> GenerationDelta:
+    previous_ids = {item.id for item in previous_items}
+    current_ids = {item.id for item in items}
+    trending = [row["ticker"] for row in ticker_rows[:12]]
+    current_tickers = {row["ticker"] for row in ticker_rows}
+    # Clients only hold rows for the previous top list, so a ticker entering it needs its row even if unchanged.
+    entering = set(trending).difference(previous_trending)
+
+    return GenerationDelta(
+        generation=0,
+        previous_generation=0,
+        generated_at=utc_now(),
+        added=[item.id for item in items if item.id not in previous_ids],
+        removed=[item.id for item in previous_items if item.id not in current_ids],
+        overview={key: value for key, value in overview.items() if previous_overview.get(key) != value},
+        tickers=[
+            row for row in ticker_rows if row["ticker"] in entering or previous_tickers.get(row["ticker"]) != row
+        ],
+        removed_tickers=[ticker for ticker in previous_tickers if ticker not in current_tickers],
+        trending=trending if trending != previous_trending else None,
+    )
+
+
 def build_sentiment_breakdown(items: list[EnrichedFeedItem]) -> dict[str, int]:
     counts = {"positive": 0, "negative": 0, "neutral": 0}
     for item in items:
@@ -653,15 +1896,7 @@ def compute_sentiment_index(items: list[EnrichedFeedItem]) -> float:
     return round(avg * 100, 2)
 
 
-def compute_volatility_index(items: list[EnrichedFeedItem]) -> float:
-    if len(items) < 2:
-        return 0.0
-    std = pstdev(item.sentiment_score for item in items)
-    return round(std * 100, 2)
-
-
-def describe_market_pulse(items: list[EnrichedFeedItem]) -> str:
-    index = compute_sentiment_index(items)
+def describe_sentiment_index(index: float) -> str:
     if index >= 22:
         return "Risk-on momentum"
     if index >= 8:
@@ -673,16 +1908,10 @@ def describe_market_pulse(items: list[EnrichedFeedItem]) -> str:
     return "Balanced / mixed"
 
 
-def describe_trend_direction(items: list[EnrichedFeedItem]) -> str:
-    if len(items) < 6:
+def describe_trend_direction(older: Moments, newer: Moments) -> str:
+    if not older.count or not newer.count:
         return "flat"
-    ordered = sorted(items, key=lambda item: item.published_at)
-    midpoint = len(ordered) // 2
-    first_half = ordered[:midpoint]
-    second_half = ordered[midpoint:]
-    first_score = sum(item.sentiment_score for item in first_half) / max(1, len(first_half))
-    second_score = sum(item.sentiment_score for item in second_half) / max(1, len(second_half))
-    delta = second_score - first_score
+    delta = newer.mean - older.mean
     if delta > 0.1:
         return "improving"
     if delta < -0.1:
@@ -690,6 +1919,7 @@ def describe_trend_direction(items: list[EnrichedFeedItem]) -> str:
     return "flat"
 
 
+@timed(STAGE_SECONDS, "build_timeline")
 def build_timeline(items: list[EnrichedFeedItem], buckets: int = 10) -> list[dict[str, Any]]:
     if not items:
         return []
@@ -727,7 +1957,100 @@ def build_timeline(items: list[EnrichedFeedItem], buckets: int = 10) -> list[dic
     return timeline[-buckets:]
 
 
-def build_ticker_insights(items: list[EnrichedFeedItem], top_n: int = 12) -> list[dict[str, Any]]:
+def record_time_buckets(buckets: TimeBuckets, items: Iterable[EnrichedFeedItem], remove: bool = False) -> None:
+    record = buckets.remove if remove else buckets.add
+    for item in items:
+        record(
+            item.published_at.timestamp(),
+            item.sentiment_score,
+            item.sentiment_confidence,
+            item.sentiment_label,
+            item.tickers,
+        )
+
+
+def build_window_timeline(
+    buckets: TimeBuckets,
+    window: str,
+    now: datetime,
+    ticker: str | None = None,
+) -> list[dict[str, Any]]:
+    span, step = TIMELINE_WINDOWS[window]
+    label_format = "%b %d %H:%M" if step < 86400 else "%b %d"
+    points = []
+    for start, bucket in buckets.window(now.timestamp(), span, step):
+        started_at = datetime.fromtimestamp(start, tz=timezone.utc)
+        average = bucket.average_score(ticker)
+        mentions = bucket.mentions(ticker)
+        lead = bucket.ticker_counts.most_common(1)
+        points.append(
+            {
+                "time": started_at.isoformat(),
+                "label": started_at.strftime(label_format),
+                "sentiment": round(average * 100, 2) if average is not None else None,
+                "confidence": round(bucket.confidence_sum / bucket.count * 100, 2) if bucket.count else None,
+                "mentions": mentions,
+                "positive": bucket.positive,
+                "negative": bucket.negative,
+                "leadTicker": lead[0][0] if lead else "",
+            }
+        )
+    return points
+
+
+def build_dashboard_timeline(buckets: TimeBuckets, now: datetime) -> list[dict[str, Any]]:
+    points = build_window_timeline(buckets, DASHBOARD_TIMELINE_WINDOW, now)
+    return [point for point in points if point["mentions"]]
+
+
+def build_window_momentum(
+    buckets: TimeBuckets,
+    window: str,
+    now: datetime,
+    ticker: str | None = None,
+) -> dict[str, Any]:
+    span, _ = TIMELINE_WINDOWS[window]
+    current, previous = buckets.compare(now.timestamp(), span)
+    return {
+        "current": describe_bucket(current, ticker),
+        "previous": describe_bucket(previous, ticker),
+        **compare_buckets(current, previous, ticker),
+    }
+
+
+def describe_bucket(bucket: Bucket, ticker: str | None = None) -> dict[str, Any]:
+    average = bucket.average_score(ticker)
+    return {
+        "mentions": bucket.mentions(ticker),
+        "sentiment": round(average * 100, 2) if average is not None else None,
+    }
+
+
+def compare_buckets(current: Bucket, previous: Bucket, ticker: str | None = None) -> dict[str, Any]:
+    current_score = current.average_score(ticker)
+    previous_score = previous.average_score(ticker)
+    current_mentions = current.mentions(ticker)
+    previous_mentions = previous.mentions(ticker)
+    delta = current_score - previous_score if current_score is not None and previous_score is not None else None
+    direction = "flat"
+    if delta is not None and delta > 0.1:
+        direction = "improving"
+    elif delta is not None and delta < -0.1:
+        direction = "deteriorating"
+    return {
+        "sentimentChange": round(delta * 100, 2) if delta is not None else None,
+        "mentionChange": current_mentions - previous_mentions,
+        "mentionGrowth": round(current_mentions / previous_mentions - 1, 4) if previous_mentions else None,
+        "direction": direction,
+    }
+
+
+@timed(STAGE_SECONDS, "build_ticker_insights")
+def build_ticker_insights(
+    items: list[EnrichedFeedItem],
+    top_n: int | None = 12,
+    only: set[str] | None = None,
+) -> list[dict[str, Any]]:
     score_total: defaultdict[str, float] = defaultdict(float)
     mentions: defaultdict[str, int] = defaultdict(int)
     bullish: defaultdict[str, int] = defaultdict(int)
@@ -738,6 +2061,8 @@ def build_ticker_insights(items: list[EnrichedFeedItem], top_n: int = 12) -> lis
 
     for item in items:
         unique_tickers = list(dict.fromkeys(item.tickers))
+        if only is not None:
+            unique_tickers = [ticker for ticker in unique_tickers if ticker in only]
         if not unique_tickers:
             continue
 
@@ -757,7 +2082,7 @@ def build_ticker_insights(items: list[EnrichedFeedItem], top_n: int = 12) -> lis
     for ticker, mention_count in mentions.items():
         avg_sentiment = score_total[ticker] / mention_count
         momentum = compute_momentum(series[ticker])
-        hype_score = (mention_count * 6.5) + (abs(avg_sentiment) * 40) + (abs(momentum) * 22)
+        hype_score = compute_hype_score(mention_count, avg_sentiment, momentum)
         row = {
             "ticker": ticker,
             "mentions": mention_count,
@@ -771,10 +2096,158 @@ def build_ticker_insights(items: list[EnrichedFeedItem], top_n: int = 12) -> lis
         }
         rows.append(row)
 
-    rows.sort(key=lambda row: (row["hypeScore"], row["mentions"], abs(row["averageSentiment"])), reverse=True)
+    rows.sort(key=ticker_rank_key, reverse=True)
     return rows[:top_n]
 
 
+def compute_hype_score(mentions: float, avg_sentiment: float, momentum: float) -> float:
+    return (mentions * 6.5) + (abs(avg_sentiment) * 40) + (abs(momentum) * 22)
+
+
+def ticker_rank_key(row: dict[str, Any]) -> tuple[float, float, float]:
+    return row["hypeScore"], row["mentions"], abs(row["averageSentiment"])
+
+
+def record_decayed_scores(signals: DecayedSignals, items: Iterable[EnrichedFeedItem], remove: bool = False) -> None:
+    weight = -1 if remove else 1
+    for item in items:
+        signals.add(
+            item.published_at.timestamp(),
+            item.tickers,
+            item.themes,
+            item.sentiment_score,
+            item.sentiment_label,
+            weight,
+        )
+
+
+def decayed_ticker_row(ticker: str, score: DecayedScore) -> dict[str, Any]:
+    """A ticker row in the exact row's shape, with every count and average weighted by item age."""
+    mentions = score.mentions
+    avg_sentiment = max(-1.0, min(1.0, score.sentiment))
+    momentum = max(-1.0, min(1.0, score.momentum))
+    bullish = min(score.bullish, mentions)
+    bearish = min(score.bearish, mentions - bullish)
+    return {
+        "ticker": ticker,
+        "mentions": round(mentions, 2),
+        "averageSentiment": round(avg_sentiment * 100, 2),
+        "bullish": round(bullish, 2),
+        "bearish": round(bearish, 2),
+        "neutral": round(mentions - bullish - bearish, 2),
+        "momentum": round(momentum * 100, 2),
+        "hypeScore": round(compute_hype_score(mentions, avg_sentiment, momentum), 2),
+        "sourceMix": {},
+        "decayed": True,
+    }
+
+
+@timed(STAGE_SECONDS, "build_decayed_tickers")
+def build_decayed_ticker_rows(signals: DecayedSignals, now: float) -> list[dict[str, Any]]:
+    rows = [decayed_ticker_row(ticker, score) for ticker, score in signals.tickers.read_all(now)]
+    rows.sort(key=ticker_rank_key, reverse=True)
+    return rows
+
+
+def build_decayed_theme_rows(signals: DecayedSignals, now: float, top_n: int = 10) -> list[dict[str, Any]]:
+    ranked = sorted(signals.themes.read_all(now), key=lambda pair: pair[1].mentions, reverse=True)[:top_n]
+    return [
+        {
+            "theme": theme,
+            "mentions": round(score.mentions, 2),
+            "averageSentiment": round(score.sentiment * 100, 2),
+        }
+        for theme, score in ranked
+    ]
+
+
+def build_decayed_overview(signals: DecayedSignals, now: float) -> dict[str, Any]:
+    """Overview fields that switch to age-weighted values in decayed mode."""
+    score = signals.market_score(now)
+    index = round(score.sentiment * 100, 2) if score is not None else 0.0
+    return {
+        "sentimentIndex": index,
+        "marketPulse": describe_sentiment_index(index),
+        "scoreMode": "decayed",
+        "halfLifeMinutes": round(signals.half_life / 60, 2),
+        "decayedMentions": round(score.mentions, 2) if score is not None else 0.0,
+    }
+
+
+def record_heavy_hitters(heavy_hitters: HeavyHitters, items: Iterable[EnrichedFeedItem], remove: bool = False) -> None:
+    weight = -1 if remove else 1
+    for item in items:
+        if item.tickers:
+            heavy_hitters.add(
+                item.published_at.timestamp(),
+                item.tickers,
+                item.sentiment_score,
+                item.sentiment_label,
+                weight,
+            )
+
+
+def estimated_ticker_row(estimate: TickerEstimate) -> dict[str, Any]:
+    """A ticker row in the exact row's shape, built from decayed sketch sums instead of the retained items."""
+    mentions = estimate.mentions
+    avg_sentiment = max(-1.0, min(1.0, estimate.score_sum / mentions))
+    if estimate.recent_mentions > 0:
+        recent_sentiment = max(-1.0, min(1.0, estimate.recent_score_sum / estimate.recent_mentions))
+        momentum = max(-1.0, min(1.0, recent_sentiment - avg_sentiment))
+    else:
+        momentum = 0.0
+    hype_score = compute_hype_score(mentions, avg_sentiment, momentum)
+    bullish = min(estimate.bullish, mentions)
+    bearish = min(estimate.bearish, mentions - bullish)
+    return {
+        "ticker": estimate.ticker,
+        "mentions": round(mentions, 1),
+        "averageSentiment": round(avg_sentiment * 100, 2),
+        "bullish": round(bullish, 1),
+        "bearish": round(bearish, 1),
+        "neutral": round(mentions - bullish - bearish, 1),
+        "momentum": round(momentum * 100, 2),
+        "hypeScore": round(hype_score, 2),
+        "sourceMix": {},
+        "approximate": True,
+        "mentionsError": round(estimate.mention_error, 1),
+    }
+
+
+@timed(STAGE_SECONDS, "build_sketch_tickers")
+def build_sketch_ticker_rows(
+    items: list[EnrichedFeedItem],
+    heavy_hitters: HeavyHitters,
+    exact_symbols: set[str],
+) -> list[dict[str, Any]]:
+    """Trending order from the Space-Saving top-k; watchlisted symbols get exact rows from the retained items."""
+    exact = (
+        {row["ticker"]: row for row in build_ticker_insights(items, top_n=None, only=exact_symbols)}
+        if exact_symbols
+        else {}
+    )
+    ranked = sorted(
+        (estimated_ticker_row(estimate) for estimate in heavy_hitters.ranked() if estimate.mentions > 0),
+        key=ticker_rank_key,
+        reverse=True,
+    )
+    rows = [exact.pop(row["ticker"], row) for row in ranked]
+    rows.extend(exact.values())
+    return rows
+
+
+def missing_ticker_row(ticker_symbol: str) -> dict[str, Any]:
+    """Row for a symbol outside the published index; in approximate mode the sketches can still estimate it."""
+    if cache.heavy_hitters is None:
+        return empty_ticker_row(ticker_symbol)
+    estimate = cache.heavy_hitters.estimate(ticker_symbol)
+    # Below the Count-Min error bound the estimate cannot be told apart from hash collisions.
+    if estimate.mentions <= estimate.mention_error:
+        return empty_ticker_row(ticker_symbol)
+    return estimated_ticker_row(estimate)
+
+
+@timed(STAGE_SECONDS, "build_theme_insights")
 def build_theme_insights(items: list[EnrichedFeedItem], top_n: int = 10) -> list[dict[str, Any]]:
     counts: Counter[str] = Counter()
     score_totals: defaultdict[str, float] = defaultdict(float)
@@ -796,6 +2269,7 @@ def build_theme_insights(items: list[EnrichedFeedItem], top_n: int = 10) -> list
     return rows
 
 
+@timed(STAGE_SECONDS, "build_narratives")
 def build_narratives(items: list[EnrichedFeedItem], limit: int = 8) -> list[dict[str, Any]]:
     if not items:
         return []
@@ -826,6 +2300,41 @@ def build_narratives(items: list[EnrichedFeedItem], limit: int = 8) -> list[dict
     return rows[:limit]
 
 
+def record_narratives(index: NarrativeIndex, items: Iterable[EnrichedFeedItem], remove: bool = False) -> None:
+    for item in items:
+        if remove:
+            index.remove(item.id, item.sentiment_score)
+        else:
+            index.add(
+                item.id,
+                item.published_at.timestamp(),
+                item.themes,
+                item.sentiment_score,
+                abs(item.sentiment_score) * item.sentiment_confidence,
+            )
+
+
+def build_index_narratives(
+    index: NarrativeIndex,
+    items: dict[str, EnrichedFeedItem],
+    limit: int = 8,
+) -> list[dict[str, Any]]:
+    """`build_narratives` over every retained item, read from the running index in O(themes)."""
+    rows = []
+    for theme, moments in index.ranked(limit):
+        lead = items[index.lead(theme)]
+        rows.append(
+            {
+                "theme": theme,
+                "mentions": moments.count,
+                "sentiment": round(moments.mean * 100, 2),
+                "headline": lead.title,
+                "tickerFocus": lead.tickers[:3],
+            }
+        )
+    return rows
+
+
 def compute_momentum(series: list[float]) -> float:
     if len(series) < 3:
         return 0.0
@@ -844,26 +2353,97 @@ def filter_items(
     ticker: str | None,
     q: str | None,
 ) -> list[EnrichedFeedItem]:
-    filtered = items
+    if not (source or sentiment or ticker or q):
+        return items
+    return list(iter_filtered_items(items, source=source, sentiment=sentiment, ticker=ticker, q=q))
 
-    if source:
-        source_filter = source.strip().lower()
-        filtered = [item for item in filtered if item.source == source_filter]
 
-    if sentiment:
-        sentiment_filter = sentiment.strip().lower()
-        filtered = [item for item in filtered if item.sentiment_label == sentiment_filter]
+def iter_filtered_items(
+    items: list[EnrichedFeedItem],
+    source: str | None,
+    sentiment: str | None,
+    ticker: str | None,
+    q: str | None,
+    start: int = 0,
+) -> Iterator[EnrichedFeedItem]:
+    source_filter = source.strip().lower() if source else ""
+    sentiment_filter = sentiment.strip().lower() if sentiment else ""
+    symbol = sanitize_ticker(ticker) if ticker else ""
+    query = q.strip().lower() if q else ""
+
+    for index in range(start, len(items)):
+        item = items[index]
+        if source_filter and item.source != source_filter:
+            continue
+        if sentiment_filter and item.sentiment_label != sentiment_filter:
+            continue
+        if symbol and symbol not in item.tickers:
+            continue
+        if query and query not in item.title.lower() and query not in item.text.lower():
+            continue
+        yield item
+
+
+def estimate_item_bytes(item: EnrichedFeedItem) -> int:
+    """Approximate retained size; interned source/label/ticker/theme strings are shared and not counted."""
+    return (
+        RETENTION_ENTRY_OVERHEAD_BYTES
+        + sys.getsizeof(item)
+        + sys.getsizeof(item.id)
+        + sys.getsizeof(item.title)
+        + sys.getsizeof(item.url)
+        + sys.getsizeof(item.body)
+        + sys.getsizeof(item.published_at)
+        + sys.getsizeof(item.tickers)
+        + sys.getsizeof(item.themes)
+    )
+
 
-    if ticker:
-        symbol = sanitize_ticker(ticker)
-        if symbol:
-            filtered = [item for item in filtered if symbol in item.tickers]
+def feed_order_key(item: EnrichedFeedItem) -> tuple[datetime, str]:
+    return item.published_at, item.id
+
+
+def encode_cursor(item: EnrichedFeedItem) -> str:
+    raw = json.dumps([item.published_at.isoformat(), item.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str] | None:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        parsed = datetime.fromisoformat(published_at)
+    except (binascii.Error, TypeError, ValueError, UnicodeError):
+        return None
+    if parsed.tzinfo is None or not isinstance(item_id, str):
+        return None
+    return parsed, item_id
+
+
+def seek_feed_position(items: list[EnrichedFeedItem], position: tuple[datetime, str]) -> int:
+    """Index of the first item strictly after `position` in newest-first (published_at, id) order."""
+    lo, hi = 0, len(items)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if feed_order_key(items[mid]) < position:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
 
-    if q:
-        query = q.strip().lower()
-        filtered = [item for item in filtered if query in item.title.lower() or query in item.text.lower()]
 
-    return filtered
+def empty_ticker_row(ticker_symbol: str) -> dict[str, Any]:
+    return {
+        "ticker": ticker_symbol,
+        "mentions": 0,
+        "averageSentiment": 0,
+        "bullish": 0,
+        "bearish": 0,
+        "neutral": 0,
+        "momentum": 0,
+        "hypeScore": 0,
+        "sourceMix": {},
+    }
 
 
 def legacy_item_payload(item: EnrichedFeedItem) -> dict[str, Any]:
@@ -892,20 +2472,84 @@ def serialize_item(item: EnrichedFeedItem) -> dict[str, Any]:
         },
         "tickers": item.tickers,
         "themes": item.themes,
+        "duplicates": item.duplicates,
     }
 
 
+ITEM_FIELD_GETTERS: dict[str, Callable[[EnrichedFeedItem], Any]] = {
+    "id": lambda item: item.id,
+    "source": lambda item: item.source,
+    "title": lambda item: item.title,
+    "url": lambda item: item.url,
+    "publishedAt": lambda item: item.published_at.isoformat(),
+    "text": lambda item: item.text,
+    "summary": lambda item: item.summary,
+    "sentiment": lambda item: {
+        "label": item.sentiment_label,
+        "score": round(item.sentiment_score * 100, 2),
+        "confidence": round(item.sentiment_confidence * 100, 2),
+    },
+    "tickers": lambda item: item.tickers,
+    "themes": lambda item: item.themes,
+    "duplicates": lambda item: item.duplicates,
+}
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...]:
+    """Resolve a `fields=` value (profile name or comma list) to a canonical, ordered field tuple."""
+    if not fields or not fields.strip():
+        return ITEM_FIELDS
+    value = fields.strip().lower()
+    if value in FIELD_PROFILES:
+        return FIELD_PROFILES[value]
+
+    requested = {token.strip() for token in fields.split(",") if token.strip()}
+    unknown = requested.difference(ITEM_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown item fields: {', '.join(sorted(unknown))}.")
+    requested.add("id")
+    return tuple(field for field in ITEM_FIELDS if field in requested)
+
+
+def read_projection(fields: str | None) -> tuple[str, ...]:
+    try:
+        return parse_fields(fields)
+    except ValueError as error:
+        raise HTTPException(status_code=400, detail=str(error)) from error
+
+
+@lru_cache(maxsize=64)
+def compile_serializer(fields: tuple[str, ...]) -> Callable[[EnrichedFeedItem], dict[str, Any]]:
+    if fields == ITEM_FIELDS:
+        return serialize_item
+    getters = tuple((field, ITEM_FIELD_GETTERS[field]) for field in fields)
+
+    def serialize(item: EnrichedFeedItem) -> dict[str, Any]:
+        return {field: getter(item) for field, getter in getters}
+
+    return serialize
+
+
+@timed(STAGE_SECONDS, "serialize")
+def serialize_items(
+    items: list[EnrichedFeedItem],
+    serializer: Callable[[EnrichedFeedItem], dict[str, Any]],
+) -> list[dict[str, Any]]:
+    return [serializer(item) for item in items]
+
+
 def normalize_whitespace(text: str) -> str:
     return re.sub(r"\s+", " ", text).strip()
 
 
+@timed(STAGE_SECONDS, "html_to_text")
 def html_to_text(text: str) -> str:
     return normalize_whitespace(BeautifulSoup(text, "html.parser").get_text(" "))
 
 
 def sanitize_ticker(value: str) -> str:
     token = re.sub(r"[^A-Za-z]", "", value or "").upper()
-    if not token or token in TICKER_NOISE or len(token) > 5:
+    if not token or token in lexicon_source.current.ticker_noise or len(token) > 5:
         return ""
     return token
 
@@ -931,6 +2575,16 @@ def parse_datetime(value: str) -> datetime:
         return utc_now()
 
 
+def bounded_int(value: Any, default: int, lower: int, upper: int) -> int:
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(lower, min(upper, number))
+
+
 def ratio(count: int, total: int) -> float:
     if total <= 0:
         return 0.0
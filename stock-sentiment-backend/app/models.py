@@ -1 +1,24 @@
-# Placeholder for Pydantic models if needed later
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+# Symbols one watchlist request may resolve or save; longer lists are rejected before they reach the index.
+WATCHLIST_MAX_TICKERS = 2000
+
+
+class ViewRequest(BaseModel):
+    view: str = Field(description="dashboard, feed, ticker, watchlist, insights or trending")
+    params: dict[str, Any] = Field(default_factory=dict)
+    id: str | None = Field(default=None, description="echoed back so callers can match results")
+
+
+class BatchRequest(BaseModel):
+    views: list[ViewRequest]
+    force_refresh: bool = False
+
+
+class WatchlistRequest(BaseModel):
+    tickers: list[str] = Field(max_length=WATCHLIST_MAX_TICKERS)
+    force_refresh: bool = False
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from typing import Any
+
+
+class Moments:
+    """Count, mean and sum of squared deviations kept with Welford's update.
+
+    Two summaries merge exactly (Chan et al.), so sub-windows combine without revisiting their values, and an
+    earlier `add` can be taken back with `remove`.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    def merge(self, other: Moments) -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def total(self) -> float:
+        return self.mean * self.count
+
+    @property
+    def variance(self) -> float:
+        """Population variance, as `statistics.pvariance`."""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @classmethod
+    def of(cls, values: Iterable[float]) -> Moments:
+        moments = cls()
+        for value in values:
+            moments.add(value)
+        return moments
+
+    @classmethod
+    def combined(cls, parts: Iterable[Moments]) -> Moments:
+        moments = cls()
+        for part in parts:
+            moments.merge(part)
+        return moments
+
+
+class MomentGroups:
+    """Moments per key; a key disappears once its last value is removed."""
+
+    def __init__(self) -> None:
+        self.groups: dict[str, Moments] = {}
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def __iter__(self):
+        return iter(self.groups.items())
+
+    def add(self, key: str, value: float) -> None:
+        moments = self.groups.get(key)
+        if moments is None:
+            moments = self.groups[key] = Moments()
+        moments.add(value)
+
+    def remove(self, key: str, value: float) -> None:
+        moments = self.groups.get(key)
+        if moments is None:
+            return
+        moments.remove(value)
+        if not moments.count:
+            del self.groups[key]
+
+    def get(self, key: str) -> Moments:
+        return self.groups.get(key) or Moments()
+
+
+class StreamStats:
+    """Running moments of one value over a changing set of items.
+
+    It keeps an overall summary, summaries per ticker, theme, source and label, and one summary per
+    `chunk_seconds` of publish time. Adding or removing an item costs O(keys on the item). Reading costs
+    O(groups) or O(chunks), independent of the number of items. With `track_tickers=False` tickers are ignored,
+    so memory no longer grows with the number of distinct symbols.
+    """
+
+    def __init__(self, chunk_seconds: int = 60, track_tickers: bool = True):
+        self.chunk_seconds = chunk_seconds
+        self.track_tickers = track_tickers
+        self.total = Moments()
+        self.tickers = MomentGroups()
+        self.themes = MomentGroups()
+        self.sources = MomentGroups()
+        self.labels = MomentGroups()
+        self.chunks: dict[int, Moments] = {}
+        self.chunk_order: list[int] = []
+
+    def add(
+        self,
+        timestamp: float,
+        value: float,
+        *,
+        tickers: Iterable[str] = (),
+        themes: Iterable[str] = (),
+        source: str = "",
+        label: str = "",
+    ) -> None:
+        self.total.add(value)
+        if self.track_tickers:
+            for ticker in tickers:
+                self.tickers.add(ticker, value)
+        for theme in themes:
+            self.themes.add(theme, value)
+        self.sources.add(source, value)
+        self.labels.add(label, value)
+        chunk = int(timestamp // self.chunk_seconds)
+        moments = self.chunks.get(chunk)
+        if moments is None:
+            moments = self.chunks[chunk] = Moments()
+            insort(self.chunk_order, chunk)
+        moments.add(value)
+
+    def remove(
+        self,
+        timestamp: float,
+        value: float,
+        *,
+        tickers: Iterable[str] = (),
+        themes: Iterable[str] = (),
+        source: str = "",
+        label: str = "",
+    ) -> None:
+        self.total.remove(value)
+        if self.track_tickers:
+            for ticker in tickers:
+                self.tickers.remove(ticker, value)
+        for theme in themes:
+            self.themes.remove(theme, value)
+        self.sources.remove(source, value)
+        self.labels.remove(label, value)
+        chunk = int(timestamp // self.chunk_seconds)
+        moments = self.chunks.get(chunk)
+        if moments is None:
+            return
+        moments.remove(value)
+        if not moments.count:
+            del self.chunks[chunk]
+            del self.chunk_order[bisect_left(self.chunk_order, chunk)]
+
+    def halves(self) -> tuple[Moments, Moments]:
+        """Older and newer halves by item count; the oldest `count // 2` items make up the first half.
+
+        The chunk straddling the midpoint is split in proportion to the items each half needs from it. Its items
+        are not ordered within the chunk, so both parts take the chunk's mean and a matching share of its spread.
+        """
+        midpoint = self.total.count // 2
+        older = Moments()
+        newer = Moments()
+        for chunk in self.chunk_order:
+            moments = self.chunks[chunk]
+            room = midpoint - older.count
+            if room >= moments.count:
+                older.merge(moments)
+            elif room > 0:
+                share = room / moments.count
+                older.merge(Moments(room, moments.mean, moments.m2 * share))
+                newer.merge(Moments(moments.count - room, moments.mean, moments.m2 * (1 - share)))
+            else:
+                newer.merge(moments)
+        return older, newer
+
+    def window(self, start: float, end: float) -> Moments:
+        """Merged summary of the chunks in `[start, end)`."""
+        first = bisect_left(self.chunk_order, int(start // self.chunk_seconds))
+        last = bisect_left(self.chunk_order, math.ceil(end / self.chunk_seconds))
+        return Moments.combined(self.chunks[chunk] for chunk in self.chunk_order[first:last])
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "items": self.total.count,
+            "tickers": len(self.tickers),
+            "themes": len(self.themes),
+            "sources": len(self.sources),
+            "chunks": len(self.chunks),
+            "chunkSeconds": self.chunk_seconds,
+        }
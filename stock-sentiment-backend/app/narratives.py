@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+
+from app.moments import MomentGroups, Moments
+
+# Items without a theme are grouped here, as the dashboard narratives have always done.
+UNTHEMED = "Macro"
+LeadKey = tuple[float, float, str]
+
+
+class NarrativeIndex:
+    """Score moments per theme plus each theme's lead item, kept up to date as items come and go.
+
+    The lead is the item with the largest weight (ties go to the newer item). Each theme keeps a max-heap of
+    `(-weight, -timestamp, id)`; a removed item stays in the heap until it reaches the top, where it is dropped.
+    Adding or removing an item costs O(log n) per theme, and a heap is rebuilt from its live entries once stale
+    ones outnumber them, so memory stays proportional to the items held.
+    """
+
+    def __init__(self) -> None:
+        self.themes = MomentGroups()
+        self.heaps: dict[str, list[LeadKey]] = {}
+        self.live: dict[str, tuple[LeadKey, tuple[str, ...]]] = {}
+
+    def add(self, item_id: str, timestamp: float, themes: Iterable[str], score: float, weight: float) -> None:
+        groups = tuple(themes) or (UNTHEMED,)
+        entry = (-weight, -timestamp, item_id)
+        self.live[item_id] = (entry, groups)
+        for theme in groups:
+            self.themes.add(theme, score)
+            heapq.heappush(self.heaps.setdefault(theme, []), entry)
+
+    def remove(self, item_id: str, score: float) -> None:
+        entry = self.live.pop(item_id, None)
+        if entry is None:
+            return
+        for theme in entry[1]:
+            self.themes.remove(theme, score)
+            heap = self.heaps[theme]
+            if not self.themes.get(theme).count:
+                del self.heaps[theme]
+            elif len(heap) > 2 * self.themes.get(theme).count:
+                heap = self.heaps[theme] = list({key for key in heap if self.is_live(key, theme)})
+                heapq.heapify(heap)
+
+    def is_live(self, key: LeadKey, theme: str) -> bool:
+        current = self.live.get(key[2])
+        return current is not None and current[0] == key and theme in current[1]
+
+    def lead(self, theme: str) -> str | None:
+        heap = self.heaps.get(theme)
+        while heap and not self.is_live(heap[0], theme):
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def ranked(self, limit: int) -> list[tuple[str, Moments]]:
+        """Themes by mentions, then by the size of their average score."""
+        ranked = sorted(self.themes, key=lambda pair: (pair[1].count, abs(round(pair[1].mean * 100, 2))), reverse=True)
+        return ranked[:limit]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import cProfile
+import hmac
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any
+
+PROFILE_MODES = ("cprofile", "sample")
+REQUEST_SAMPLE_INTERVAL_SECONDS = 0.001
+MAX_STACK_DEPTH = 96
+
+
+def collapse_stack(frame: FrameType | None, max_depth: int = MAX_STACK_DEPTH) -> str:
+    """Render a frame chain root-first in the `a;b;c` form flamegraph.pl and speedscope read."""
+    names = []
+    while frame is not None and len(names) < max_depth:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread and counts identical stacks."""
+
+    def __init__(self, thread_id: int, interval_seconds: float):
+        self.thread_id = thread_id
+        self.interval = interval_seconds
+        self.counts: Counter[str] = Counter()
+        self.samples = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="ssd-stack-sampler", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = collapse_stack(frame)
+            with self.lock:
+                self.counts[stack] += 1
+                self.samples += 1
+
+    def collapsed(self) -> str:
+        with self.lock:
+            rows = self.counts.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in rows)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.counts.clear()
+            self.samples = 0
+
+
+@dataclass(slots=True)
+class ProfileResult:
+    id: str
+    label: str
+    mode: str
+    created_at: datetime
+    duration_seconds: float
+    data: bytes
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "label": self.label,
+            "mode": self.mode,
+            "createdAt": self.created_at.isoformat(),
+            "durationMs": round(self.duration_seconds * 1000, 2),
+            "bytes": len(self.data),
+        }
+
+    @property
+    def suffix(self) -> str:
+        return ".pstats" if self.mode == "cprofile" else ".collapsed"
+
+    def render(self, output: str) -> tuple[str, bytes]:
+        """Return (media type, body): raw pstats/collapsed data, or `text` for a cumulative-time table."""
+        if output == "text" and self.mode == "cprofile":
+            stream = io.StringIO()
+            stats = pstats.Stats(stream=stream)
+            stats.stats = marshal.loads(self.data)  # type: ignore[attr-defined]
+            stats.get_top_level_stats()
+            stats.sort_stats("cumulative").print_stats(60)
+            return "text/plain; charset=utf-8", stream.getvalue().encode("utf-8")
+        if self.mode == "cprofile":
+            return "application/octet-stream", self.data
+        return "text/plain; charset=utf-8", self.data
+
+
+class ProfileSession:
+    def __init__(self, mode: str, label: str, thread_id: int | None = None):
+        self.mode = mode
+        self.label = label
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.profile: cProfile.Profile | None = None
+        self.sampler: StackSampler | None = None
+        self.started = 0.0
+
+    def start(self) -> None:
+        self.started = perf_counter()
+        if self.mode == "cprofile":
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        else:
+            self.sampler = StackSampler(self.thread_id, REQUEST_SAMPLE_INTERVAL_SECONDS)
+            self.sampler.start()
+
+    def stop(self, profile_id: str) -> ProfileResult:
+        duration = perf_counter() - self.started
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile.create_stats()
+            data = marshal.dumps(self.profile.stats)  # type: ignore[attr-defined]
+        else:
+            assert self.sampler is not None
+            self.sampler.stop()
+            data = self.sampler.collapsed().encode("utf-8")
+        return ProfileResult(
+            id=profile_id,
+            label=self.label,
+            mode=self.mode,
+            created_at=datetime.now(timezone.utc),
+            duration_seconds=duration,
+            data=data,
+        )
+
+
+class Profiler:
+    """Opt-in profiling: token-gated per-request and next-refresh profiles plus an optional always-on sampler.
+
+    Only one profile session runs at a time because cProfile is process-wide. Results are kept in a small
+    ring and, when `directory` is set, also written there as `<id>.pstats` or `<id>.collapsed`.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        directory: Path | None = None,
+        max_results: int = 32,
+        sample_hz: float = 0.0,
+    ):
+        self.token = token
+        self.directory = directory
+        self.max_results = max_results
+        self.sample_hz = sample_hz
+        self.results: OrderedDict[str, ProfileResult] = OrderedDict()
+        self.sequence = 0
+        self.active = False
+        self.armed_refresh: str | None = None
+        self.sampler: StackSampler | None = None
+
+    @classmethod
+    def from_env(cls) -> Profiler | None:
+        token = os.environ.get("SSD_PROFILING_TOKEN", "")
+        if not token:
+            return None
+        directory = os.environ.get("SSD_PROFILE_DIR")
+        return cls(
+            token=token,
+            directory=Path(directory) if directory else None,
+            sample_hz=float(os.environ.get("SSD_PROFILING_SAMPLE_HZ", "0") or 0),
+        )
+
+    def authorized(self, token: str | None) -> bool:
+        return bool(token) and hmac.compare_digest(token.encode("utf-8"), self.token.encode("utf-8"))
+
+    def begin(self, mode: str, label: str) -> ProfileSession | None:
+        if self.active:
+            return None
+        self.active = True
+        session = ProfileSession(mode if mode in PROFILE_MODES else "cprofile", label)
+        try:
+            session.start()
+        except Exception:
+            self.active = False
+            raise
+        return session
+
+    def finish(self, session: ProfileSession) -> ProfileResult:
+        self.sequence += 1
+        try:
+            result = session.stop(f"p{self.sequence:05d}")
+        finally:
+            self.active = False
+        self.results[result.id] = result
+        while len(self.results) > self.max_results:
+            self.results.popitem(last=False)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{result.id}{result.suffix}").write_bytes(result.data)
+        return result
+
+    def arm_refresh(self, mode: str) -> None:
+        self.armed_refresh = mode if mode in PROFILE_MODES else "cprofile"
+
+    def take_refresh_session(self) -> ProfileSession | None:
+        """Start the armed refresh profile; while another profile is active it stays armed for the next refresh."""
+        if self.armed_refresh is None:
+            return None
+        session = self.begin(self.armed_refresh, "refresh")
+        if session is not None:
+            self.armed_refresh = None
+        return session
+
+    def start_sampler(self, thread_id: int) -> None:
+        if self.sample_hz > 0 and self.sampler is None:
+            self.sampler = StackSampler(thread_id, 1.0 / self.sample_hz)
+            self.sampler.start()
+
+    def stop_sampler(self) -> None:
+        if self.sampler is not None:
+            self.sampler.stop()
+            self.sampler = None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "armedRefresh": self.armed_refresh,
+            "sampler": {"hz": self.sample_hz, "samples": self.sampler.samples if self.sampler else 0},
+            "profiles": [result.summary() for result in reversed(self.results.values())],
+        }
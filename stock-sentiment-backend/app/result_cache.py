@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class ResultCache:
+    """Bounded LRU of query results that all belong to a single cache generation.
+
+    Publishing a new generation drops every entry at once, so keys only need the normalized query
+    parameters. Results computed for an older generation than the one held are returned uncached.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.generation = 0
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, generation: int, key: Hashable, factory: Callable[[], Any]) -> Any:
+        if generation > self.generation:
+            self.invalidate(generation)
+        elif generation < self.generation:
+            self.misses += 1
+            return factory()
+
+        try:
+            value = self.entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = factory()
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    def invalidate(self, generation: int) -> None:
+        if self.entries:
+            self.invalidations += 1
+        self.entries.clear()
+        self.generation = max(self.generation, generation)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "generation": self.generation,
+            "entries": len(self.entries),
+            "maxEntries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+OrderKey = tuple[datetime, str]
+
+
+@dataclass(slots=True)
+class RetentionPolicy:
+    max_bytes: int
+    max_age: dict[str, timedelta] = field(default_factory=dict)
+    default_max_age: timedelta | None = None
+
+    def cutoff(self, source: str, now: datetime) -> datetime | None:
+        window = self.max_age.get(source, self.default_max_age)
+        return now - window if window is not None else None
+
+
+def parse_age_windows(spec: str) -> dict[str, timedelta]:
+    """`news=24,reddit=12` (hours per source) -> {"news": 24h, "reddit": 12h}; malformed parts are skipped."""
+    windows = {}
+    for part in spec.split(","):
+        source, _, hours = part.partition("=")
+        try:
+            windows[source.strip()] = timedelta(hours=float(hours))
+        except ValueError:
+            continue
+    return windows
+
+
+class RetentionStore(Generic[T]):
+    """Items kept in ascending `(published_at, id)` order under a byte budget and per-source age windows.
+
+    Each source keeps its own ordered list. New items are inserted in place, and eviction only ever trims from
+    the old end of a list, so a refresh never re-sorts the retained history and its cost grows with the items it
+    removes. `key(item)` must be `(published_at, id)` with an id unique per item.
+    """
+
+    def __init__(
+        self,
+        policy: RetentionPolicy,
+        key: Callable[[T], OrderKey],
+        source: Callable[[T], str],
+        size: Callable[[T], int],
+    ):
+        self.policy = policy
+        self.key = key
+        self.source = source
+        self.size = size
+        self.orders: dict[str, list[OrderKey]] = {}
+        self.items: dict[str, T] = {}
+        self.sizes: dict[str, int] = {}
+        self.bytes = 0
+        self.source_bytes: Counter[str] = Counter()
+        self.source_items: Counter[str] = Counter()
+        self.evictions: Counter[str] = Counter()
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def admits(self, item_id: str, source: str, published_at: datetime, now: datetime) -> bool:
+        """Whether an incoming item is new and still inside its source's age window."""
+        if item_id in self.items:
+            return False
+        cutoff = self.policy.cutoff(source, now)
+        return cutoff is None or published_at >= cutoff
+
+    def merge(self, items: Iterable[T]) -> list[str]:
+        """Insert items whose id is not retained yet; returns the ids that were added."""
+        added = []
+        for item in items:
+            order_key = self.key(item)
+            item_id = order_key[1]
+            if item_id in self.items:
+                continue
+            size = self.size(item)
+            source = self.source(item)
+            self.items[item_id] = item
+            self.sizes[item_id] = size
+            self.bytes += size
+            self.source_bytes[source] += size
+            self.source_items[source] += 1
+            order = self.orders.setdefault(source, [])
+            if not order or order_key > order[-1]:
+                order.append(order_key)
+            else:
+                insort(order, order_key)
+            added.append(item_id)
+        return added
+
+    def evict(self, now: datetime) -> list[T]:
+        """Drop items past their source's age window, then the oldest items until under the byte budget."""
+        removed = []
+        # Expired items form a prefix of their source's list, found by bisection and deleted in place.
+        for source, order in self.orders.items():
+            cutoff = self.policy.cutoff(source, now)
+            if cutoff is None:
+                continue
+            expired = bisect_left(order, (cutoff, ""))
+            if expired:
+                removed.extend(self.discard(item_id, "age") for _, item_id in order[:expired])
+                del order[:expired]
+
+        if self.bytes > self.policy.max_bytes:
+            # The oldest retained item is always at the head of one of the per-source lists.
+            heads = dict.fromkeys(self.orders, 0)
+            while self.bytes > self.policy.max_bytes:
+                live = [source for source, head in heads.items() if head < len(self.orders[source])]
+                if not live:
+                    break
+                source = min(live, key=lambda name: self.orders[name][heads[name]])
+                removed.append(self.discard(self.orders[source][heads[source]][1], "bytes"))
+                heads[source] += 1
+            for source, head in heads.items():
+                del self.orders[source][:head]
+
+        for source in [source for source, order in self.orders.items() if not order]:
+            del self.orders[source]
+        return removed
+
+    def remove(self, item_ids: Iterable[str]) -> list[T]:
+        """Take specific items out ahead of their window; this is not counted as an eviction."""
+        removed = [self.discard(item_id) for item_id in set(item_ids) if item_id in self.items]
+        for source in {self.source(item) for item in removed}:
+            order = [order_key for order_key in self.orders[source] if order_key[1] in self.items]
+            if order:
+                self.orders[source] = order
+            else:
+                del self.orders[source]
+        return removed
+
+    def discard(self, item_id: str, reason: str | None = None) -> T:
+        item = self.items.pop(item_id)
+        size = self.sizes.pop(item_id)
+        source = self.source(item)
+        self.bytes -= size
+        self.source_bytes[source] -= size
+        self.source_items[source] -= 1
+        if not self.source_items[source]:
+            del self.source_items[source]
+            del self.source_bytes[source]
+        if reason is not None:
+            self.evictions[reason] += 1
+        return item
+
+    def replace(self, item: T) -> None:
+        """Swap in a re-enriched copy of a retained item; its order key must be unchanged."""
+        item_id = self.key(item)[1]
+        size = self.size(item)
+        delta = size - self.sizes[item_id]
+        self.items[item_id] = item
+        self.sizes[item_id] = size
+        self.bytes += delta
+        self.source_bytes[self.source(item)] += delta
+
+    def newest(self, source: str, limit: int) -> list[T]:
+        """The `limit` newest items of one source, newest first, in O(limit)."""
+        order = self.orders.get(source, [])
+        return [self.items[item_id] for _, item_id in reversed(order[-limit:])]
+
+    def newest_first(self) -> list[T]:
+        newest = heapq.merge(*(reversed(order) for order in self.orders.values()), reverse=True)
+        return [self.items[item_id] for _, item_id in newest]
+
+    def usage(self) -> dict[str, Any]:
+        sources = {}
+        for source in sorted(self.source_items):
+            window = self.policy.max_age.get(source, self.policy.default_max_age)
+            sources[source] = {
+                "items": self.source_items[source],
+                "bytes": self.source_bytes[source],
+                "oldest": self.orders[source][0][0].isoformat() if source in self.orders else None,
+                "maxAgeHours": round(window.total_seconds() / 3600, 2) if window is not None else None,
+            }
+        return {
+            "items": len(self.items),
+            "bytes": self.bytes,
+            "maxBytes": self.policy.max_bytes,
+            "utilization": round(self.bytes / self.policy.max_bytes, 4) if self.policy.max_bytes else 0.0,
+            "sources": sources,
+            "evictions": dict(self.evictions),
+        }
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any
+
+
+class CountMinSketch:
+    """Approximate per-key sums in `depth` rows of `width` counters.
+
+    For non-negative input an estimate never undercounts, and with probability `1 - delta` it overcounts by at
+    most `epsilon * total`, where `epsilon = e / width` and `delta = exp(-depth)`.
+    """
+
+    def __init__(self, width: int, depth: int):
+        self.width = width
+        self.depth = depth
+        self.rows = [array("d", bytes(8 * width)) for _ in range(depth)]
+        self.total = 0.0
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float) -> CountMinSketch:
+        return cls(width=math.ceil(math.e / epsilon), depth=math.ceil(math.log(1.0 / delta)))
+
+    @property
+    def epsilon(self) -> float:
+        return math.e / self.width
+
+    @property
+    def delta(self) -> float:
+        return math.exp(-self.depth)
+
+    def slots(self, key: str) -> list[int]:
+        """One counter index per row, by double hashing a single 128-bit digest."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, slots: list[int], amount: float = 1.0) -> None:
+        for row, slot in zip(self.rows, slots):
+            row[slot] += amount
+        self.total += amount
+
+    def estimate(self, slots: list[int]) -> float:
+        return min(row[slot] for row, slot in zip(self.rows, slots))
+
+    def scale(self, factor: float) -> None:
+        for row in self.rows:
+            for slot in range(self.width):
+                row[slot] *= factor
+        self.total *= factor
+
+    @property
+    def error_bound(self) -> float:
+        return self.epsilon * self.total
+
+    @property
+    def nbytes(self) -> int:
+        return sum(row.itemsize * len(row) for row in self.rows)
+
+
+class SpaceSaving:
+    """Top-k by the Space-Saving algorithm: at most `capacity` monitored keys.
+
+    A monitored key's count overestimates its true count by at most its recorded error, and any key that is
+    not monitored has a true count no higher than `floor`.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: dict[str, float] = {}
+        self.errors: dict[str, float] = {}
+
+    def add(self, key: str, amount: float = 1.0) -> None:
+        counts = self.counts
+        if key in counts:
+            counts[key] += amount
+            if counts[key] <= 0:
+                del counts[key], self.errors[key]
+            return
+        if amount <= 0:
+            return
+        if len(counts) < self.capacity:
+            counts[key] = amount
+            self.errors[key] = 0.0
+            return
+        victim = min(counts, key=counts.__getitem__)
+        floor = counts.pop(victim)
+        del self.errors[victim]
+        counts[key] = floor + amount
+        self.errors[key] = floor
+
+    @property
+    def floor(self) -> float:
+        return min(self.counts.values()) if len(self.counts) >= self.capacity else 0.0
+
+    def scale(self, factor: float) -> None:
+        for key in self.counts:
+            self.counts[key] *= factor
+            self.errors[key] *= factor
+
+    def top(self, n: int | None = None) -> list[tuple[str, float, float]]:
+        ranked = sorted(self.counts.items(), key=lambda pair: pair[1], reverse=True)[:n]
+        return [(key, count, self.errors[key]) for key, count in ranked]
+
+
+@dataclass(slots=True)
+class TickerEstimate:
+    ticker: str
+    mentions: float
+    mention_error: float
+    score_sum: float
+    bullish: float
+    bearish: float
+    recent_mentions: float
+    recent_score_sum: float
+
+
+class HeavyHitters:
+    """Constant-memory trending state: Count-Min sketches for per-ticker sums plus a Space-Saving top-k.
+
+    Counts decay by `decay` every `window_seconds`, so a ticker's weight halves (by default) each window it
+    goes quiet. A separate pair of sketches holds only the current window and is cleared when it rolls over.
+    Signed sentiment is kept as separate positive and negative mass, because Count-Min bounds only hold for
+    non-negative updates.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        epsilon: float = 0.001,
+        delta: float = 0.01,
+        window_seconds: int = 3600,
+        decay: float = 0.5,
+    ):
+        self.window_seconds = window_seconds
+        self.decay = decay
+        self.epoch: int | None = None
+        self.items = 0
+        self.mentions = CountMinSketch.from_error(epsilon, delta)
+        width, depth = self.mentions.width, self.mentions.depth
+        self.positive_mass = CountMinSketch(width, depth)
+        self.negative_mass = CountMinSketch(width, depth)
+        self.bullish = CountMinSketch(width, depth)
+        self.bearish = CountMinSketch(width, depth)
+        self.recent_mentions = CountMinSketch(width, depth)
+        self.recent_mass = CountMinSketch(width, depth)
+        self.top = SpaceSaving(capacity)
+
+    @property
+    def sketches(self) -> tuple[CountMinSketch, ...]:
+        return (self.mentions, self.positive_mass, self.negative_mass, self.bullish, self.bearish)
+
+    def advance(self, timestamp: float) -> int:
+        epoch = int(timestamp // self.window_seconds)
+        if self.epoch is None:
+            self.epoch = epoch
+        elif epoch > self.epoch:
+            factor = self.decay ** (epoch - self.epoch)
+            for sketch in self.sketches:
+                sketch.scale(factor)
+            self.top.scale(factor)
+            self.recent_mentions.scale(0.0)
+            self.recent_mass.scale(0.0)
+            self.epoch = epoch
+        return epoch
+
+    def add(self, timestamp: float, tickers: tuple[str, ...], score: float, label: str, weight: int = 1) -> None:
+        """Count one item for each of its tickers; `weight=-1` takes back an earlier add with the same values."""
+        epoch = self.advance(timestamp)
+        assert self.epoch is not None
+        # Items from an earlier window arrive already decayed, as if they had been counted on time.
+        amount = weight * self.decay ** (self.epoch - epoch) if epoch < self.epoch else float(weight)
+        current = epoch >= self.epoch
+        self.items += weight
+        for ticker in tickers:
+            slots = self.mentions.slots(ticker)
+            self.mentions.add(slots, amount)
+            if score > 0:
+                self.positive_mass.add(slots, amount * score)
+            elif score < 0:
+                self.negative_mass.add(slots, -amount * score)
+            if label == "positive":
+                self.bullish.add(slots, amount)
+            elif label == "negative":
+                self.bearish.add(slots, amount)
+            if current:
+                self.recent_mentions.add(slots, weight)
+                self.recent_mass.add(slots, weight * score)
+            self.top.add(ticker, amount)
+
+    def estimate(self, ticker: str, mention_error: float | None = None) -> TickerEstimate:
+        slots = self.mentions.slots(ticker)
+        return TickerEstimate(
+            ticker=ticker,
+            mentions=self.mentions.estimate(slots),
+            mention_error=self.mentions.error_bound if mention_error is None else mention_error,
+            score_sum=self.positive_mass.estimate(slots) - self.negative_mass.estimate(slots),
+            bullish=self.bullish.estimate(slots),
+            bearish=self.bearish.estimate(slots),
+            recent_mentions=self.recent_mentions.estimate(slots),
+            # Signed, so this sketch carries no Count-Min bound; it only feeds the momentum heuristic.
+            recent_score_sum=self.recent_mass.estimate(slots),
+        )
+
+    def ranked(self, n: int | None = None) -> list[TickerEstimate]:
+        """The Space-Saving top-n, each with its Count-Min sums; `mention_error` is the tighter of both bounds."""
+        bound = self.mentions.error_bound
+        return [self.estimate(ticker, min(error, bound)) for ticker, _, error in self.top.top(n)]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "epsilon": round(self.mentions.epsilon, 6),
+            "delta": round(self.mentions.delta, 6),
+            "width": self.mentions.width,
+            "depth": self.mentions.depth,
+            "capacity": self.top.capacity,
+            "monitored": len(self.top.counts),
+            "windowSeconds": self.window_seconds,
+            "decay": self.decay,
+            "items": self.items,
+            "decayedMentions": round(self.mentions.total, 2),
+            "maxOvercount": round(self.mentions.error_bound, 2),
+            "topKFloor": round(self.top.floor, 2),
+            "bytes": sum(sketch.nbytes for sketch in (*self.sketches, self.recent_mentions, self.recent_mass)),
+        }
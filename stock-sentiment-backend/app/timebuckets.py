@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+
+class Bucket:
+    __slots__ = ("index", "count", "score_sum", "confidence_sum", "positive", "negative", "ticker_counts", "ticker_scores")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.count = 0
+        self.score_sum = 0.0
+        self.confidence_sum = 0.0
+        self.positive = 0
+        self.negative = 0
+        self.ticker_counts: Counter[str] = Counter()
+        self.ticker_scores: Counter[str] = Counter()
+
+    def add(self, score: float, confidence: float, label: str, tickers: Iterable[str], weight: int = 1) -> None:
+        """Count one item (`weight=-1` takes a previously added item back out)."""
+        self.count += weight
+        self.score_sum += weight * score
+        self.confidence_sum += weight * confidence
+        if label == "positive":
+            self.positive += weight
+        elif label == "negative":
+            self.negative += weight
+        for ticker in tickers:
+            self.ticker_counts[ticker] += weight
+            self.ticker_scores[ticker] += weight * score
+            if self.ticker_counts[ticker] <= 0:
+                del self.ticker_counts[ticker]
+                del self.ticker_scores[ticker]
+
+    def merge(self, other: Bucket) -> None:
+        self.count += other.count
+        self.score_sum += other.score_sum
+        self.confidence_sum += other.confidence_sum
+        self.positive += other.positive
+        self.negative += other.negative
+        self.ticker_counts.update(other.ticker_counts)
+        self.ticker_scores.update(other.ticker_scores)
+
+    def mentions(self, ticker: str | None = None) -> int:
+        return self.count if ticker is None else self.ticker_counts.get(ticker, 0)
+
+    def average_score(self, ticker: str | None = None) -> float | None:
+        mentions = self.mentions(ticker)
+        if not mentions:
+            return None
+        total = self.score_sum if ticker is None else self.ticker_scores[ticker]
+        return total / mentions
+
+
+class BucketRing:
+    """Fixed-resolution ring of buckets; a slot is reused once its bucket falls out of the horizon."""
+
+    def __init__(self, resolution_seconds: int, size: int):
+        self.resolution = resolution_seconds
+        self.size = size
+        self.slots: list[Bucket | None] = [None] * size
+        self.newest = -1
+
+    @property
+    def horizon_seconds(self) -> int:
+        return self.resolution * self.size
+
+    def add(
+        self,
+        timestamp: float,
+        score: float,
+        confidence: float,
+        label: str,
+        tickers: Iterable[str],
+        weight: int = 1,
+    ) -> None:
+        index = int(timestamp // self.resolution)
+        if index <= self.newest - self.size:
+            return
+        if weight < 0:
+            bucket = self.get(index)
+            if bucket is not None:
+                bucket.add(score, confidence, label, tickers, weight)
+            return
+        self.newest = max(self.newest, index)
+        slot = index % self.size
+        bucket = self.slots[slot]
+        if bucket is None or bucket.index != index:
+            bucket = self.slots[slot] = Bucket(index)
+        bucket.add(score, confidence, label, tickers)
+
+    def get(self, index: int) -> Bucket | None:
+        if index <= self.newest - self.size:
+            return None
+        bucket = self.slots[index % self.size]
+        return bucket if bucket is not None and bucket.index == index else None
+
+    def aggregate(self, start: float, end: float) -> Bucket:
+        """Merge every bucket in `[start, end)`; both bounds must be multiples of the resolution."""
+        total = Bucket(int(start // self.resolution))
+        for index in range(int(start // self.resolution), int(end // self.resolution)):
+            bucket = self.get(index)
+            if bucket is not None:
+                total.merge(bucket)
+        return total
+
+
+class TimeBuckets:
+    """Per-minute buckets for recent hours rolled up into hourly buckets for multi-day windows.
+
+    Each item is added once to every level, so a window query merges at most `span / resolution` buckets of
+    the coarsest level that fits, independent of how many items fell inside it. With `track_tickers=False`
+    buckets keep no per-ticker counts, so their size no longer grows with the number of distinct symbols.
+    """
+
+    def __init__(self, levels: tuple[tuple[int, int], ...] = ((60, 720), (3600, 360)), track_tickers: bool = True):
+        self.levels = [BucketRing(resolution, size) for resolution, size in levels]
+        self.track_tickers = track_tickers
+
+    def add(self, timestamp: float, score: float, confidence: float, label: str, tickers: Iterable[str]) -> None:
+        tickers = tuple(tickers) if self.track_tickers else ()
+        for ring in self.levels:
+            ring.add(timestamp, score, confidence, label, tickers)
+
+    def remove(self, timestamp: float, score: float, confidence: float, label: str, tickers: Iterable[str]) -> None:
+        """Take back an earlier `add` with the same values, e.g. before re-adding a re-scored item."""
+        tickers = tuple(tickers) if self.track_tickers else ()
+        for ring in self.levels:
+            ring.add(timestamp, score, confidence, label, tickers, weight=-1)
+
+    def ring_for(self, span_seconds: int, step_seconds: int) -> BucketRing:
+        candidates = [
+            ring for ring in self.levels if step_seconds % ring.resolution == 0 and span_seconds <= ring.horizon_seconds
+        ]
+        if not candidates:
+            raise ValueError(f"No bucket level covers a {span_seconds}s window in {step_seconds}s steps.")
+        return max(candidates, key=lambda ring: ring.resolution)
+
+    def window(self, now: float, span_seconds: int, step_seconds: int) -> list[tuple[float, Bucket]]:
+        """`span / step` consecutive (start, bucket) pairs ending with the step that contains `now`."""
+        ring = self.ring_for(span_seconds, step_seconds)
+        end = math.floor(now / step_seconds) * step_seconds + step_seconds
+        steps = span_seconds // step_seconds
+        return [
+            (start, ring.aggregate(start, start + step_seconds))
+            for start in (end - step_seconds * (steps - offset) for offset in range(steps))
+        ]
+
+    def compare(self, now: float, span_seconds: int) -> tuple[Bucket, Bucket]:
+        """The trailing `span` up to `now` and the `span` before it, at the finest level holding both."""
+        candidates = [ring for ring in self.levels if 2 * span_seconds <= ring.horizon_seconds]
+        if not candidates:
+            raise ValueError(f"No bucket level covers two {span_seconds}s windows.")
+        ring = min(candidates, key=lambda ring: ring.resolution)
+        end = (math.floor(now / ring.resolution) + 1) * ring.resolution
+        return ring.aggregate(end - span_seconds, end), ring.aggregate(end - 2 * span_seconds, end - span_seconds)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "levels": [
+                {
+                    "resolutionSeconds": ring.resolution,
+                    "buckets": sum(1 for bucket in ring.slots if bucket is not None and ring.get(bucket.index) is bucket),
+                    "horizonSeconds": ring.horizon_seconds,
+                }
+                for ring in self.levels
+            ]
+        }
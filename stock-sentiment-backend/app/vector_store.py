@@ -1,47 +1,419 @@
+from __future__ import annotations
+
+import heapq
+import json
+import math
+import re
+import time
+import zlib
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
 import faiss
 import numpy as np
-from app.sentiment import get_sentiment
+
+WORD_PATTERN = re.compile(r"[a-z0-9$']+")
+# Exact search is fine up to here; past it the store switches to an inverted-file index.
+IVF_THRESHOLD = 100_000
+# Inverted lists probed per query once the store is IVF-backed.
+IVF_NPROBE = 16
+# Trailing windows, in seconds, that keep their own sentiment and entity summaries.
+SUMMARY_WINDOWS = (3600, 86400)
+SENTIMENT_LABELS = ("POSITIVE", "NEGATIVE", "NEUTRAL")
+INDEX_FILE = "index.faiss"
+META_FILE = "meta.json"
+
+
+def sentiment_label(sentiment: dict[str, Any]) -> str:
+    label = sentiment.get("label")
+    return label if label in SENTIMENT_LABELS else "NEUTRAL"
+
+
+class HashingEmbedder:
+    """Signed feature hashing of word unigrams and bigrams into `dim` buckets, L2-normalized.
+
+    Buckets come from CRC-32 seeded with `seed`, so a text embeds the same way in every process, unlike with the
+    built-in `hash`. Inner products of the vectors approximate the cosine similarity of the n-gram counts.
+    """
+
+    def __init__(self, dim: int = 512, seed: int = 0):
+        self.dim = dim
+        self.seed = seed
+
+    def features(self, text: str) -> list[str]:
+        tokens = WORD_PATTERN.findall(text.lower())
+        return tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+    def embed_many(self, texts: Iterable[str]) -> np.ndarray:
+        rows: list[int] = []
+        hashes: list[int] = []
+        count = 0
+        for row, text in enumerate(texts):
+            count = row + 1
+            for feature in self.features(text):
+                rows.append(row)
+                hashes.append(zlib.crc32(feature.encode("utf-8"), self.seed))
+        if not count:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        codes = np.asarray(hashes, dtype=np.uint64)
+        # The top bit picks the sign, so colliding features tend to cancel instead of piling up.
+        signs = np.where(codes >> np.uint64(31), -1.0, 1.0)
+        cells = np.asarray(rows, dtype=np.int64) * self.dim + (codes % np.uint64(self.dim)).astype(np.int64)
+        vectors = np.bincount(cells, weights=signs, minlength=count * self.dim).reshape(count, self.dim)
+        vectors = vectors.astype(np.float32)
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+
+class RankedCounter:
+    """Exact counts with their keys grouped by count, the groups linked from highest to lowest.
+
+    A unit change moves one key to a neighbouring group in O(1), and the top k are read in O(k) by walking groups
+    down from the highest. Within a group, keys come in the order they reached that count.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.groups: dict[int, dict[str, None]] = {}
+        # Links between the counts that have a group; 0 is the bottom of the list and never has a group.
+        self.higher: dict[int, int] = {}
+        self.lower: dict[int, int] = {}
+        self.top = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def link_above(self, count: int, new: int) -> None:
+        above = self.higher.get(count)
+        self.higher[count] = new
+        self.lower[new] = count
+        if above is None:
+            self.top = new
+        else:
+            self.higher[new] = above
+            self.lower[above] = new
+        self.groups[new] = {}
+
+    def leave(self, key: str, count: int) -> None:
+        group = self.groups[count]
+        del group[key]
+        if group:
+            return
+        del self.groups[count]
+        below = self.lower.pop(count)
+        above = self.higher.pop(count, None)
+        if above is None:
+            del self.higher[below]
+            self.top = below
+        else:
+            self.higher[below] = above
+            self.lower[above] = below
+
+    def add(self, key: str) -> None:
+        count = self.counts.get(key, 0)
+        if count + 1 not in self.groups:
+            self.link_above(count, count + 1)
+        self.groups[count + 1][key] = None
+        self.counts[key] = count + 1
+        if count:
+            self.leave(key, count)
+
+    def remove(self, key: str) -> None:
+        count = self.counts.get(key, 0)
+        if not count:
+            return
+        if count > 1:
+            if count - 1 not in self.groups:
+                self.link_above(self.lower[count], count - 1)
+            self.groups[count - 1][key] = None
+            self.counts[key] = count - 1
+        else:
+            del self.counts[key]
+        self.leave(key, count)
+
+    def most_common(self, n: int) -> list[tuple[str, int]]:
+        ranked: list[tuple[str, int]] = []
+        count = self.top
+        while count and len(ranked) < n:
+            for key in self.groups[count]:
+                ranked.append((key, count))
+                if len(ranked) == n:
+                    break
+            count = self.lower[count]
+        return ranked
+
+
+class ItemSummary:
+    """Sentiment label counts and entity mention counts over a changing set of items."""
+
+    def __init__(self) -> None:
+        self.sentiments = dict.fromkeys(SENTIMENT_LABELS, 0)
+        self.entities = RankedCounter()
+
+    def add(self, label: str, entities: list[str]) -> None:
+        self.sentiments[label] += 1
+        for entity in entities:
+            self.entities.add(entity)
+
+    def remove(self, label: str, entities: list[str]) -> None:
+        self.sentiments[label] -= 1
+        for entity in entities:
+            self.entities.remove(entity)
+
+
+class WindowSummary(ItemSummary):
+    """An `ItemSummary` of the items stamped within the last `seconds`; older ones leave as `expire` passes them."""
+
+    def __init__(self, seconds: int):
+        super().__init__()
+        self.seconds = seconds
+        self.members: set[int] = set()
+        self.expiry: list[tuple[float, int]] = []
+
+    def enter(self, item: int, timestamp: float, label: str, entities: list[str], now: float) -> None:
+        if timestamp < now - self.seconds:
+            return
+        self.members.add(item)
+        heapq.heappush(self.expiry, (timestamp, item))
+        self.add(label, entities)
+
+    def leave(self, item: int, label: str, entities: list[str]) -> None:
+        if item in self.members:
+            self.members.discard(item)
+            self.remove(label, entities)
+
+    def expire(self, now: float, lookup: Callable[[int], tuple[str, list[str]]]) -> None:
+        """Drop items older than the window; `lookup` gives the label and entities of a still-stored item."""
+        cutoff = now - self.seconds
+        while self.expiry and self.expiry[0][0] < cutoff:
+            _, item = heapq.heappop(self.expiry)
+            if item in self.members:
+                self.leave(item, *lookup(item))
+
 
 class VectorStore:
-    def __init__(self):
-        self.texts = []
-        self.ids = []
-        self.sentiments = []
-        self.entities = []
-        self.dim = 512
-        self.index = faiss.IndexFlatL2(self.dim)
-        self.embeddings = []
-
-    def add(self, id_, text, sentiment, entities):
-        embedding = self._dummy_embed(text)
-        self.index.add(np.array([embedding]).astype('float32'))
-        self.ids.append(id_)
-        self.texts.append(text)
-        self.sentiments.append(sentiment)
-        self.entities.append(entities)
-        self.embeddings.append(embedding)
-
-    def _dummy_embed(self, text):
-        # Dummy embedding: hash mod some range to vector of fixed dim
-        vec = np.zeros(self.dim, dtype=np.float32)
-        h = hash(text) % (10**8)
-        vec[0] = h % 1000 / 1000
-        vec[1] = (h // 1000) % 1000 / 1000
-        return vec
-
-    def get_sentiment_summary(self):
-        # Aggregate sentiment counts per label
-        summary = {"POSITIVE": 0, "NEGATIVE": 0, "NEUTRAL": 0}
-        for sent in self.sentiments:
-            label = sent.get("label")
-            if label in summary:
-                summary[label] += 1
-            else:
-                summary["NEUTRAL"] += 1
-        return summary
-
-    def get_top_entities(self, top_k=10):
-        from collections import Counter
-        all_entities = [e for sublist in self.entities for e in sublist]
-        counter = Counter(all_entities)
-        return counter.most_common(top_k)
+    """Items with their hashed embeddings in a FAISS inner-product index, searchable by similar text.
+
+    String ids map to int64 labels through `IndexIDMap2`, so items can be replaced and removed. Search is exact
+    until the store holds `ivf_threshold` items. It then trains an IVF index with 8-bit scalar quantization
+    (512 bytes per item at the default size) on the stored vectors and moves them into it. `save` writes the
+    index and the item metadata to a directory; `load(..., mmap=True)` maps an IVF index's lists from disk
+    instead of reading them, which leaves that store read-only.
+
+    Sentiment label counts and entity counts are kept up to date as items come and go, overall and for each of
+    `summary_windows` by item timestamp, so the summary queries cost O(k) however many items are stored.
+    """
+
+    def __init__(
+        self,
+        dim: int = 512,
+        seed: int = 0,
+        ivf_threshold: int = IVF_THRESHOLD,
+        nprobe: int = IVF_NPROBE,
+        summary_windows: Iterable[int] = SUMMARY_WINDOWS,
+    ):
+        self.embedder = HashingEmbedder(dim, seed)
+        self.dim = dim
+        self.ivf_threshold = ivf_threshold
+        self.nprobe = nprobe
+        self.index: Any = faiss.IndexIDMap2(faiss.IndexFlatIP(dim))
+        self.read_only = False
+        self.next_label = 0
+        self.labels: dict[str, int] = {}
+        self.ids: dict[int, str] = {}
+        self.texts: dict[int, str] = {}
+        self.sentiments: dict[int, dict[str, Any]] = {}
+        self.entities: dict[int, list[str]] = {}
+        self.timestamps: dict[int, float] = {}
+        self.summary = ItemSummary()
+        self.windows = {seconds: WindowSummary(seconds) for seconds in summary_windows}
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __contains__(self, id_: str) -> bool:
+        return id_ in self.labels
+
+    @property
+    def approximate(self) -> bool:
+        return isinstance(self.index, faiss.IndexIVF)
+
+    def add(
+        self,
+        id_: str,
+        text: str,
+        sentiment: dict[str, Any],
+        entities: list[str],
+        timestamp: float | None = None,
+    ) -> None:
+        self.add_many([(id_, text, sentiment, entities, timestamp)])
+
+    def add_many(self, records: Iterable[tuple[Any, ...]]) -> None:
+        """Embed and index a batch of `(id, text, sentiment, entities[, timestamp])`; a stored id is replaced.
+
+        `timestamp` (epoch seconds) places the item in the summary windows and defaults to now.
+        """
+        self.check_writable()
+        now = time.time()
+        batch: dict[str, tuple[str, dict[str, Any], list[str], float]] = {}
+        for id_, text, sentiment, entities, *rest in records:
+            timestamp = rest[0] if rest and rest[0] is not None else now
+            batch[id_] = (text, sentiment, list(entities), float(timestamp))
+        if not batch:
+            return
+        self.remove_many([id_ for id_ in batch if id_ in self.labels])
+
+        labels = np.arange(self.next_label, self.next_label + len(batch), dtype=np.int64)
+        self.next_label += len(batch)
+        vectors = self.embedder.embed_many(text for text, _, _, _ in batch.values())
+        self.index.add_with_ids(vectors, labels)
+        for label, (id_, record) in zip(labels.tolist(), batch.items()):
+            self.store(label, id_, *record, now=now)
+        if not self.approximate and len(self.labels) >= self.ivf_threshold:
+            self.build_ivf()
+
+    def remove(self, id_: str) -> bool:
+        return self.remove_many([id_]) > 0
+
+    def remove_many(self, ids: Iterable[str]) -> int:
+        self.check_writable()
+        labels = [self.labels.pop(id_) for id_ in set(ids) if id_ in self.labels]
+        if not labels:
+            return 0
+        self.index.remove_ids(np.asarray(labels, dtype=np.int64))
+        for label in labels:
+            sentiment = sentiment_label(self.sentiments.pop(label))
+            entities = self.entities.pop(label)
+            self.summary.remove(sentiment, entities)
+            for window in self.windows.values():
+                window.leave(label, sentiment, entities)
+            del self.ids[label], self.texts[label], self.timestamps[label]
+        return len(labels)
+
+    def store(
+        self,
+        label: int,
+        id_: str,
+        text: str,
+        sentiment: dict[str, Any],
+        entities: list[str],
+        timestamp: float,
+        now: float,
+    ) -> None:
+        self.labels[id_] = label
+        self.ids[label] = id_
+        self.texts[label] = text
+        self.sentiments[label] = sentiment
+        self.entities[label] = entities
+        self.timestamps[label] = timestamp
+        self.summary.add(sentiment_label(sentiment), entities)
+        for window in self.windows.values():
+            window.enter(label, timestamp, sentiment_label(sentiment), entities, now)
+
+    def search(self, text: str, k: int = 10) -> list[dict[str, Any]]:
+        return self.search_many([text], k)[0]
+
+    def search_many(self, texts: list[str], k: int = 10) -> list[list[dict[str, Any]]]:
+        """The `k` most similar stored items for each text, best first, with cosine `score`."""
+        if not texts:
+            return []
+        if not self.labels or k <= 0:
+            return [[] for _ in texts]
+        scores, labels = self.index.search(self.embedder.embed_many(texts), min(k, len(self.labels)))
+        return [
+            [
+                {"id": self.ids[label], "text": self.texts[label], "score": round(float(score), 4)}
+                for score, label in zip(row_scores.tolist(), row_labels.tolist())
+                if label in self.ids
+            ]
+            for row_scores, row_labels in zip(scores, labels)
+        ]
+
+    def build_ivf(self) -> None:
+        """Move every stored vector from the exact index into a freshly trained IVF index."""
+        flat = self.index
+        vectors = flat.index.reconstruct_n(0, flat.ntotal)
+        labels = faiss.vector_to_array(flat.id_map).astype(np.int64)
+        # About sqrt(n) lists, each centroid trained on up to 64 points (k-means wants at least 39).
+        nlist = max(1, min(int(math.sqrt(len(labels))), len(labels) // 39))
+        index = faiss.index_factory(self.dim, f"IVF{nlist},SQ8", faiss.METRIC_INNER_PRODUCT)
+        sample = vectors[np.random.default_rng(self.embedder.seed).permutation(len(vectors))[: nlist * 64]]
+        index.train(sample)
+        index.nprobe = self.nprobe
+        index.add_with_ids(vectors, labels)
+        self.index = index
+
+    def check_writable(self) -> None:
+        if self.read_only:
+            raise RuntimeError("This vector store was loaded with mmap=True and is read-only.")
+
+    def save(self, path: str | Path) -> None:
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        faiss.write_index(self.index, str(directory / INDEX_FILE))
+        meta = {
+            "dim": self.dim,
+            "seed": self.embedder.seed,
+            "ivfThreshold": self.ivf_threshold,
+            "nprobe": self.nprobe,
+            "nextLabel": self.next_label,
+            "summaryWindows": list(self.windows),
+            "items": [
+                [
+                    label,
+                    self.ids[label],
+                    self.texts[label],
+                    self.sentiments[label],
+                    self.entities[label],
+                    self.timestamps[label],
+                ]
+                for label in self.ids
+            ],
+        }
+        (directory / META_FILE).write_text(json.dumps(meta, separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = False) -> VectorStore:
+        directory = Path(path)
+        meta = json.loads((directory / META_FILE).read_text(encoding="utf-8"))
+        store = cls(
+            dim=meta["dim"],
+            seed=meta["seed"],
+            ivf_threshold=meta["ivfThreshold"],
+            nprobe=meta["nprobe"],
+            summary_windows=meta["summaryWindows"],
+        )
+        flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        store.index = faiss.read_index(str(directory / INDEX_FILE), flags)
+        if store.approximate:
+            store.index.nprobe = store.nprobe
+        store.read_only = mmap
+        store.next_label = meta["nextLabel"]
+        now = time.time()
+        for label, id_, text, sentiment, entities, timestamp in meta["items"]:
+            store.store(label, id_, text, sentiment, entities, timestamp, now)
+        return store
+
+    def summary_for(self, window_seconds: int | None) -> ItemSummary:
+        if window_seconds is None:
+            return self.summary
+        window = self.windows.get(window_seconds)
+        if window is None:
+            raise ValueError(f"No summary is kept for a {window_seconds}s window; choose from {sorted(self.windows)}.")
+        window.expire(time.time(), self.item_summary)
+        return window
+
+    def item_summary(self, label: int) -> tuple[str, list[str]]:
+        return sentiment_label(self.sentiments[label]), self.entities[label]
+
+    def get_sentiment_summary(self, window_seconds: int | None = None) -> dict[str, int]:
+        """Items per sentiment label, overall or over one of the summary windows; unknown labels count as neutral."""
+        return dict(self.summary_for(window_seconds).sentiments)
+
+    def get_top_entities(self, top_k: int = 10, window_seconds: int | None = None) -> list[tuple[str, int]]:
+        return self.summary_for(window_seconds).entities.most_common(top_k)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+TickerIndex = dict[str, dict[str, Any]]
+
+
+def lookup_rows(
+    index: TickerIndex,
+    tickers: Iterable[str],
+    missing: Callable[[str], dict[str, Any]],
+) -> Iterator[dict[str, Any]]:
+    for ticker in tickers:
+        row = index.get(ticker)
+        yield row if row is not None else missing(ticker)
+
+
+class SavedWatchlists:
+    """Named server-side watchlists whose rows are re-resolved once per published generation."""
+
+    def __init__(self, missing: Callable[[str], dict[str, Any]], path: Path | None = None, max_lists: int = 256):
+        self.missing = missing
+        self.path = path
+        self.max_lists = max_lists
+        self.tickers: dict[str, list[str]] = {}
+        self.rows: dict[str, list[dict[str, Any]]] = {}
+        self.generation = 0
+        self.load()
+
+    def save(self, name: str, tickers: list[str], index: TickerIndex, generation: int) -> None:
+        if name not in self.tickers and len(self.tickers) >= self.max_lists:
+            raise ValueError(f"At most {self.max_lists} saved watchlists are allowed.")
+        self.tickers[name] = tickers
+        self.rows[name] = list(lookup_rows(index, tickers, self.missing))
+        self.generation = max(self.generation, generation)
+        self.persist()
+
+    def delete(self, name: str) -> bool:
+        if self.tickers.pop(name, None) is None:
+            return False
+        self.rows.pop(name, None)
+        self.persist()
+        return True
+
+    def precompute(self, index: TickerIndex, generation: int) -> None:
+        self.rows = {name: list(lookup_rows(index, tickers, self.missing)) for name, tickers in self.tickers.items()}
+        self.generation = generation
+
+    def summary(self) -> list[dict[str, Any]]:
+        return [{"name": name, "count": len(tickers)} for name, tickers in sorted(self.tickers.items())]
+
+    def symbols(self) -> set[str]:
+        return {ticker for tickers in self.tickers.values() for ticker in tickers}
+
+    def load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            stored = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(stored, dict):
+            self.tickers = {str(name): [str(ticker) for ticker in tickers] for name, tickers in stored.items()}
+
+    def persist(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.tickers, indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import random
+import re
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+from xml.sax.saxutils import escape, quoteattr
+
+from app.lexicon import load_lexicon
+from app.main import RawFeedItem, fallback_items
+
+DEFAULT_SEED = 20240601
+LEXICON = load_lexicon()
+SNAPSHOT_PATH = Path(__file__).resolve().parents[2] / "stock-sentiment-frontend" / "data" / "snapshot.json"
+BASE_TIME = datetime(2024, 6, 1, 16, 0, tzinfo=timezone.utc)
+MEAN_GAP_SECONDS = 45.0
+FEED_DOCUMENT_ITEMS = 80
+TICKER_ZIPF_EXPONENT = 1.1
+EXTRA_TICKERS = (
+    "SPY", "QQQ", "JPM", "BAC", "XOM", "CVX", "UNH", "LLY", "AVGO", "ORCL",
+    "CRM", "SMCI", "GME", "AMC", "SOFI", "RIVN", "PYPL", "SHOP", "DIS", "BA",
+)
+
+NEWS_TEMPLATES = (
+    "{company} shares {move} after {catalyst}",
+    "{company} {move} as investors weigh {catalyst}",
+    "Analysts revisit {ticker} after {catalyst}",
+    "{company} outlook {move} on {catalyst}",
+)
+REDDIT_TEMPLATES = (
+    "${ticker} {move} or trap?",
+    "${ticker} calls after {catalyst}",
+    "Loading up on ${ticker} before {catalyst}",
+    "Is ${ticker} done after {catalyst}?",
+)
+MOVES = ("rally", "slide", "surge", "drop", "rebound", "stall", "jump", "slump")
+CATALYSTS = (
+    "earnings guidance",
+    "the Fed decision",
+    "a surprise acquisition",
+    "weak CPI data",
+    "new AI chip demand",
+    "layoff reports",
+    "battery supply news",
+    "a crypto selloff",
+    "record revenue",
+    "a downgrade",
+)
+
+
+class SyntheticCorpus:
+    """Deterministic feed generator seeded from the fallback items and the committed static snapshot.
+
+    Tickers follow a Zipf popularity curve, sources and base wording come from real items, and every
+    item mixes in lexicon and theme terms so enrichment exercises the same paths as live feeds. The
+    first `n` items of any larger corpus are identical for the same seed.
+    """
+
+    def __init__(self, seed: int = DEFAULT_SEED, snapshot_path: Path = SNAPSHOT_PATH):
+        self.seed = seed
+        self.documents = load_seed_documents(snapshot_path)
+        companies = {
+            ticker: name.upper() if len(name) <= 3 else name.title() for name, ticker in LEXICON.companies.items()
+        }
+        seen_tickers = {ticker for document in self.documents for ticker in document["tickers"]}
+        self.tickers = sorted(set(companies) | seen_tickers | set(EXTRA_TICKERS))
+        random.Random(seed).shuffle(self.tickers)
+        ranks = range(1, len(self.tickers) + 1)
+        self.ticker_weights = list(accumulate(1.0 / rank**TICKER_ZIPF_EXPONENT for rank in ranks))
+        self.companies = companies
+        self.positive_terms = sorted(LEXICON.positive)
+        self.negative_terms = sorted(LEXICON.negative)
+        self.intensifiers = sorted(LEXICON.intensifiers)
+        self.theme_terms = sorted({keyword for keywords in LEXICON.themes.values() for keyword in keywords})
+
+    def raw_items(self, count: int) -> list[RawFeedItem]:
+        return list(self.iter_raw_items(count))
+
+    def iter_raw_items(self, count: int) -> Iterator[RawFeedItem]:
+        rng = random.Random(self.seed)
+        published_at = BASE_TIME
+        for index in range(count):
+            document = rng.choice(self.documents)
+            source = document["source"]
+            ticker = rng.choices(self.tickers, cum_weights=self.ticker_weights)[0]
+            company = self.companies.get(ticker, ticker)
+
+            if rng.random() < 0.5:
+                title = retarget(document["title"], ticker, company)
+            else:
+                templates = REDDIT_TEMPLATES if source == "reddit" else NEWS_TEMPLATES
+                title = rng.choice(templates).format(
+                    company=company,
+                    ticker=ticker,
+                    move=rng.choice(MOVES),
+                    catalyst=rng.choice(CATALYSTS),
+                )
+
+            sentences = [retarget(document["text"], ticker, company)]
+            lean = self.positive_terms if rng.random() < document["positiveShare"] else self.negative_terms
+            for _ in range(rng.randint(0, 3)):
+                prefix = f"{rng.choice(self.intensifiers)} " if rng.random() < 0.2 else ""
+                sentences.append(f"Traders cite {prefix}{rng.choice(lean)} {rng.choice(self.theme_terms)}.")
+
+            published_at -= timedelta(seconds=rng.expovariate(1.0 / MEAN_GAP_SECONDS))
+            yield RawFeedItem(
+                id=f"{source}-{index:08d}",
+                source=source,
+                title=title,
+                url=f"https://example.com/{source}/{index}",
+                published_at=published_at,
+                text=" ".join(sentences),
+            )
+
+    def documents_for(self, items: list[RawFeedItem], source: str) -> list[str]:
+        """Render items as RSS (news) or Atom (reddit) documents of at most `FEED_DOCUMENT_ITEMS` entries."""
+        render = render_atom if source == "reddit" else render_rss
+        return [render(items[start : start + FEED_DOCUMENT_ITEMS]) for start in range(0, len(items), FEED_DOCUMENT_ITEMS)]
+
+
+def load_seed_documents(snapshot_path: Path) -> list[dict[str, Any]]:
+    documents = [
+        {"source": item.source, "title": item.title, "text": item.text, "tickers": [], "positiveShare": 0.5}
+        for item in fallback_items()
+    ]
+    if snapshot_path.exists():
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+        for row in snapshot_feed_rows(snapshot.get("feed", [])):
+            title = str(row.get("title", ""))
+            text = str(row.get("text", ""))
+            if title == "Untitled" or len(text) < 24:
+                continue
+            label = (row.get("sentiment") or {}).get("label", "neutral")
+            documents.append(
+                {
+                    "source": str(row.get("source", "news")),
+                    "title": title,
+                    "text": text[:600],
+                    "tickers": [str(ticker) for ticker in row.get("tickers", [])],
+                    "positiveShare": {"positive": 0.8, "negative": 0.2}.get(label, 0.5),
+                }
+            )
+    return documents
+
+
+def snapshot_feed_rows(feed: list[dict[str, Any]] | dict[str, Any]) -> list[dict[str, Any]]:
+    """The fields seeding needs from a snapshot feed, in row form or the generator's `--compact` columns."""
+    if isinstance(feed, list):
+        return feed
+    columns = feed["columns"]
+    dictionaries = feed["dictionaries"]
+    return [
+        {
+            "source": dictionaries["source"][columns["source"][index]],
+            "title": columns["title"][index],
+            "text": columns["text"][index],
+            "tickers": [dictionaries["tickers"][code] for code in columns["tickers"][index]],
+            "sentiment": {"label": dictionaries["label"][columns["label"][index]]},
+        }
+        for index in range(feed["count"])
+    ]
+
+
+def retarget(text: str, ticker: str, company: str) -> str:
+    text = re.sub(r"\$[A-Z]{1,5}\b", f"${ticker}", text)
+    for name in LEXICON.companies:
+        text = re.sub(rf"\b{re.escape(name)}\b", company, text, flags=re.IGNORECASE)
+    return text
+
+
+def render_rss(items: list[RawFeedItem]) -> str:
+    entries = "".join(
+        "<item>"
+        f"<title>{escape(item.title)}</title>"
+        f"<link>{escape(item.url)}</link>"
+        f"<description>{escape(f'<p>{escape(item.text)}</p>')}</description>"
+        f"<pubDate>{format_datetime(item.published_at)}</pubDate>"
+        "</item>"
+        for item in items
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Synthetic</title>{entries}</channel></rss>'
+
+
+def render_atom(items: list[RawFeedItem]) -> str:
+    entries = "".join(
+        "<entry>"
+        f"<title>{escape(item.title)}</title>"
+        f"<link href={quoteattr(item.url)}/>"
+        f"<updated>{item.published_at.isoformat()}</updated>"
+        f'<content type="html">{escape(f"<div><p>{escape(item.text)}</p></div>")}</content>'
+        "</entry>"
+        for item in items
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Any
+
+from app.main import (
+    build_dashboard_payload,
+    build_narratives,
+    build_overview,
+    build_sentiment_breakdown,
+    build_source_breakdown,
+    build_stats_overview,
+    build_theme_insights,
+    build_ticker_insights,
+    build_timeline,
+    collect_stream_stats,
+    diff_generations,
+    enrich_all,
+    enrich_item,
+    feed_order_key,
+    parse_news_feed,
+    parse_reddit_feed,
+    serialize_item,
+    text_codec,
+)
+from benchmarks.corpus import BASE_TIME, DEFAULT_SEED, SyntheticCorpus
+
+DEFAULT_SCALES = (120, 1_000, 10_000)
+PARSE_ITEM_LIMIT = 20_000
+DEFAULT_REPEAT = 3
+MIN_RUN_SECONDS = 0.2
+THROUGHPUT_THRESHOLD = 0.15
+MEMORY_THRESHOLD = 0.20
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_OUTPUT = BENCHMARK_DIR / "results" / "latest.json"
+
+
+@dataclass(slots=True)
+class StageResult:
+    scale: int
+    stage: str
+    items: int
+    seconds: float
+    median_seconds: float
+    items_per_second: float
+    peak_bytes: int | None
+    retained_bytes: int | None
+
+    def key(self) -> tuple[int, str]:
+        return self.scale, self.stage
+
+
+def build_stages(corpus: SyntheticCorpus, scale: int) -> list[tuple[str, int, Callable[[], Any]]]:
+    """Inputs are prepared outside the timed region; each callable runs exactly one stage over them."""
+    raw_items = corpus.raw_items(scale)
+    enriched = sorted((enrich_item(item) for item in raw_items), key=feed_order_key, reverse=True)
+    parse_items = raw_items[:PARSE_ITEM_LIMIT]
+    news_documents = corpus.documents_for(parse_items, "news")
+    reddit_documents = corpus.documents_for(parse_items, "reddit")
+
+    # diff_generations compares against a previous generation that shares ~90% of the items.
+    churn = max(1, scale // 10)
+    previous = enriched[churn:]
+    previous_overview = build_overview(previous)
+    previous_rows = build_ticker_insights(previous, top_n=None)
+    overview = build_overview(enriched)
+    ticker_rows = build_ticker_insights(enriched, top_n=None)
+    # What FeedCache keeps up to date incrementally; reading the overview from it is the per-publish cost.
+    stream_stats = collect_stream_stats(enriched)
+
+    return [
+        ("parse_news_feed", len(parse_items), lambda: [parse_news_feed(document) for document in news_documents]),
+        ("parse_reddit_feed", len(parse_items), lambda: [parse_reddit_feed(document) for document in reddit_documents]),
+        ("enrich_item", scale, lambda: [enrich_item(item) for item in raw_items]),
+        # Generates its own raw items and drains them, so retained bytes are the enriched items alone.
+        ("item_footprint", scale, lambda: enrich_all(corpus.raw_items(scale))),
+        ("build_overview", scale, lambda: build_overview(enriched)),
+        ("build_stats_overview", scale, lambda: build_stats_overview(stream_stats)),
+        ("build_sentiment_breakdown", scale, lambda: build_sentiment_breakdown(enriched)),
+        ("build_source_breakdown", scale, lambda: build_source_breakdown(enriched)),
+        ("build_timeline", scale, lambda: build_timeline(enriched, buckets=10)),
+        ("build_ticker_insights", scale, lambda: build_ticker_insights(enriched, top_n=None)),
+        ("build_theme_insights", scale, lambda: build_theme_insights(enriched, top_n=10)),
+        ("build_narratives", scale, lambda: build_narratives(enriched, limit=8)),
+        ("build_dashboard_payload", scale, lambda: build_dashboard_payload(enriched, BASE_TIME, False)),
+        (
+            "diff_generations",
+            scale,
+            lambda: diff_generations(
+                previous,
+                enriched,
+                previous_overview=previous_overview,
+                overview=overview,
+                previous_tickers={row["ticker"]: row for row in previous_rows},
+                ticker_rows=ticker_rows,
+                previous_trending=[row["ticker"] for row in previous_rows[:12]],
+            ),
+        ),
+        ("serialize_item", scale, lambda: [serialize_item(item) for item in enriched]),
+    ]
+
+
+def measure(scale: int, stage: str, items: int, run: Callable[[], Any], repeat: int, memory: bool) -> StageResult:
+    # Small corpora finish in microseconds; loop them until one sample is long enough to time reliably.
+    loops = 1
+    while True:
+        elapsed = time_loops(run, loops)
+        if elapsed >= MIN_RUN_SECONDS or loops >= 1 << 16:
+            break
+        loops *= 2
+    timings = [elapsed / loops] + [time_loops(run, loops) / loops for _ in range(repeat - 1)]
+
+    peak_bytes = retained_bytes = None
+    if memory:
+        # A separate pass: tracemalloc slows allocation-heavy code too much to share with the timed runs.
+        gc.collect()
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        output = run()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del output
+        peak_bytes, retained_bytes = peak - baseline, current - baseline
+
+    best = min(timings)
+    return StageResult(
+        scale=scale,
+        stage=stage,
+        items=items,
+        seconds=round(best, 6),
+        median_seconds=round(median(timings), 6),
+        items_per_second=round(items / best, 1) if best > 0 else float("inf"),
+        peak_bytes=peak_bytes,
+        retained_bytes=retained_bytes,
+    )
+
+
+def time_loops(run: Callable[[], Any], loops: int) -> float:
+    gc.collect()
+    started = perf_counter()
+    for _ in range(loops):
+        run()
+    return perf_counter() - started
+
+
+def run_suite(
+    scales: list[int],
+    seed: int,
+    repeat: int,
+    memory: bool,
+    stages: set[str] | None = None,
+) -> list[StageResult]:
+    corpus = SyntheticCorpus(seed=seed)
+    results = []
+    for scale in scales:
+        for stage, items, run in build_stages(corpus, scale):
+            if stages and stage not in stages:
+                continue
+            result = measure(scale, stage, items, run, repeat, memory)
+            results.append(result)
+            print(format_result(result), file=sys.stderr, flush=True)
+    return results
+
+
+def compare(
+    results: list[StageResult],
+    baseline: dict[str, Any],
+    throughput_threshold: float,
+    memory_threshold: float,
+) -> list[str]:
+    """Return one message per stage whose throughput dropped or peak memory grew past the thresholds."""
+    previous = {(row["scale"], row["stage"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for result in results:
+        row = previous.get(result.key())
+        if row is None:
+            continue
+        speed = result.items_per_second / row["items_per_second"] if row["items_per_second"] else 1.0
+        if speed < 1.0 - throughput_threshold:
+            regressions.append(f"{result.stage}@{result.scale}: throughput {speed:.0%} of baseline")
+        if result.peak_bytes is not None and row.get("peak_bytes"):
+            growth = result.peak_bytes / row["peak_bytes"]
+            if growth > 1.0 + memory_threshold:
+                regressions.append(f"{result.stage}@{result.scale}: peak memory {growth:.0%} of baseline")
+    return regressions
+
+
+def format_result(result: StageResult) -> str:
+    memory = ""
+    if result.peak_bytes is not None and result.retained_bytes is not None:
+        memory = (
+            f"{result.peak_bytes / result.items:10.0f} B/item peak"
+            f"{max(0, result.retained_bytes) / result.items:10.0f} B/item retained"
+        )
+    return f"{result.scale:>9} {result.stage:<26} {result.items_per_second:>14,.0f} items/s {memory}"
+
+
+def write_report(path: Path, results: list[StageResult], seed: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "compressedText": text_codec.name if text_codec.enabled else None,
+        "results": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the enrichment and aggregation engine on a synthetic corpus.")
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(scale) for scale in DEFAULT_SCALES),
+        help="Comma-separated corpus sizes, e.g. 120,1000,10000,100000,1000000.",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per stage; the fastest is kept.")
+    parser.add_argument("--stages", default="", help="Comma-separated stage names to run (default: all).")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass.")
+    parser.add_argument("--compress-text", action="store_true", help="Store item bodies compressed (SSD_COMPRESS_TEXT).")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to the baseline path as well.")
+    parser.add_argument("--throughput-threshold", type=float, default=THROUGHPUT_THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    text_codec.enabled = text_codec.enabled or args.compress_text
+    scales = [int(scale) for scale in args.scales.split(",") if scale.strip()]
+    stages = {stage.strip() for stage in args.stages.split(",") if stage.strip()} or None
+    results = run_suite(scales, args.seed, max(1, args.repeat), not args.no_memory, stages)
+
+    write_report(args.output, results, args.seed)
+    print(f"Wrote {len(results)} results to {args.output}")
+    if args.save_baseline:
+        write_report(args.baseline, results, args.seed)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one.")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("seed") != args.seed:
+        print(f"Baseline seed {baseline.get('seed')} differs from {args.seed}; comparison skipped.")
+        return 0
+    regressions = compare(results, baseline, args.throughput_threshold, args.memory_threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if not regressions:
+        print("No regressions against baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import random
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import aiohttp
+
+TICKERS = ("NVDA", "TSLA", "AAPL", "MSFT", "AMZN", "META", "AMD", "GOOGL", "PLTR", "COIN", "SPY", "GME")
+SOURCES = ("news", "reddit")
+SENTIMENTS = ("positive", "negative", "neutral")
+QUERIES = ("guidance", "fed", "earnings", "ai", "layoff", "crypto")
+
+
+@dataclass(slots=True)
+class Sample:
+    endpoint: str
+    status: int
+    seconds: float
+    size: int
+
+
+@dataclass(slots=True)
+class RunState:
+    """Per-run context shared by all workers, including what the service reported about its cache."""
+
+    random: random.Random
+    generation: int = 0
+    generations: set[int] = field(default_factory=set)
+    flags: Counter[str] = field(default_factory=Counter)
+
+
+RequestBuilder = Callable[[RunState], tuple[str, str, str, dict[str, Any] | None]]
+
+
+def pick(state: RunState, values: tuple[str, ...]) -> str:
+    return state.random.choice(values)
+
+
+def feed_request(state: RunState) -> tuple[str, str, str, dict[str, Any] | None]:
+    params = {"limit": str(state.random.choice((20, 40, 80))), "fields": "list"}
+    roll = state.random.random()
+    if roll < 0.3:
+        params["ticker"] = pick(state, TICKERS)
+    elif roll < 0.5:
+        params["source"] = pick(state, SOURCES)
+    elif roll < 0.65:
+        params["sentiment"] = pick(state, SENTIMENTS)
+    elif roll < 0.75:
+        params["q"] = pick(state, QUERIES)
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    return "feed", "GET", f"/api/feed?{query}", None
+
+
+def batch_request(state: RunState) -> tuple[str, str, str, dict[str, Any] | None]:
+    views = [
+        {"view": "dashboard", "params": {"fields": "list"}},
+        {"view": "feed", "params": {"limit": 80, "fields": "list"}},
+        {"view": "watchlist", "params": {"tickers": ",".join(TICKERS[:6])}},
+    ]
+    return "batch", "POST", "/api/batch", {"views": views}
+
+
+# Weighted roughly like the dashboard's own traffic: one batch/dashboard load per refresh tick, frequent
+# feed filtering and drill-downs, and a trickle of forced refreshes to exercise admission control.
+DEFAULT_MIX: dict[str, tuple[float, RequestBuilder]] = {
+    "dashboard": (25, lambda state: ("dashboard", "GET", "/api/dashboard?fields=list", None)),
+    "feed": (25, feed_request),
+    "batch": (10, batch_request),
+    "ticker": (10, lambda state: ("ticker", "GET", f"/api/ticker/{pick(state, TICKERS)}?fields=list", None)),
+    "watchlist": (8, lambda state: ("watchlist", "GET", f"/api/watchlist?tickers={','.join(TICKERS[:8])}", None)),
+    "insights": (7, lambda state: ("insights", "GET", f"/api/insights?ticker={pick(state, TICKERS)}", None)),
+    "trending": (5, lambda state: ("trending", "GET", "/api/trending-stocks?limit=15", None)),
+    "changes": (5, lambda state: ("changes", "GET", f"/api/changes?since={max(0, state.generation - 1)}", None)),
+    "health": (3, lambda state: ("health", "GET", "/api/health", None)),
+    "force_refresh": (2, lambda state: ("force_refresh", "GET", "/api/dashboard?force_refresh=true", None)),
+}
+
+
+async def worker(
+    session: aiohttp.ClientSession,
+    base_url: str,
+    mix: dict[str, tuple[float, RequestBuilder]],
+    state: RunState,
+    deadline: float,
+    samples: list[Sample],
+) -> None:
+    names = list(mix)
+    weights = [mix[name][0] for name in names]
+    while perf_counter() < deadline:
+        endpoint, method, path, body = mix[state.random.choices(names, weights)[0]][1](state)
+        started = perf_counter()
+        try:
+            async with session.request(method, base_url + path, json=body) as response:
+                payload = await response.read()
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            samples.append(Sample(endpoint, 0, perf_counter() - started, 0))
+            continue
+        samples.append(Sample(endpoint, status, perf_counter() - started, len(payload)))
+        if status == 200 and endpoint in {"dashboard", "force_refresh", "feed", "batch"}:
+            record_cache_state(state, payload)
+
+
+def record_cache_state(state: RunState, payload: bytes) -> None:
+    try:
+        body = json.loads(payload)
+    except ValueError:
+        return
+    generation = body.get("generation")
+    if isinstance(generation, int):
+        state.generation = max(state.generation, generation)
+        state.generations.add(generation)
+    for flag in ("cached", "coalesced", "throttled"):
+        if body.get(flag):
+            state.flags[flag] += 1
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    def describe(group: list[Sample]) -> dict[str, Any]:
+        latencies = sorted(sample.seconds for sample in group)
+        return {
+            "requests": len(group),
+            "errors": sum(1 for sample in group if sample.status == 0 or sample.status >= 500),
+            "statuses": dict(Counter(str(sample.status) for sample in group)),
+            "rps": round(len(group) / elapsed, 1) if elapsed else 0.0,
+            "bytes": sum(sample.size for sample in group),
+            "p50Ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p90Ms": round(percentile(latencies, 0.90) * 1000, 2),
+            "p99Ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "maxMs": round((latencies[-1] if latencies else 0.0) * 1000, 2),
+        }
+
+    by_endpoint: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+    return {
+        "elapsedSeconds": round(elapsed, 2),
+        "total": describe(samples),
+        "endpoints": {endpoint: describe(group) for endpoint, group in sorted(by_endpoint.items())},
+    }
+
+
+async def run_load(
+    base_url: str,
+    duration: float,
+    concurrency: int,
+    seed: int,
+    mix: dict[str, tuple[float, RequestBuilder]] = DEFAULT_MIX,
+    timeout: float = 30.0,
+) -> dict[str, Any]:
+    state = RunState(random=random.Random(seed))
+    samples: list[Sample] = []
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        started = perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(worker(session, base_url.rstrip("/"), mix, state, deadline, samples) for _ in range(concurrency))
+        )
+        elapsed = perf_counter() - started
+    report = summarize(samples, elapsed)
+    report["cache"] = {"generationsSeen": sorted(state.generations), "flags": dict(state.flags)}
+    return report
+
+
+def format_report(report: dict[str, Any]) -> str:
+    lines = [f"{'endpoint':<14} {'reqs':>7} {'err':>5} {'rps':>8} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}"]
+    rows = [*report["endpoints"].items(), ("TOTAL", report["total"])]
+    for name, row in rows:
+        lines.append(
+            f"{name:<14} {row['requests']:>7} {row['errors']:>5} {row['rps']:>8} "
+            f"{row['p50Ms']:>7}ms {row['p90Ms']:>7}ms {row['p99Ms']:>7}ms {row['maxMs']:>7}ms"
+        )
+    cache = report["cache"]
+    lines.append(f"generations seen: {cache['generationsSeen']}  flags: {cache['flags']}")
+    return "\n".join(lines)
+
+
+def parse_mix(value: str) -> dict[str, tuple[float, RequestBuilder]]:
+    """`dashboard=50,feed=50` reweights (and restricts) the default mix."""
+    if not value:
+        return DEFAULT_MIX
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown endpoint {name!r}; choose from {', '.join(DEFAULT_MIX)}")
+        mix[name] = (float(weight) if weight else DEFAULT_MIX[name][0], DEFAULT_MIX[name][1])
+    return mix
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay a weighted mix of /api requests and report latency percentiles.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent client loops.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--mix", default="", help="Endpoint weights, e.g. dashboard=50,feed=30,force_refresh=20.")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(
+        run_load(args.base_url, args.duration, max(1, args.concurrency), args.seed, parse_mix(args.mix), args.timeout)
+    )
+    print(format_report(report))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, fields
+from datetime import timedelta
+from email.utils import format_datetime
+from typing import Any
+
+from aiohttp import web
+
+from app.main import RawFeedItem, utc_now
+from benchmarks.corpus import DEFAULT_SEED, MEAN_GAP_SECONDS, SyntheticCorpus, render_atom, render_rss
+
+FEEDS = {"news": "/news.rss", "reddit": "/reddit.atom"}
+
+
+@dataclass(slots=True)
+class FixtureSettings:
+    items: int = 80
+    churn: float = 0.1
+    churn_interval_seconds: float = 30.0
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    malformed_rate: float = 0.0
+    etag: bool = True
+    trickle_bytes_per_second: int = 0
+    trickle_chunk_bytes: int = 1024
+
+    def update(self, values: dict[str, Any]) -> None:
+        for field in fields(self):
+            if field.name not in values:
+                continue
+            value, current = values[field.name], getattr(self, field.name)
+            if isinstance(current, bool):
+                setattr(self, field.name, parse_flag(value) if isinstance(value, str) else bool(value))
+            else:
+                setattr(self, field.name, type(current)(value))
+
+
+class FeedWindow:
+    """A sliding window over one synthetic item stream; each churn tick swaps the oldest items for new ones."""
+
+    def __init__(self, stream: Iterator[RawFeedItem], size: int):
+        self.stream = stream
+        self.items: deque[RawFeedItem] = deque(next(stream) for _ in range(size))
+        self.generation = 0
+        self.published_at = utc_now()
+
+    def advance(self, count: int, size: int) -> None:
+        for _ in range(count):
+            self.items.append(next(self.stream))
+        while len(self.items) > size:
+            self.items.popleft()
+        while len(self.items) < size:
+            self.items.append(next(self.stream))
+        self.generation += 1
+        self.published_at = utc_now()
+
+    def current(self) -> list[RawFeedItem]:
+        # Newest first, restamped relative to the tick so feeds look live regardless of the corpus epoch.
+        gap = timedelta(seconds=MEAN_GAP_SECONDS)
+        return [
+            RawFeedItem(
+                id=item.id,
+                source=item.source,
+                title=item.title,
+                url=item.url,
+                published_at=self.published_at - gap * rank,
+                text=item.text,
+            )
+            for rank, item in enumerate(reversed(self.items))
+        ]
+
+
+class FixtureFeeds:
+    def __init__(self, settings: FixtureSettings, seed: int = DEFAULT_SEED):
+        self.settings = settings
+        self.random = random.Random(seed)
+        self.windows = {
+            feed: FeedWindow(SyntheticCorpus(seed=seed + offset).iter_raw_items(10**12), settings.items)
+            for offset, feed in enumerate(FEEDS)
+        }
+        self.rendered: dict[str, tuple[int, bytes]] = {}
+        self.requests = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    def tick(self) -> None:
+        step = max(1, round(self.settings.items * self.settings.churn)) if self.settings.churn > 0 else 0
+        if step:
+            for window in self.windows.values():
+                window.advance(step, self.settings.items)
+
+    def body(self, feed: str) -> tuple[int, bytes]:
+        window = self.windows[feed]
+        cached = self.rendered.get(feed)
+        if cached is None or cached[0] != window.generation:
+            render = render_atom if feed == "reddit" else render_rss
+            cached = (window.generation, render(window.current()).encode("utf-8"))
+            self.rendered[feed] = cached
+        return cached
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "notModified": self.not_modified,
+            "errors": self.errors,
+            "generations": {feed: window.generation for feed, window in self.windows.items()},
+            "settings": asdict(self.settings),
+        }
+
+
+async def serve_feed(request: web.Request) -> web.StreamResponse:
+    feeds: FixtureFeeds = request.app["feeds"]
+    settings = feeds.settings
+    feed = request.match_info["feed"]
+    feeds.requests += 1
+
+    delay = settings.latency_ms + feeds.random.uniform(0, settings.jitter_ms)
+    if delay > 0:
+        await asyncio.sleep(delay / 1000.0)
+    if feeds.random.random() < settings.error_rate:
+        feeds.errors += 1
+        return web.Response(status=settings.error_status, text="injected failure")
+
+    generation, body = feeds.body(feed)
+    window = feeds.windows[feed]
+    content_type = "application/atom+xml" if feed == "reddit" else "application/rss+xml"
+    headers = {
+        "Content-Type": f"{content_type}; charset=utf-8",
+        "Last-Modified": format_datetime(window.published_at, usegmt=True),
+    }
+    if settings.etag:
+        etag = f'"{feed}-{generation}"'
+        headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            feeds.not_modified += 1
+            return web.Response(status=304, headers=headers)
+
+    if feeds.random.random() < settings.malformed_rate:
+        body = body[: len(body) // 2]
+
+    if settings.trickle_bytes_per_second <= 0:
+        return web.Response(body=body, headers=headers)
+
+    response = web.StreamResponse(headers=headers)
+    response.content_length = len(body)
+    await response.prepare(request)
+    chunk = max(1, settings.trickle_chunk_bytes)
+    for start in range(0, len(body), chunk):
+        await response.write(body[start : start + chunk])
+        await asyncio.sleep(chunk / settings.trickle_bytes_per_second)
+    await response.write_eof()
+    return response
+
+
+async def control(request: web.Request) -> web.Response:
+    """GET returns counters and settings; POST a JSON object to change settings mid-run (or {"tick": true})."""
+    feeds: FixtureFeeds = request.app["feeds"]
+    if request.method == "POST":
+        values = await request.json()
+        if values.pop("tick", False):
+            feeds.tick()
+        try:
+            feeds.settings.update(values)
+        except (TypeError, ValueError) as error:
+            return web.json_response({"error": str(error)}, status=400)
+    return web.json_response(feeds.stats())
+
+
+async def churn_forever(app: web.Application) -> None:
+    feeds: FixtureFeeds = app["feeds"]
+    while True:
+        await asyncio.sleep(max(0.1, feeds.settings.churn_interval_seconds))
+        feeds.tick()
+
+
+async def start_churn(app: web.Application) -> None:
+    app["churn"] = asyncio.create_task(churn_forever(app))
+
+
+async def stop_churn(app: web.Application) -> None:
+    app["churn"].cancel()
+
+
+def create_app(settings: FixtureSettings, seed: int = DEFAULT_SEED) -> web.Application:
+    app = web.Application()
+    app["feeds"] = FixtureFeeds(settings, seed)
+    app.router.add_get("/{feed:news}.rss", serve_feed)
+    app.router.add_get("/{feed:reddit}.atom", serve_feed)
+    app.router.add_route("*", "/control", control)
+    app.on_startup.append(start_churn)
+    app.on_cleanup.append(stop_churn)
+    return app
+
+
+def parse_flag(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve synthetic RSS/Atom feeds for offline load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    defaults = FixtureSettings()
+    for field in fields(FixtureSettings):
+        flag = "--" + field.name.replace("_", "-")
+        default = getattr(defaults, field.name)
+        if isinstance(default, bool):
+            parser.add_argument(flag, type=parse_flag, default=default)
+        else:
+            parser.add_argument(flag, type=type(default), default=default)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    settings = FixtureSettings(**{field.name: getattr(args, field.name) for field in fields(FixtureSettings)})
+    print(f"News:   SSD_NEWS_RSS_URL=http://{args.host}:{args.port}{FEEDS['news']}")
+    print(f"Reddit: SSD_REDDIT_RSS_URL=http://{args.host}:{args.port}{FEEDS['reddit']}")
+    web.run_app(create_app(settings, args.seed), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
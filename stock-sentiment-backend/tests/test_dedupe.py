@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import os
+import random
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from app.dedupe import (
+    MAX_DISTANCE,
+    SIGNATURE_BITS,
+    WORD_PATTERN,
+    DuplicateClusters,
+    NearDuplicateIndex,
+    hamming,
+    pair_hash,
+    simhash,
+    token_hash,
+)
+
+BACKEND = Path(__file__).resolve().parents[1]
+WORDS = "stocks rally shares fall guidance beats misses chip demand rates cut fed bank earnings growth outlook".split()
+HEADLINE = (
+    "Nvidia shares rally after upbeat guidance as chip demand from data centers keeps growing and analysts "
+    "raise price targets across the semiconductor group ahead of next week earnings"
+)
+UNRELATED = (
+    "Treasury yields climb as traders price in fewer rate cuts from the Federal Reserve while the dollar firms "
+    "against major currencies and gold slips"
+)
+
+
+def naive_simhash(text: str) -> int:
+    tokens = WORD_PATTERN.findall(text.lower())
+    hashes = [token_hash(token) for token in tokens]
+    features = set(hashes) | {pair_hash(first, second) for first, second in zip(hashes, hashes[1:])}
+    signature = 0
+    for bit in range(SIGNATURE_BITS):
+        if sum(feature >> bit & 1 for feature in features) > len(features) // 2:
+            signature |= 1 << bit
+    return signature
+
+
+def test_bit_sliced_simhash_matches_naive_tally():
+    rng = random.Random(7)
+    texts = ["", "one", "two words", HEADLINE]
+    texts += [" ".join(rng.choices(WORDS, k=rng.randint(1, 60))) for _ in range(200)]
+    for text in texts:
+        signature, tokens = simhash(text)
+        assert signature == naive_simhash(text)
+        assert tokens == len(WORD_PATTERN.findall(text.lower()))
+
+
+def test_simhash_is_stable_across_processes():
+    script = f"from app.dedupe import simhash; print(simhash({HEADLINE!r})[0])"
+    signatures = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=BACKEND,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        for seed in ("1", "2")
+    }
+    assert signatures == {str(simhash(HEADLINE)[0])}
+
+
+def test_simhash_keeps_small_edits_close():
+    signature, _ = simhash(HEADLINE)
+    words = HEADLINE.split()
+    distances = [
+        hamming(signature, simhash(" ".join([*words[:position], "surprise", *words[position + 1 :]]))[0])
+        for position in range(len(words))
+    ]
+    assert statistics.median(distances) <= MAX_DISTANCE
+    assert hamming(signature, simhash(UNRELATED)[0]) > 3 * MAX_DISTANCE
+
+
+def test_index_finds_every_signature_within_distance():
+    rng = random.Random(8)
+    index = NearDuplicateIndex()
+    signatures = {f"id-{number}": rng.getrandbits(SIGNATURE_BITS) for number in range(300)}
+    for item_id, signature in signatures.items():
+        index.add(item_id, signature)
+    for _ in range(200):
+        probe = rng.choice(list(signatures.values()))
+        for bit in rng.sample(range(SIGNATURE_BITS), rng.randint(0, MAX_DISTANCE)):
+            probe ^= 1 << bit
+        _, expected = min((hamming(probe, signature), item_id) for item_id, signature in signatures.items())
+        assert index.nearest(probe) == expected
+
+
+def test_index_discard_removes_all_bands():
+    index = NearDuplicateIndex()
+    index.add("first", 0)
+    index.add("second", 0)
+    index.discard("first")
+    index.discard("missing")
+    assert index.nearest(1) == "second"
+    index.discard("second")
+    assert len(index) == 0
+    assert all(not table for table in index.bands)
+    assert index.nearest(0) is None
+
+
+def test_clusters_assign_and_discard():
+    clusters = DuplicateClusters()
+    assert clusters.assign("a", HEADLINE, ("NVDA",)) is None
+    assert clusters.assign("a", HEADLINE, ("NVDA",)) is None
+    assert clusters.assign("b", f"  {HEADLINE.upper()} ", ("NVDA",)) == "a"
+    assert clusters.assign("c", HEADLINE.replace("keeps", "is"), ("NVDA",)) == "a"
+    assert clusters.duplicates("a") == 2
+    assert "c" in clusters
+
+    clusters.discard("a")
+    assert "b" not in clusters and "c" not in clusters
+    assert clusters.summary() == {"maxDistance": MAX_DISTANCE, "indexed": 0, "clusters": 0, "duplicates": 0}
+    assert clusters.assign("d", HEADLINE, ("NVDA",)) is None
+
+
+def test_clusters_require_equal_keys_and_enough_tokens():
+    clusters = DuplicateClusters()
+    clusters.assign("nvda", HEADLINE, ("NVDA",))
+    assert clusters.assign("amd", HEADLINE.replace("Nvidia", "AMD"), ("AMD",)) is None
+    clusters.assign("short", "Stocks rally today", ())
+    assert clusters.assign("short-edit", "Stocks rally again today", ()) is None
+    assert clusters.summary()["clusters"] == 0
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+main = pytest.importorskip("app.main")
+
+
+def live_items(count: int) -> list:
+    now = main.utc_now()
+    return [
+        main.RawFeedItem(
+            id=f"live-{number}",
+            source="news",
+            title=f"Microsoft shares climb after cloud growth beats forecasts {number}",
+            url=f"https://example.com/{number}",
+            published_at=now - timedelta(minutes=number),
+            text=f"Microsoft MSFT reported strong Azure demand and raised guidance for quarter {number}.",
+        )
+        for number in range(count)
+    ]
+
+
+def test_fallback_items_give_way_to_the_first_live_fetch(monkeypatch):
+    fetches = [[], [], live_items(3)]
+
+    async def fetch() -> list:
+        return fetches.pop(0)
+
+    monkeypatch.setattr(main, "fetch_all_sources", fetch)
+    cache = main.FeedCache()
+    asyncio.run(cache.refresh())
+    fallback_ids = {item.id for item in cache.items}
+    assert fallback_ids and all(item_id.startswith("fallback-") for item_id in fallback_ids)
+
+    asyncio.run(cache.refresh())
+    assert {item.id for item in cache.items} == fallback_ids
+
+    asyncio.run(cache.refresh())
+    assert [item.id for item in cache.items] == ["live-0", "live-1", "live-2"]
+    assert set(cache.history[-1].removed) == fallback_ids
+    assert cache.stats.total.count == 3
+    assert cache.overview["totalItems"] == 3
+    assert set(cache.stats.tickers.groups) == {"MSFT"}
+    for ring in cache.timebuckets.levels:
+        assert sum(bucket.count for bucket in ring.slots if bucket is not None) == 3
+    assert not fallback_ids.intersection(cache.terms.lookup(cache.terms.postings))
+    assert not cache.fallback_ids
+    assert cache.retention.usage()["evictions"] == {}
+    assert cache.narrative_rows == main.build_narratives(cache.items, limit=8)
+    assert cache.sentiment_counts == main.build_sentiment_breakdown(cache.items)
+    assert cache.source_counts == main.build_source_breakdown(cache.items)
+
+
+def test_approximate_mode_keeps_no_exact_ticker_state(monkeypatch):
+    fetches = [live_items(3)]
+
+    async def fetch() -> list:
+        return fetches.pop(0)
+
+    monkeypatch.setattr(main, "fetch_all_sources", fetch)
+    monkeypatch.setattr(main, "TRENDING_MODE", "approximate")
+    cache = main.FeedCache()
+    monkeypatch.setattr(main, "cache", cache)
+    asyncio.run(cache.refresh())
+    assert cache.stats.total.count == 3 and not cache.stats.tickers.groups
+    assert all(not bucket.ticker_counts for ring in cache.timebuckets.levels for bucket in ring.slots if bucket)
+    assert cache.overview["activeTickers"] == 1
+    assert list(cache.ticker_rows) == ["MSFT"]
+
+    view = main.build_timeline_view(main.ViewContext(cache.snapshot(cached=True)), window="24h", ticker="MSFT")
+    assert sum(point["mentions"] for point in view["points"]) == 3
+    assert view["momentum"]["current"]["mentions"] == 3
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+import random
+import statistics
+
+import pytest
+
+from app.moments import MomentGroups, Moments, StreamStats
+
+TICKERS = ("AAPL", "MSFT", "NVDA", "TSLA", "AMZN")
+THEMES = ("earnings", "ai", "rates")
+LABELS = ("positive", "negative", "neutral")
+
+
+def close(first: float, second: float) -> bool:
+    return math.isclose(first, second, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def assert_matches(moments: Moments, values: list[float]) -> None:
+    assert moments.count == len(values)
+    if values:
+        assert close(moments.mean, statistics.fmean(values))
+        assert close(moments.variance, statistics.pvariance(values))
+    else:
+        assert (moments.mean, moments.m2) == (0.0, 0.0)
+
+
+def random_items(seed: int, count: int) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "timestamp": 1_700_000_000 + rng.randrange(0, 3600),
+            "value": round(rng.uniform(-1, 1), 4),
+            "tickers": tuple(rng.sample(TICKERS, rng.randint(0, 2))),
+            "themes": tuple(rng.sample(THEMES, rng.randint(0, 1))),
+            "source": rng.choice(("news", "reddit")),
+            "label": rng.choice(LABELS),
+        }
+        for _ in range(count)
+    ]
+
+
+def record(stats: StreamStats, item: dict, remove: bool = False) -> None:
+    fields = dict(item)
+    (stats.remove if remove else stats.add)(fields.pop("timestamp"), fields.pop("value"), **fields)
+
+
+def test_moments_match_statistics_under_add_and_remove():
+    rng = random.Random(3)
+    values = [rng.uniform(-1, 1) for _ in range(500)]
+    moments = Moments.of(values)
+    assert_matches(moments, values)
+    for value in values[:300]:
+        moments.remove(value)
+    assert_matches(moments, values[300:])
+    for value in values[300:]:
+        moments.remove(value)
+    assert_matches(moments, [])
+
+
+def test_moments_merge_matches_concatenation():
+    rng = random.Random(4)
+    parts = [[rng.gauss(0, 1) for _ in range(rng.randint(0, 40))] for _ in range(12)]
+    merged = Moments.combined(Moments.of(part) for part in parts)
+    assert_matches(merged, [value for part in parts for value in part])
+
+
+def test_moment_groups_drop_empty_keys():
+    groups = MomentGroups()
+    groups.add("AAPL", 0.5)
+    groups.add("AAPL", -0.5)
+    groups.remove("AAPL", 0.5)
+    groups.remove("MSFT", 0.5)
+    assert len(groups) == 1
+    groups.remove("AAPL", -0.5)
+    assert len(groups) == 0
+    assert groups.get("AAPL").count == 0
+
+
+def test_stream_stats_removal_matches_fresh_build():
+    items = random_items(5, 400)
+    kept = items[150:]
+    stats = StreamStats()
+    for item in items:
+        record(stats, item)
+    for item in items[:150]:
+        record(stats, item, remove=True)
+    fresh = StreamStats()
+    for item in kept:
+        record(fresh, item)
+
+    assert_matches(stats.total, [item["value"] for item in kept])
+    for attribute, key in (("tickers", "tickers"), ("themes", "themes")):
+        groups = getattr(stats, attribute)
+        assert {name for name, _ in groups} == {name for name, _ in getattr(fresh, attribute)}
+        for name, moments in groups:
+            assert_matches(moments, [item["value"] for item in kept if name in item[key]])
+    for label in LABELS:
+        assert_matches(stats.labels.get(label), [item["value"] for item in kept if item["label"] == label])
+    assert stats.chunk_order == fresh.chunk_order == sorted(fresh.chunks)
+    assert stats.summary() == fresh.summary()
+
+
+def test_stream_stats_window_and_halves():
+    items = random_items(6, 300)
+    stats = StreamStats(chunk_seconds=60)
+    for item in items:
+        record(stats, item)
+    start, end = 1_700_000_580, 1_700_001_780  # chunk-aligned
+    assert_matches(stats.window(start, end), [item["value"] for item in items if start <= item["timestamp"] < end])
+    assert stats.window(0, 1).count == 0
+
+    older, newer = stats.halves()
+    assert (older.count, newer.count) == (len(items) // 2, len(items) - len(items) // 2)
+    assert_matches(Moments.combined((older, newer)), [item["value"] for item in items])
+
+
+def test_halves_split_an_oversized_oldest_chunk():
+    stats = StreamStats(chunk_seconds=60)
+    for value in (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7):
+        stats.add(10, value)
+    for value in (-0.5, -0.7, -0.9):
+        stats.add(70, value)
+    older, newer = stats.halves()
+    assert (older.count, newer.count) == (5, 5)
+    assert close(older.mean, 0.4)
+    assert close(newer.mean, (2 * 0.4 - 2.1) / 5)
+    assert_matches(Moments.combined((older, newer)), [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, -0.5, -0.7, -0.9])
+
+    single = StreamStats(chunk_seconds=60)
+    for value in (0.2, 0.4, 0.6):
+        single.add(10, value)
+    assert [part.count for part in single.halves()] == [1, 2]
+
+
+def test_stream_stats_window_expiry_empties_chunks():
+    stats = StreamStats(chunk_seconds=60)
+    stats.add(30, 0.5, tickers=("AAPL",))
+    stats.add(90, -0.5, tickers=("AAPL",))
+    stats.remove(30, 0.5, tickers=("AAPL",))
+    assert stats.chunk_order == [1]
+    assert_matches(stats.window(0, 120), [-0.5])
+    stats.remove(90, -0.5, tickers=("AAPL",))
+    assert stats.chunk_order == []
+    assert stats.summary()["tickers"] == 0
+
+
+def test_stats_overview_matches_brute_force():
+    main = pytest.importorskip("app.main")
+    items = main.enrich_all(main.fallback_items())
+    stats = main.collect_stream_stats(items[:3])
+    main.record_stream_stats(stats, items[3:])
+    main.record_stream_stats(stats, items[:3], remove=True)
+    kept = items[3:]
+    overview = main.build_stats_overview(stats)
+    assert overview == main.build_overview(kept)
+
+    scores = [item.sentiment_score for item in kept]
+    assert overview["totalItems"] == len(kept)
+    assert overview["sentimentIndex"] == round(statistics.fmean(scores) * 100, 2)
+    assert overview["volatilityIndex"] == round(statistics.pstdev(scores) * 100, 2)
+    assert overview["activeTickers"] == len({ticker for item in kept for ticker in item.tickers})
+    positive = sum(item.sentiment_label == "positive" for item in kept)
+    assert overview["positiveRatio"] == round(positive / len(kept) * 100, 2)
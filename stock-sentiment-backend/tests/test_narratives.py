@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+from app.narratives import UNTHEMED, NarrativeIndex
+
+THEMES = ("AI", "Rates", "Earnings", "Energy")
+
+
+def brute_force(items: dict[str, tuple], limit: int) -> list[tuple]:
+    """Theme, mentions, rounded mean and lead id, ranked like the dashboard narratives."""
+    groups: dict[str, list[tuple]] = {}
+    for item_id, (timestamp, themes, score, weight) in items.items():
+        for theme in themes or (UNTHEMED,):
+            groups.setdefault(theme, []).append((weight, timestamp, item_id, score))
+    rows = []
+    for theme, members in groups.items():
+        mean = sum(member[3] for member in members) / len(members)
+        lead = max(members, key=lambda member: (member[0], member[1]))
+        rows.append((theme, len(members), round(mean * 100, 2), lead[2]))
+    rows.sort(key=lambda row: (row[1], abs(row[2])), reverse=True)
+    return rows[:limit]
+
+
+def index_rows(index: NarrativeIndex, limit: int) -> list[tuple]:
+    return [
+        (theme, moments.count, round(moments.mean * 100, 2), index.lead(theme))
+        for theme, moments in index.ranked(limit)
+    ]
+
+
+def test_index_matches_brute_force_under_add_remove_and_rescore():
+    rng = random.Random(5)
+    index = NarrativeIndex()
+    items: dict[str, tuple] = {}
+    for step in range(2000):
+        if items and rng.random() < 0.45:
+            item_id = rng.choice(list(items))
+            index.remove(item_id, items.pop(item_id)[2])
+            if rng.random() < 0.3:
+                rescored = (step, rng.sample(THEMES, rng.randint(0, 2)), rng.uniform(-1, 1), rng.random())
+                index.add(item_id, *rescored)
+                items[item_id] = rescored
+        else:
+            item = (step, rng.sample(THEMES, rng.randint(0, 2)), rng.uniform(-1, 1), round(rng.random(), 1))
+            index.add(f"id-{step}", *item)
+            items[f"id-{step}"] = item
+        if step % 25 == 0:
+            expected = {(row[0], row[1], row[3]): row[2] for row in brute_force(items, len(THEMES) + 1)}
+            actual = {(row[0], row[1], row[3]): row[2] for row in index_rows(index, len(THEMES) + 1)}
+            assert actual.keys() == expected.keys()
+            assert all(abs(actual[key] - expected[key]) <= 0.01 for key in expected)
+    for item_id, item in list(items.items()):
+        index.remove(item_id, item[2])
+    assert index.ranked(8) == [] and index.heaps == {} and index.live == {}
+
+
+def test_heaps_stay_proportional_to_live_items():
+    index = NarrativeIndex()
+    for number in range(1000):
+        index.add(f"id-{number}", number, ("AI",), 0.5, number / 1000)
+        if number >= 10:
+            index.remove(f"id-{number - 10}", 0.5)
+    assert len(index.heaps["AI"]) <= 2 * 10
+    assert index.lead("AI") == "id-999"
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.retention import RetentionPolicy, RetentionStore
+
+WINDOWS = {"news": timedelta(hours=24), "reddit": timedelta(hours=6)}
+DEFAULT_WINDOW = timedelta(hours=12)
+
+
+def make_store(max_bytes: int) -> RetentionStore[tuple]:
+    return RetentionStore(
+        RetentionPolicy(max_bytes=max_bytes, max_age=WINDOWS, default_max_age=DEFAULT_WINDOW),
+        key=lambda item: (item[0], item[1]),
+        source=lambda item: item[2],
+        size=lambda item: item[3],
+    )
+
+
+def expected_survivors(items: list[tuple], now: datetime, max_bytes: int) -> list[tuple]:
+    """Brute force: drop expired items, then the oldest until under budget; newest first."""
+    kept = sorted(item for item in items if item[0] >= now - WINDOWS.get(item[2], DEFAULT_WINDOW))
+    total = sum(item[3] for item in kept)
+    while total > max_bytes:
+        total -= kept.pop(0)[3]
+    return kept[::-1]
+
+
+def test_eviction_matches_brute_force():
+    rng = random.Random(21)
+    for max_bytes in (10**9, 5000, 20000):
+        store = make_store(max_bytes)
+        retained: list[tuple] = []
+        now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for step in range(80):
+            now += timedelta(minutes=rng.randint(1, 120))
+            batch = [
+                (
+                    now - timedelta(minutes=rng.randint(0, 3000)),
+                    f"id-{step}-{number}",
+                    rng.choice(("news", "reddit", "other")),
+                    rng.randint(50, 400),
+                )
+                for number in range(rng.randint(0, 20))
+            ]
+            store.merge(batch)
+            removed = store.evict(now)
+            survivors = expected_survivors(retained + batch, now, max_bytes)
+            assert store.newest_first() == survivors
+            assert sorted(removed) == sorted(set(retained + batch).difference(survivors))
+            assert store.bytes == sum(item[3] for item in survivors) <= max_bytes
+            retained = survivors
+
+
+def test_usage_reports_oldest_per_source():
+    store = make_store(10**9)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    store.merge([(now - timedelta(hours=2), "a", "news", 10), (now - timedelta(hours=1), "b", "reddit", 20)])
+    store.merge([(now - timedelta(hours=3), "c", "news", 30)])
+    usage = store.usage()
+    assert usage["items"] == 3 and usage["bytes"] == 60
+    assert usage["sources"]["news"]["oldest"] == (now - timedelta(hours=3)).isoformat()
+    assert store.evict(now + timedelta(hours=6)) == [(now - timedelta(hours=1), "b", "reddit", 20)]
+    assert "reddit" not in store.usage()["sources"]
+    assert store.usage()["evictions"] == {"age": 1}
+
+
+def test_remove_is_not_an_eviction():
+    store = make_store(10**9)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    store.merge([(now, "a", "news", 10), (now - timedelta(minutes=1), "b", "news", 20), (now, "c", "reddit", 5)])
+    assert [item[1] for item in store.remove(["b", "c", "missing"])] in (["b", "c"], ["c", "b"])
+    assert [item[1] for item in store.newest_first()] == ["a"]
+    assert store.bytes == 10
+    assert store.usage()["evictions"] == {}
+    assert list(store.orders) == ["news"]
+
+
+def test_newest_reads_one_source_in_order():
+    store = make_store(10**9)
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    store.merge([(now - timedelta(minutes=minutes), f"n{minutes}", "news", 1) for minutes in (5, 1, 3)])
+    store.merge([(now, "r0", "reddit", 1)])
+    assert [item[1] for item in store.newest("news", 2)] == ["n1", "n3"]
+    assert [item[1] for item in store.newest("news", 10)] == ["n1", "n3", "n5"]
+    assert store.newest("other", 5) == []
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+
+from app.sketches import CountMinSketch, HeavyHitters, SpaceSaving
+
+TICKERS = [f"T{index:03d}" for index in range(200)]
+
+
+def zipf_stream(seed: int, length: int) -> list[str]:
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(len(TICKERS))]
+    return rng.choices(TICKERS, weights=weights, k=length)
+
+
+def test_count_min_never_undercounts_and_rarely_exceeds_bound():
+    sketch = CountMinSketch.from_error(epsilon=0.01, delta=0.01)
+    stream = zipf_stream(1, 5000)
+    for ticker in stream:
+        sketch.add(sketch.slots(ticker))
+    exact = Counter(stream)
+    overcounts = [sketch.estimate(sketch.slots(ticker)) - exact[ticker] for ticker in TICKERS]
+    assert min(overcounts) >= 0
+    # The bound holds per key with probability 1 - delta, so a few keys may miss it.
+    missed = sum(overcount > sketch.error_bound for overcount in overcounts)
+    assert missed <= math.ceil(2 * sketch.delta * len(TICKERS))
+    assert sketch.total == len(stream)
+
+
+def test_count_min_scale():
+    sketch = CountMinSketch(width=64, depth=3)
+    slots = sketch.slots("AAPL")
+    sketch.add(slots, 8)
+    sketch.scale(0.5)
+    assert sketch.estimate(slots) == 4
+    assert sketch.total == 4
+
+
+def test_space_saving_bounds():
+    summary = SpaceSaving(capacity=20)
+    stream = zipf_stream(2, 5000)
+    for ticker in stream:
+        summary.add(ticker)
+    exact = Counter(stream)
+    assert len(summary.counts) == 20
+    for ticker, count, error in summary.top():
+        assert count - error <= exact[ticker] <= count
+    for ticker in set(TICKERS).difference(summary.counts):
+        assert exact[ticker] <= summary.floor
+    assert summary.top(1)[0][0] == exact.most_common(1)[0][0]
+
+
+def test_space_saving_removal_drops_exhausted_keys():
+    summary = SpaceSaving(capacity=4)
+    summary.add("AAPL", 2)
+    summary.add("MSFT")
+    summary.add("AAPL", -2)
+    summary.add("NVDA", -1)
+    assert summary.counts == {"MSFT": 1}
+    assert summary.errors == {"MSFT": 0.0}
+
+
+def test_heavy_hitters_remove_takes_back_add():
+    hitters = HeavyHitters(capacity=8, epsilon=0.01, delta=0.01)
+    hitters.add(100.0, ("AAPL", "MSFT"), 0.5, "positive")
+    hitters.add(110.0, ("AAPL",), -0.25, "negative")
+    hitters.add(110.0, ("AAPL",), -0.25, "negative", weight=-1)
+    assert hitters.items == 1
+    estimate = hitters.estimate("AAPL")
+    assert estimate.mentions == 1
+    assert estimate.score_sum == 0.5
+    assert (estimate.bullish, estimate.bearish) == (1, 0)
+    assert estimate.recent_mentions == 1
+
+
+def test_heavy_hitters_decay_per_window():
+    hitters = HeavyHitters(capacity=8, epsilon=0.01, delta=0.01, window_seconds=60, decay=0.5)
+    for _ in range(4):
+        hitters.add(0.0, ("AAPL",), 1.0, "positive")
+    hitters.add(130.0, ("MSFT",), 0.0, "neutral")
+    aapl = hitters.estimate("AAPL")
+    assert aapl.mentions == 1
+    assert aapl.score_sum == 1
+    assert aapl.recent_mentions == 0
+    # A late item lands already decayed to the current window.
+    hitters.add(65.0, ("MSFT",), 0.0, "neutral")
+    assert hitters.estimate("MSFT").mentions == 1.5
+    assert [estimate.ticker for estimate in hitters.ranked(2)] == ["MSFT", "AAPL"]
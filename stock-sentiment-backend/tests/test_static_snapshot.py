@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "generate_static_snapshot.py"
+
+
+@pytest.fixture(scope="module")
+def snapshot():
+    spec = importlib.util.spec_from_file_location("generate_static_snapshot", SCRIPT)
+    module = sys.modules[spec.name] = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def saved_state(snapshot, path: Path):
+    state = snapshot.SnapshotState(validators={"https://example.com/rss": {"etag": '"v1"'}}, lexicon_version="v1")
+    for raw in snapshot.fallback_items()[:3]:
+        item = snapshot.enrich_item(raw)
+        item.id = item.id.replace("fallback-", "news-")
+        state.items[item.id] = item
+    snapshot.save_state(state, path)
+    return state
+
+
+def test_ids_match_the_api(snapshot):
+    main = pytest.importorskip("app.main")
+    assert [item.id for item in snapshot.fallback_items()] == [item.id for item in main.fallback_items()]
+
+
+def test_state_round_trips_and_other_id_schemes_are_discarded(snapshot, tmp_path):
+    path = tmp_path / "state.json"
+    state = saved_state(snapshot, path)
+    loaded = snapshot.load_state(path)
+    assert list(loaded.items) == list(state.items) and loaded.validators == state.validators
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**payload, "idHash": "fnv-32"}), encoding="utf-8")
+    discarded = snapshot.load_state(path)
+    assert discarded.items == {} and discarded.validators == {}
+
+
+def test_write_shards_repairs_damaged_shards(snapshot, tmp_path):
+    payload = snapshot.build_snapshot(feeds=[], state=snapshot.SnapshotState())
+    manifest = snapshot.write_shards(tmp_path, payload)
+    paths = sorted(snapshot.manifest_paths(manifest))
+    expected = {path: (tmp_path / path).read_bytes() for path in paths}
+
+    truncated, swapped = tmp_path / paths[0], tmp_path / paths[1]
+    truncated.write_bytes(expected[paths[0]][:10])
+    swapped.write_bytes(bytes(reversed(expected[paths[1]])))
+    assert snapshot.write_shards(tmp_path, payload) == manifest
+    assert {path: (tmp_path / path).read_bytes() for path in paths} == expected
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_lexicon_edits_that_keep_the_version_are_rescored(snapshot, tmp_path, monkeypatch):
+    data = json.loads(snapshot.LEXICON_PATH.read_text(encoding="utf-8"))
+    lexicon_path = tmp_path / "lexicon.json"
+    lexicon_path.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(snapshot, "lexicon_source", snapshot.LexiconSource(lexicon_path))
+    state_path = tmp_path / "state.json"
+    saved_state(snapshot, state_path)
+    state = snapshot.load_state(state_path)
+    assert snapshot.build_snapshot(feeds=[], state=state)["meta"]["rescoredItems"] == 0
+    snapshot.save_state(state, state_path)
+
+    lexicon_path.write_text(json.dumps({**data, "positive": {}, "negative": {}}), encoding="utf-8")
+    monkeypatch.setattr(snapshot, "lexicon_source", snapshot.LexiconSource(lexicon_path))
+    assert snapshot.lexicon_source.current.version == state.lexicon_version
+    state = snapshot.load_state(state_path)
+    assert snapshot.build_snapshot(feeds=[], state=state)["meta"]["rescoredItems"] > 0
+    assert {item.sentiment_score for item in state.items.values()} == {0.0}
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+pytest.importorskip("faiss")
+
+from app import vector_store  # noqa: E402
+from app.vector_store import RankedCounter, VectorStore  # noqa: E402
+
+ENTITIES = [f"E{index}" for index in range(30)]
+LABELS = ("POSITIVE", "NEGATIVE", "NEUTRAL", "MIXED")
+WORDS = "nvidia apple tesla shares rally fall guidance earnings chip demand rates fed outlook growth".split()
+
+
+def check_ranked(counter: RankedCounter, exact: Counter) -> None:
+    exact = +exact  # drops keys counted back to zero
+    assert counter.counts == dict(exact)
+    assert len(counter) == len(counter.counts)
+    assert set(counter.groups) == set(counter.counts.values())
+    assert counter.top == max(counter.counts.values(), default=0)
+    ranked = counter.most_common(len(exact) + 1)
+    assert sorted(ranked, key=lambda pair: pair[1], reverse=True) == ranked
+    assert {key: count for key, count in ranked} == counter.counts
+    for n in (0, 1, 5):
+        assert [count for _, count in counter.most_common(n)] == [count for _, count in exact.most_common(n)]
+
+
+def test_ranked_counter_matches_counter():
+    rng = random.Random(11)
+    counter = RankedCounter()
+    exact: Counter = Counter()
+    for step in range(3000):
+        key = rng.choice(ENTITIES[:12])
+        if rng.random() < 0.45:
+            counter.remove(key)
+            if exact[key]:
+                exact[key] -= 1
+        else:
+            counter.add(key)
+            exact[key] += 1
+        if step % 50 == 0:
+            check_ranked(counter, exact)
+    for key in list(exact):
+        while exact[key]:
+            counter.remove(key)
+            exact[key] -= 1
+    check_ranked(counter, exact)
+    assert counter.higher == {} and counter.lower == {}
+
+
+def test_ranked_counter_orders_ties_by_arrival():
+    counter = RankedCounter()
+    for key in ("a", "b", "c", "b", "a"):
+        counter.add(key)
+    assert counter.most_common(3) == [("b", 2), ("a", 2), ("c", 1)]
+
+
+def random_records(seed: int, count: int, now: float) -> list[tuple]:
+    rng = random.Random(seed)
+    return [
+        (
+            f"item-{number}",
+            " ".join(rng.choices(WORDS, k=12)),
+            {"label": rng.choice(LABELS)},
+            rng.sample(ENTITIES, rng.randint(0, 3)),
+            now - rng.uniform(0, 2 * 86400),
+        )
+        for number in range(count)
+    ]
+
+
+def brute_force(records: dict[str, tuple], since: float | None = None) -> tuple[dict[str, int], Counter]:
+    sentiments = dict.fromkeys(("POSITIVE", "NEGATIVE", "NEUTRAL"), 0)
+    entities: Counter = Counter()
+    for _, sentiment, names, timestamp in records.values():
+        if since is not None and timestamp < since:
+            continue
+        label = sentiment["label"] if sentiment["label"] in sentiments else "NEUTRAL"
+        sentiments[label] += 1
+        entities.update(names)
+    return sentiments, entities
+
+
+def check_summaries(store: VectorStore, records: dict[str, tuple], now: float) -> None:
+    for window in (None, *store.windows):
+        sentiments, entities = brute_force(records, None if window is None else now - window)
+        assert store.get_sentiment_summary(window) == sentiments
+        top = store.get_top_entities(len(ENTITIES), window)
+        assert dict(top) == dict(entities)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(vector_store.time, "time", lambda: now[0])
+    return now
+
+
+def test_summaries_follow_add_replace_remove_and_expiry(clock):
+    store = VectorStore(dim=64)
+    records = random_records(12, 300, clock[0])
+    store.add_many(records)
+    stored = {id_: record for id_, *record in records}
+    check_summaries(store, stored, clock[0])
+
+    replaced = random_records(13, 40, clock[0])
+    store.add_many(replaced)
+    stored.update({id_: record for id_, *record in replaced})
+    removed = [f"item-{number}" for number in range(40, 120)]
+    assert store.remove_many([*removed, "missing"]) == len(removed)
+    for id_ in removed:
+        del stored[id_]
+    assert len(store) == len(stored)
+    check_summaries(store, stored, clock[0])
+
+    clock[0] += 1800
+    check_summaries(store, stored, clock[0])
+    clock[0] += 86400
+    check_summaries(store, stored, clock[0])
+    assert store.get_sentiment_summary(3600) == dict.fromkeys(("POSITIVE", "NEGATIVE", "NEUTRAL"), 0)
+    with pytest.raises(ValueError):
+        store.get_sentiment_summary(60)
+
+
+def test_items_older_than_a_window_never_enter_it(clock):
+    store = VectorStore(dim=64)
+    store.add("old", "nvidia shares fall", {"label": "NEGATIVE"}, ["NVDA"], clock[0] - 7200)
+    store.add("new", "nvidia shares rally", {"label": "POSITIVE"}, ["NVDA"])
+    assert store.get_top_entities(1, 3600) == [("NVDA", 1)]
+    assert store.get_top_entities(1) == [("NVDA", 2)]
+    store.remove("new")
+    assert store.get_top_entities(1, 3600) == []
+
+
+def test_search_finds_stored_text_exact_and_ivf(clock):
+    records = random_records(14, 400, clock[0])
+    exact = VectorStore(dim=64)
+    approximate = VectorStore(dim=64, ivf_threshold=200, nprobe=64)
+    exact.add_many(records)
+    approximate.add_many(records)
+    assert not exact.approximate and approximate.approximate
+    for store in (exact, approximate):
+        for _, text, *_ in records[:20]:
+            hits = store.search(text, k=3)
+            assert hits[0]["score"] == pytest.approx(1.0, abs=1e-2)
+            assert text in {hit["text"] for hit in hits if hit["score"] >= hits[0]["score"] - 1e-3}
+    approximate.remove("item-0")
+    assert all(hit["id"] != "item-0" for hit in approximate.search(records[0][1], k=10))
+
+
+def test_save_and_load_round_trip(tmp_path, clock):
+    store = VectorStore(dim=64, ivf_threshold=200)
+    records = random_records(15, 250, clock[0])
+    store.add_many(records)
+    store.save(tmp_path)
+
+    loaded = VectorStore.load(tmp_path)
+    assert len(loaded) == len(store)
+    assert loaded.get_sentiment_summary(86400) == store.get_sentiment_summary(86400)
+    assert loaded.search(records[3][1], k=5) == store.search(records[3][1], k=5)
+    loaded.add("extra", "apple earnings", {"label": "POSITIVE"}, ["AAPL"])
+    assert "extra" in loaded
+
+    mapped = VectorStore.load(tmp_path, mmap=True)
+    assert mapped.search(records[3][1], k=5) == store.search(records[3][1], k=5)
+    with pytest.raises(RuntimeError):
+        mapped.remove("item-3")
@@ -96,6 +96,8 @@ const dom = {
 
 const DEFAULT_WATCHLIST = ["AAPL", "MSFT", "NVDA", "TSLA"];
 const REFRESH_INTERVAL_MS = 60_000;
+const FEED_LIMIT = 80;
+const ITEM_FIELDS_PROFILE = "list";
 const AUTH_USERS_KEY = "ssd_auth_users_v1";
 const AUTH_SESSION_KEY = "ssd_auth_session_v1";
 const WATCHLIST_KEY_GUEST = "ssd_watchlist_guest";
@@ -116,11 +118,17 @@ const state = {
   },
   dashboard: null,
   feed: [],
+  feedGeneration: null,
+  feedSync: null,
+  feedSyncPending: false,
+  dashboardFetchedAt: 0,
   watchlist: loadWatchlist(),
   watchlistData: [],
   bookmarks: loadBookmarks(),
   alerts: loadAlerts(),
   staticSnapshot: null,
+  staticManifest: undefined,
+  staticShards: new Map(),
   staticFallbackNotified: false,
   filters: {
     source: "",
@@ -143,6 +151,8 @@ const state = {
   },
   autoRefresh: true,
   timerId: null,
+  liveStream: null,
+  streamConnected: false,
   searchDebounceId: null,
   firedAlertIds: new Set(),
 };
@@ -493,8 +503,28 @@ function setRoute(route, options = {}) {
 async function refreshAll(forceRefresh = false) {
   setRefreshing(true);
   try {
-    const dashboard = await fetchJson(`/api/dashboard?force_refresh=${String(forceRefresh)}`);
+    const batch = await fetchBatch(
+      [
+        { view: "dashboard", params: { fields: ITEM_FIELDS_PROFILE } },
+        { view: "feed", params: Object.fromEntries(feedQueryParams()) },
+        { view: "watchlist", params: { tickers: state.watchlist.join(",") } },
+      ],
+      forceRefresh,
+    );
+
+    if (batch) {
+      const [dashboard, feedResponse, watchlistResponse] = batch;
+      state.dashboard = dashboard;
+      state.dashboardFetchedAt = Date.now();
+      renderDashboard();
+      applyFeedResponse(feedResponse);
+      applyWatchlistResponse(watchlistResponse);
+      return;
+    }
+
+    const dashboard = await fetchJson(`/api/dashboard?fields=${ITEM_FIELDS_PROFILE}&force_refresh=${String(forceRefresh)}`);
     state.dashboard = dashboard;
+    state.dashboardFetchedAt = Date.now();
     renderDashboard();
 
     await Promise.all([refreshFeed(forceRefresh), refreshWatchlistData(forceRefresh)]);
@@ -506,48 +536,52 @@ async function refreshAll(forceRefresh = false) {
   }
 }
 
+function feedQueryParams() {
+  const params = new URLSearchParams({ limit: String(FEED_LIMIT), fields: ITEM_FIELDS_PROFILE });
+  if (state.filters.source) {
+    params.set("source", state.filters.source);
+  }
+  if (state.filters.sentiment) {
+    params.set("sentiment", state.filters.sentiment);
+  }
+  if (state.filters.search) {
+    params.set("q", state.filters.search);
+  }
+  if (state.filters.ticker) {
+    params.set("ticker", state.filters.ticker);
+  }
+  return params;
+}
+
 async function refreshFeed(forceRefresh = false) {
   showFeedSkeleton();
   try {
-    const params = new URLSearchParams({ limit: "80", force_refresh: String(forceRefresh) });
-    if (state.filters.source) {
-      params.set("source", state.filters.source);
-    }
-    if (state.filters.sentiment) {
-      params.set("sentiment", state.filters.sentiment);
-    }
-    if (state.filters.search) {
-      params.set("q", state.filters.search);
-    }
-    if (state.filters.ticker) {
-      params.set("ticker", state.filters.ticker);
-    }
-
+    const params = feedQueryParams();
+    params.set("force_refresh", String(forceRefresh));
     const response = await fetchJson(`/api/feed?${params.toString()}`);
-    state.feed = response.items ?? [];
-    renderFeed(state.feed);
-    renderFeedMetrics(state.feed);
-    renderBookmarks();
-    renderActiveFilterPill();
-    renderAccountSummary();
+    applyFeedResponse(response);
   } catch (error) {
     dom.feedList.innerHTML = `<div class="empty-state">Unable to load feed. ${escapeHtml(error.message)}</div>`;
     renderFeedMetrics([]);
   }
 }
 
+function applyFeedResponse(response) {
+  state.feed = response.items ?? [];
+  state.feedGeneration = Number.isInteger(response.generation) ? response.generation : null;
+  renderFeed(state.feed);
+  renderFeedMetrics(state.feed);
+  renderBookmarks();
+  renderActiveFilterPill();
+  renderAccountSummary();
+}
+
 async function refreshWatchlistData(forceRefresh = false) {
   try {
     const tickerList = state.watchlist.join(",");
     const params = new URLSearchParams({ tickers: tickerList, force_refresh: String(forceRefresh) });
     const response = await fetchJson(`/api/watchlist?${params.toString()}`);
-    state.watchlistData = response.items ?? [];
-    renderWatchlistGrid();
-    renderAlerts();
-    renderCompareOptions();
-    evaluateAlerts();
-    renderWatchtowerInsights();
-    renderAccountSummary();
+    applyWatchlistResponse(response);
   } catch (error) {
     dom.watchlistGrid.innerHTML = `<div class="empty-state">Watchlist unavailable. ${escapeHtml(error.message)}</div>`;
     renderAlerts();
@@ -555,6 +589,16 @@ async function refreshWatchlistData(forceRefresh = false) {
   }
 }
 
+function applyWatchlistResponse(response) {
+  state.watchlistData = response.items ?? [];
+  renderWatchlistGrid();
+  renderAlerts();
+  renderCompareOptions();
+  evaluateAlerts();
+  renderWatchtowerInsights();
+  renderAccountSummary();
+}
+
 function renderDashboard() {
   const dashboard = state.dashboard;
   if (!dashboard) {
@@ -775,6 +819,7 @@ function renderFeed(items) {
           <span class="sentiment-pill ${sentimentClass}">${toTitleCase(sentiment.label || "neutral")} ${formatSigned(sentiment.score || 0)}</span>
           <span class="badge">Confidence ${Number(sentiment.confidence || 0).toFixed(1)}%</span>
           <span class="badge">${formatRelativeTime(item.publishedAt)}</span>
+          ${item.duplicates ? `<span class="badge">+${item.duplicates} similar</span>` : ""}
           ${themes}
           ${tickers}
         </div>
@@ -1661,12 +1706,147 @@ function setAutoRefresh(enabled) {
   }
 
   if (state.autoRefresh) {
+    connectLiveStream();
     state.timerId = window.setInterval(() => {
+      if (state.streamConnected) {
+        return;
+      }
       refreshAll(false).catch(() => {
         toast("Background refresh failed", "warn");
       });
     }, REFRESH_INTERVAL_MS);
+  } else {
+    disconnectLiveStream();
+  }
+}
+
+function connectLiveStream() {
+  if (state.liveStream || typeof window.EventSource !== "function") {
+    return;
+  }
+
+  const source = new EventSource(`${state.apiBase}/api/stream`);
+  state.liveStream = source;
+
+  source.addEventListener("open", () => {
+    state.streamConnected = true;
+  });
+  source.addEventListener("delta", (event) => {
+    applyGenerationDelta(JSON.parse(event.data));
+  });
+  source.addEventListener("resync", () => {
+    refreshAll(false).catch(() => {
+      toast("Background refresh failed", "warn");
+    });
+  });
+  source.addEventListener("error", () => {
+    state.streamConnected = false;
+    if (state.staticFallbackNotified) {
+      disconnectLiveStream();
+    }
+  });
+}
+
+function disconnectLiveStream() {
+  if (state.liveStream) {
+    state.liveStream.close();
   }
+  state.liveStream = null;
+  state.streamConnected = false;
+}
+
+function applyGenerationDelta(delta) {
+  if (!state.dashboard) {
+    return;
+  }
+
+  const changedRows = new Map((delta.tickers || []).map((row) => [row.ticker, row]));
+  const removedTickers = new Set(delta.removedTickers || []);
+  const knownRows = new Map((state.dashboard.trending || []).map((row) => [row.ticker, row]));
+  const order = delta.trending || (state.dashboard.trending || []).map((row) => row.ticker);
+
+  state.dashboard = {
+    ...state.dashboard,
+    generatedAt: delta.generatedAt || state.dashboard.generatedAt,
+    overview: { ...state.dashboard.overview, ...(delta.overview || {}) },
+    trending: order
+      .filter((symbol) => !removedTickers.has(symbol))
+      .map((symbol) => changedRows.get(symbol) || knownRows.get(symbol))
+      .filter(Boolean),
+  };
+  renderDashboard();
+
+  if (changedRows.size && state.watchlistData.some((row) => changedRows.has(row.ticker))) {
+    applyWatchlistResponse({ items: state.watchlistData.map((row) => changedRows.get(row.ticker) || row) });
+  }
+
+  if ((delta.added || []).length || (delta.removed || []).length || (delta.updated || []).length) {
+    syncFeedChanges().catch(() => {
+      toast("Background refresh failed", "warn");
+    });
+  }
+
+  // Themes, narratives and the timeline are not in deltas, so reload them at the old polling cadence.
+  if (Date.now() - state.dashboardFetchedAt >= REFRESH_INTERVAL_MS) {
+    state.dashboardFetchedAt = Date.now();
+    fetchJson(`/api/dashboard?fields=${ITEM_FIELDS_PROFILE}`)
+      .then((dashboard) => {
+        state.dashboard = dashboard;
+        renderDashboard();
+      })
+      .catch(() => {});
+  }
+}
+
+async function syncFeedChanges() {
+  // One request at a time; deltas arriving meanwhile are picked up by a single follow-up request.
+  if (state.feedSync) {
+    state.feedSyncPending = true;
+    return state.feedSync;
+  }
+  state.feedSync = (async () => {
+    do {
+      state.feedSyncPending = false;
+      if (state.feedGeneration === null) {
+        await refreshAll(false);
+        return;
+      }
+      const changes = await fetchJson(`/api/changes?since=${state.feedGeneration}&fields=${ITEM_FIELDS_PROFILE}`);
+      if (changes.resync) {
+        await refreshAll(false);
+        return;
+      }
+      applyFeedChanges(changes);
+    } while (state.feedSyncPending);
+  })();
+  try {
+    await state.feedSync;
+  } finally {
+    state.feedSync = null;
+  }
+}
+
+function applyFeedChanges(changes) {
+  const removed = new Set(changes.removed || []);
+  const updated = new Map((changes.updated || []).map((item) => [item.id, item]));
+  const filters = {
+    source: state.filters.source,
+    sentiment: state.filters.sentiment,
+    ticker: state.filters.ticker,
+    q: state.filters.search,
+  };
+  const kept = state.feed.filter((item) => !removed.has(item.id)).map((item) => updated.get(item.id) || item);
+  const keptIds = new Set(kept.map((item) => item.id));
+  const added = filterSnapshotFeed(changes.added || [], filters).filter((item) => !keptIds.has(item.id));
+
+  state.feed = [...added, ...kept]
+    .sort((a, b) => Date.parse(b.publishedAt || 0) - Date.parse(a.publishedAt || 0))
+    .slice(0, FEED_LIMIT);
+  state.feedGeneration = changes.generation;
+  renderFeed(state.feed);
+  renderFeedMetrics(state.feed);
+  renderBookmarks();
+  renderAccountSummary();
 }
 
 function onSaveApiBase() {
@@ -1680,6 +1860,11 @@ function onSaveApiBase() {
   localStorage.setItem("ssd_api_base", input);
   toast("API base saved");
 
+  disconnectLiveStream();
+  if (state.autoRefresh) {
+    connectLiveStream();
+  }
+
   refreshAll(true).catch(() => {
     toast("Could not connect to API", "error");
   });
@@ -1772,6 +1957,31 @@ async function fetchJson(path) {
   }
 }
 
+async function fetchBatch(views, forceRefresh = false) {
+  if (state.staticFallbackNotified) {
+    return null;
+  }
+
+  try {
+    const response = await fetch(`${state.apiBase}/api/batch`, {
+      method: "POST",
+      headers: { Accept: "application/json", "Content-Type": "application/json" },
+      body: JSON.stringify({ views, force_refresh: forceRefresh }),
+    });
+    if (!response.ok) {
+      return null;
+    }
+    const payload = await response.json();
+    const results = payload.results ?? [];
+    if (results.length !== views.length || results.some((row) => row.error)) {
+      return null;
+    }
+    return results.map((row) => row.data);
+  } catch {
+    return null;
+  }
+}
+
 async function tryStaticFallback(path) {
   if (!String(path).startsWith("/api/")) {
     return null;
@@ -1791,6 +2001,11 @@ async function tryStaticFallback(path) {
 }
 
 async function resolveStaticApi(path) {
+  const manifest = await loadStaticManifest();
+  if (manifest) {
+    return resolveShardedApi(manifest, path);
+  }
+
   const snapshot = await loadStaticSnapshot();
   const request = new URL(path, "https://local.snapshot");
   const route = request.pathname;
@@ -1906,6 +2121,197 @@ async function resolveStaticApi(path) {
   throw new Error(`No static route for ${route}`);
 }
 
+async function resolveShardedApi(manifest, path) {
+  const request = new URL(path, "https://local.snapshot");
+  const route = request.pathname;
+  const params = request.searchParams;
+  const shards = manifest.shards || {};
+  const generatedAt = manifest.generatedAt || new Date().toISOString();
+  const itemCount = Number(manifest.itemCount || 0);
+
+  if (route === "/api/dashboard") {
+    return loadStaticShard(shards.dashboard);
+  }
+
+  if (route === "/api/feed") {
+    const limit = toBoundedInteger(params.get("limit"), 40, 1, 200);
+    const query = String(params.get("q") || "").trim();
+    const positions = await filterShardPositions(manifest, {
+      source: params.get("source"),
+      sentiment: params.get("sentiment"),
+      ticker: params.get("ticker"),
+    });
+    if (query) {
+      // Text search has no index: load only the pages holding the already-filtered positions.
+      const matches = filterSnapshotFeed(await loadShardedFeedItems(manifest, positions), { q: query });
+      return { generatedAt, cached: true, count: matches.length, items: matches.slice(0, limit) };
+    }
+    return {
+      generatedAt,
+      cached: true,
+      count: positions.length,
+      items: await loadShardedFeedItems(manifest, positions.slice(0, limit)),
+    };
+  }
+
+  if (route === "/api/watchlist") {
+    const requestedTickers = (params.get("tickers") || "")
+      .split(",")
+      .map((token) => sanitizeTicker(token))
+      .filter(Boolean);
+    const symbols = [...new Set(requestedTickers.length ? requestedTickers : DEFAULT_WATCHLIST)].slice(0, 25);
+    const tickerIndex = await loadStaticShard(shards.tickerIndex);
+    const index = new Map(tickerIndex.map((row) => [row.ticker, row]));
+    const items = symbols.map((symbol) => index.get(symbol) || emptyTickerSnapshot(symbol));
+    return { generatedAt, cached: true, count: items.length, items };
+  }
+
+  if (route === "/api/health") {
+    return {
+      status: "ok",
+      version: "static-snapshot",
+      cached: true,
+      cacheAgeSeconds: 0,
+      items: itemCount,
+      generatedAt,
+    };
+  }
+
+  if (route === "/api/trending-stocks") {
+    const limit = toBoundedInteger(params.get("limit"), 15, 1, 50);
+    return (await loadStaticShard(shards.tickerIndex)).slice(0, limit);
+  }
+
+  if (route === "/api/sentiment") {
+    const summary = (await loadStaticShard(shards.dashboard)).sentiment || { positive: 0, negative: 0, neutral: 0 };
+    return [
+      { sentiment: "POSITIVE", count: summary.positive || 0 },
+      { sentiment: "NEGATIVE", count: summary.negative || 0 },
+      { sentiment: "NEUTRAL", count: summary.neutral || 0 },
+    ];
+  }
+
+  if (route === "/api/news" || route === "/api/reddit") {
+    const source = route.endsWith("news") ? "news" : "reddit";
+    const limit = toBoundedInteger(params.get("limit"), 20, 1, 100);
+    const positions = await filterShardPositions(manifest, { source });
+    const items = await loadShardedFeedItems(manifest, positions.slice(0, limit));
+    return items.map((item) => ({
+      id: item.id,
+      title: item.title,
+      url: item.url,
+      date: item.publishedAt,
+      text: item.text,
+    }));
+  }
+
+  if (route.startsWith("/api/ticker/")) {
+    const symbol = sanitizeTicker(route.split("/").at(-1) || "");
+    const shard = shards.tickers?.[symbol];
+    if (!shard) {
+      return {
+        generatedAt,
+        cached: true,
+        ticker: symbol,
+        mentions: 0,
+        snapshot: emptyTickerSnapshot(symbol),
+        items: [],
+        themes: [],
+      };
+    }
+    const body = await loadStaticShard(shard);
+    return {
+      generatedAt,
+      cached: true,
+      ...body,
+      snapshot: body.snapshot || emptyTickerSnapshot(symbol),
+      items: expandFeed(body.items),
+    };
+  }
+
+  if (route === "/api/insights") {
+    const [dashboard, tickerIndex] = await Promise.all([
+      loadStaticShard(shards.dashboard),
+      loadStaticShard(shards.tickerIndex),
+    ]);
+    return {
+      generatedAt,
+      cached: true,
+      itemCount,
+      sentimentIndex: dashboard.overview?.sentimentIndex || 0,
+      themes: dashboard.themes || [],
+      trendingTickers: tickerIndex.slice(0, 10),
+      narratives: dashboard.narratives || [],
+    };
+  }
+
+  throw new Error(`No static route for ${route}`);
+}
+
+async function loadStaticManifest() {
+  if (state.staticManifest !== undefined) {
+    return state.staticManifest;
+  }
+
+  // Older deployments only ship snapshot.json; a missing manifest falls back to the monolithic file.
+  try {
+    const response = await fetch(getStaticDataUrl("manifest.json"), { cache: "no-store" });
+    state.staticManifest = response.ok ? await response.json() : null;
+  } catch {
+    state.staticManifest = null;
+  }
+  return state.staticManifest;
+}
+
+function loadStaticShard(path) {
+  if (!path) {
+    return Promise.reject(new Error("Shard is missing from the manifest"));
+  }
+  if (!state.staticShards.has(path)) {
+    // Shard names are content-hashed, so the browser cache can serve them without revalidation.
+    const pending = fetch(getStaticDataUrl(path)).then((response) => {
+      if (!response.ok) {
+        throw new Error(`Shard not found (${response.status})`);
+      }
+      return response.json();
+    });
+    pending.catch(() => state.staticShards.delete(path));
+    state.staticShards.set(path, pending);
+  }
+  return state.staticShards.get(path);
+}
+
+async function filterShardPositions(manifest, filters) {
+  const source = String(filters.source || "").toLowerCase();
+  const sentiment = String(filters.sentiment || "").toLowerCase();
+  const ticker = sanitizeTicker(filters.ticker || "");
+  if (!source && !sentiment && !ticker) {
+    return Array.from({ length: Number(manifest.itemCount || 0) }, (_, position) => position);
+  }
+
+  const index = await loadStaticShard(manifest.shards?.filterIndex);
+  const lists = [
+    source && (index.source?.[source] ?? []),
+    sentiment && (index.sentiment?.[sentiment] ?? []),
+    ticker && (index.ticker?.[ticker] ?? []),
+  ].filter(Array.isArray);
+  lists.sort((a, b) => a.length - b.length);
+  const [smallest, ...rest] = lists;
+  const others = rest.map((list) => new Set(list));
+  return smallest.filter((position) => others.every((set) => set.has(position)));
+}
+
+async function loadShardedFeedItems(manifest, positions) {
+  const pageSize = Number(manifest.feedPageSize || 40);
+  const pages = manifest.shards?.feed ?? [];
+  const needed = [...new Set(positions.map((position) => Math.floor(position / pageSize)))];
+  const loaded = await Promise.all(needed.map((page) => loadStaticShard(pages[page])));
+  const byPage = new Map(needed.map((page, index) => [page, expandFeed(loaded[index])]));
+  return positions
+    .map((position) => byPage.get(Math.floor(position / pageSize))?.[position % pageSize])
+    .filter(Boolean);
+}
+
 async function loadStaticSnapshot() {
   if (state.staticSnapshot) {
     return state.staticSnapshot;
@@ -1919,7 +2325,7 @@ async function loadStaticSnapshot() {
 
   const snapshot = await response.json();
   const dashboard = snapshot.dashboard || {};
-  const feed = Array.isArray(snapshot.feed) ? snapshot.feed : [];
+  let feed = null;
 
   state.staticSnapshot = {
     ...snapshot,
@@ -1928,13 +2334,58 @@ async function loadStaticSnapshot() {
       ...dashboard,
       generatedAt: dashboard.generatedAt || snapshot.generatedAt || new Date().toISOString(),
     },
-    feed: [...feed].sort((a, b) => new Date(b.publishedAt) - new Date(a.publishedAt)),
+    // Expanded on first use, so a dashboard-only load never materializes the feed rows.
+    get feed() {
+      feed ??= [...expandFeed(snapshot.feed)].sort((a, b) => new Date(b.publishedAt) - new Date(a.publishedAt));
+      return feed;
+    },
   };
 
   return state.staticSnapshot;
 }
 
+const expandedFeeds = new WeakMap();
+
+function expandFeed(feed) {
+  if (Array.isArray(feed)) {
+    return feed;
+  }
+  if (!feed?.columns) {
+    return [];
+  }
+  if (!expandedFeeds.has(feed)) {
+    expandedFeeds.set(feed, decodeColumnarFeed(feed));
+  }
+  return expandedFeeds.get(feed);
+}
+
+function decodeColumnarFeed(feed) {
+  // Inverse of encode_feed in scripts/generate_static_snapshot.py (--compact).
+  const { columns, dictionaries = {} } = feed;
+  const lookup = (kind) => (code) => dictionaries[kind]?.[code];
+  return Array.from({ length: Number(feed.count || 0) }, (_, index) => ({
+    id: columns.id[index],
+    source: lookup("source")(columns.source[index]),
+    title: columns.title[index],
+    url: columns.url[index],
+    publishedAt: new Date(columns.publishedAt[index] * 1000).toISOString(),
+    text: columns.text[index],
+    summary: columns.summary[index] ?? columns.text[index],
+    sentiment: {
+      label: lookup("label")(columns.label[index]),
+      score: columns.score[index],
+      confidence: columns.confidence[index],
+    },
+    tickers: columns.tickers[index].map(lookup("tickers")),
+    themes: columns.themes[index].map(lookup("themes")),
+  }));
+}
+
 function getStaticSnapshotUrl() {
+  return getStaticDataUrl("snapshot.json");
+}
+
+function getStaticDataUrl(name) {
   let basePath = window.location.pathname || "/";
   if (!basePath.endsWith("/")) {
     if (basePath.includes(".")) {
@@ -1943,7 +2394,7 @@ function getStaticSnapshotUrl() {
       basePath = `${basePath}/`;
     }
   }
-  return `${window.location.origin}${basePath}data/snapshot.json`;
+  return `${window.location.origin}${basePath}data/${name}`;
 }
 
 function filterSnapshotFeed(items, filters) {